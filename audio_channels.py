@@ -0,0 +1,119 @@
+# audio_channels.py
+"""
+Mixer channel allocation with cue priorities, voice limits and reserved channels.
+
+Plain Sound.play() takes whatever mixer channel is free and silently does nothing when
+none is. A burst of coin sounds (one per correct answer, 200 ms apart), countdown ticks
+and wrong-answer buzzes could use up every channel just as the crying or celebration
+cue started, and that important cue was lost.
+
+ChannelManager picks the channel itself:
+
+- Each cue has a CuePolicy: a priority, the most voices (simultaneous plays) it may
+  have, and whether it may use the reserved channels.
+- A cue at its voice limit restarts its oldest voice, so a new countdown tick replaces
+  the previous one and a coin burst never holds more than three channels.
+- Otherwise it takes a free channel. Reserved channels are only used by cues allowed
+  on them, so the results cues always find a channel.
+- If every allowed channel is busy, the oldest voice of the lowest-priority cue is
+  stolen, but only from a cue of lower priority than the new one. If there is none,
+  the new play is dropped.
+
+`stolen` and `dropped` count both outcomes, overall and per cue.
+"""
+
+from collections import Counter, namedtuple
+
+DEFAULT_NUM_CHANNELS = 8
+DEFAULT_RESERVED_CHANNELS = 2
+
+CuePolicy = namedtuple("CuePolicy", "priority max_voices reserved")
+
+CUE_POLICIES = {
+    'celebration': CuePolicy(priority=3, max_voices=1, reserved=True),
+    'crying': CuePolicy(priority=3, max_voices=1, reserved=True),
+    'start': CuePolicy(priority=2, max_voices=1, reserved=False),
+    'alert': CuePolicy(priority=2, max_voices=1, reserved=False),
+    'wrong': CuePolicy(priority=1, max_voices=2, reserved=False),
+    'countdown': CuePolicy(priority=1, max_voices=1, reserved=False),
+    'coin': CuePolicy(priority=0, max_voices=3, reserved=False),
+}
+DEFAULT_POLICY = CuePolicy(priority=1, max_voices=2, reserved=False)
+
+
+class ChannelManager:
+    """Plays cues on a fixed set of channels; the first `reserved` are kept for reserved cues."""
+
+    def __init__(self, channels, reserved=DEFAULT_RESERVED_CHANNELS, policies=CUE_POLICIES):
+        self.channels = list(channels)
+        self.reserved = reserved
+        self.policies = policies
+        self._voices = [None] * len(self.channels)  # channel index -> (cue, priority, serial)
+        self._serial = 0
+        self.plays = 0
+        self.stolen = 0
+        self.dropped = 0
+        self.stolen_by_cue = Counter()   # cue whose voice was cut
+        self.dropped_by_cue = Counter()  # cue that could not play
+
+    @classmethod
+    def for_mixer(cls, num_channels=DEFAULT_NUM_CHANNELS, reserved=DEFAULT_RESERVED_CHANNELS, policies=CUE_POLICIES):
+        """Manager over pygame's mixer channels (the mixer must be initialized)."""
+        import pygame
+        pygame.mixer.set_num_channels(num_channels)
+        # Also keep Sound.play() calls made elsewhere off the reserved channels
+        pygame.mixer.set_reserved(reserved)
+        return cls([pygame.mixer.Channel(i) for i in range(num_channels)], reserved, policies)
+
+    def policy(self, cue):
+        return self.policies.get(cue, DEFAULT_POLICY)
+
+    def voices(self, cue=None):
+        """Channel indexes currently playing (`cue` only, if given)."""
+        active = []
+        for i, voice in enumerate(self._voices):
+            if voice is None:
+                continue
+            if not self.channels[i].get_busy():
+                self._voices[i] = None  # finished
+            elif cue is None or voice[0] == cue:
+                active.append(i)
+        return active
+
+    def play(self, cue, sound):
+        """Play `sound` as `cue`; returns the channel index used, or None if dropped."""
+        policy = self.policy(cue)
+        allowed = range(len(self.channels)) if policy.reserved else range(self.reserved, len(self.channels))
+        own = self.voices(cue)
+        if len(own) >= policy.max_voices:
+            # At its voice limit: restart its oldest voice
+            index = min(own, key=lambda i: self._voices[i][2])
+            self.stolen += 1
+            self.stolen_by_cue[cue] += 1
+        else:
+            free = [i for i in allowed if self._voices[i] is None]
+            if free:
+                index = free[0]
+            else:
+                victims = [i for i in allowed if self._voices[i][1] < policy.priority]
+                if not victims:
+                    self.dropped += 1
+                    self.dropped_by_cue[cue] += 1
+                    return None
+                index = min(victims, key=lambda i: (self._voices[i][1], self._voices[i][2]))
+                self.stolen += 1
+                self.stolen_by_cue[self._voices[index][0]] += 1
+        self._serial += 1
+        self._voices[index] = (cue, policy.priority, self._serial)
+        self.channels[index].play(sound)
+        self.plays += 1
+        return index
+
+    def stats(self):
+        return {
+            "plays": self.plays,
+            "stolen": self.stolen,
+            "dropped": self.dropped,
+            "stolen_by_cue": dict(self.stolen_by_cue),
+            "dropped_by_cue": dict(self.dropped_by_cue),
+        }
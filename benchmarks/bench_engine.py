@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+bench_engine.py
+
+Session throughput benchmark for the headless QuizEngine.
+
+Runs simulated sessions (correct answers, wrong retries and timeouts) without any
+window and reports sessions per second plus per-answer latency.
+
+Usage examples:
+    python benchmarks/bench_engine.py
+    python benchmarks/bench_engine.py --sessions 200000 --questions 15 --seed 7
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from quiz_engine import QuizEngine
+
+
+def make_questions(count):
+    """Synthetic questions with the same shape as the built-in bank."""
+    return [
+        {"question": f"Question {i}?", "options": ["A", "B", "C", "D"], "correct": i % 4}
+        for i in range(count)
+    ]
+
+
+def run_session(engine, questions, rng, p_correct, p_timeout, max_retries):
+    """Play one session; returns the number of answer() calls made."""
+    engine.start("Bench", "Easy", questions)
+    answers = 0
+    while not engine.finished:
+        correct = engine.current["correct"]
+        roll = rng.random()
+        if roll < p_timeout:
+            # Wrong retries until the clock runs out
+            while engine.tick() > 0:
+                engine.answer((correct + 1) % 4)
+                answers += 1
+            engine.timeout()
+        else:
+            retries = 0 if roll < p_timeout + p_correct else rng.randint(1, max_retries)
+            for _ in range(retries):
+                engine.answer((correct + 1) % 4)
+                engine.tick()
+            engine.answer(correct)
+            answers += retries + 1
+        engine.advance()
+    return answers
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="QuizEngine session throughput benchmark")
+    parser.add_argument("--sessions", type=int, default=50000, help="Number of sessions to simulate")
+    parser.add_argument("--questions", type=int, default=6, help="Questions per session")
+    parser.add_argument("--p-correct", type=float, default=0.6, help="Probability of a first-try correct answer")
+    parser.add_argument("--p-timeout", type=float, default=0.15, help="Probability of a question timing out")
+    parser.add_argument("--max-retries", type=int, default=3, help="Max wrong retries before a correct answer")
+    parser.add_argument("--seed", type=int, default=1234, help="Random seed (for reproducible runs)")
+    args = parser.parse_args(argv)
+
+    rng = random.Random(args.seed)
+    questions = make_questions(args.questions)
+    engine = QuizEngine()
+
+    answers = 0
+    timeouts = 0
+    start = time.perf_counter()
+    for _ in range(args.sessions):
+        answers += run_session(engine, questions, rng, args.p_correct, args.p_timeout, args.max_retries)
+        timeouts += engine.wrong_answers
+    elapsed = time.perf_counter() - start
+
+    print(f"sessions:          {args.sessions}")
+    print(f"questions/session: {args.questions}")
+    print(f"answers:           {answers}")
+    print(f"timeouts:          {timeouts}")
+    print(f"elapsed:           {elapsed:.3f} s")
+    print(f"sessions/sec:      {args.sessions / elapsed:,.0f}")
+    print(f"answers/sec:       {answers / elapsed:,.0f}")
+    print(f"per-answer:        {elapsed / max(answers, 1) * 1e9:,.0f} ns")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+bench_frame_convert.py
+
+Per-frame cost of turning a decoded celebration-clip frame into canvas pixels.
+
+"legacy" is the old stream_frame path: a new RGB array from cvtColor, a new Pillow
+image, a LANCZOS thumbnail and (with a display) a new PhotoImage for every frame.
+"reuse" is the current path: FrameConverter scales and converts into preallocated
+buffers, and FrameBlitter pastes into a single PhotoImage (with a display).
+
+Frames are decoded up front, so only conversion is timed. Allocations are measured
+with tracemalloc (numpy/cv2 arrays and Python objects; Pillow's own pixel memory is
+not visible to it) as the peak bytes allocated while converting one frame.
+
+Usage examples:
+    python benchmarks/bench_frame_convert.py
+    python benchmarks/bench_frame_convert.py --frames 300 --box 290 390
+"""
+
+import argparse
+import gc
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import cv2
+from PIL import Image, ImageTk
+
+from celebration_video import DEFAULT_CLIP, FrameBlitter, FrameConverter, fit_size
+
+
+def load_frames(path, count):
+    capture = cv2.VideoCapture(str(path))
+    frames = []
+    while len(frames) < count:
+        ok, frame = capture.read()
+        if not ok:
+            if not frames:
+                capture.release()
+                raise RuntimeError(f"Cannot read any frames from video file {path}")
+            capture.set(cv2.CAP_PROP_POS_FRAMES, 0)  # loop the clip
+            continue
+        frames.append(frame)
+    capture.release()
+    return frames
+
+
+def make_legacy(box, canvas):
+    holder = {}
+
+    def convert(frame):
+        img = Image.fromarray(cv2.cvtColor(frame, cv2.COLOR_BGR2RGB))
+        img.thumbnail(box, Image.LANCZOS)
+        if canvas is not None:
+            holder["photo"] = ImageTk.PhotoImage(img)
+            canvas.itemconfigure(holder["item"], image=holder["photo"])
+        return img
+    if canvas is not None:
+        holder["item"] = canvas.create_image(0, 0, anchor="nw")
+    return convert
+
+
+def make_reuse(src_size, size, canvas):
+    converter = FrameConverter(src_size, size, buffers=2)
+    if canvas is None:
+        return lambda frame: Image.frombuffer("RGB", size, converter.convert(frame), "raw", "RGB", 0, 1)
+    blitter = FrameBlitter(canvas, canvas.create_image(0, 0, anchor="nw"), size)
+    return lambda frame: blitter.blit(converter.convert(frame))
+
+
+def measure(convert, frames):
+    for frame in frames[:5]:  # warm-up (first-use allocations)
+        convert(frame)
+    gc.collect()
+    collections = sum(s["collections"] for s in gc.get_stats())
+    start = time.perf_counter()
+    for frame in frames:
+        convert(frame)
+    elapsed = time.perf_counter() - start
+
+    tracemalloc.start()
+    peaks = []
+    for frame in frames:
+        base = tracemalloc.get_traced_memory()[0]
+        tracemalloc.reset_peak()
+        convert(frame)
+        peaks.append(tracemalloc.get_traced_memory()[1] - base)
+    tracemalloc.stop()
+    gcs = sum(s["collections"] for s in gc.get_stats()) - collections
+    return elapsed / len(frames) * 1000, sum(peaks) / len(peaks) / 1024, gcs
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Celebration frame conversion micro-benchmark")
+    parser.add_argument("--source", default=str(DEFAULT_CLIP), help="Video file")
+    parser.add_argument("--frames", type=int, default=120, help="Frames to convert per mode")
+    parser.add_argument("--box", type=int, nargs=2, default=[290, 390], metavar=("W", "H"))
+    args = parser.parse_args(argv)
+
+    frames = load_frames(args.source, args.frames)
+    src_size = (frames[0].shape[1], frames[0].shape[0])
+    size = fit_size(*src_size, *args.box)
+
+    canvas = None
+    try:
+        import tkinter as tk
+        root = tk.Tk()
+        canvas = tk.Canvas(root, width=300, height=400)
+        canvas.pack()
+    except Exception as e:
+        print(f"(no display: {e}; PhotoImage updates are not included)")
+
+    print(f"{src_size[0]}x{src_size[1]} -> {size[0]}x{size[1]}, {len(frames)} frames")
+    print(f"{'Mode':<8}{'ms/frame':>10}{'KB alloc/frame':>16}{'GC runs':>9}")
+    for name, convert in (("legacy", make_legacy(tuple(args.box), canvas)),
+                          ("reuse", make_reuse(src_size, size, canvas))):
+        ms, kb, gcs = measure(convert, frames)
+        print(f"{name:<8}{ms:>10.3f}{kb:>16.1f}{gcs:>9}")
+
+
+if __name__ == "__main__":
+    main()
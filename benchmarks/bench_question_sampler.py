@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+bench_question_sampler.py
+
+Draw and update cost of the weighted question sampler versus copy + shuffle.
+
+Usage examples:
+    python benchmarks/bench_question_sampler.py
+    python benchmarks/bench_question_sampler.py --sizes 1000 100000 1000000 --sample 15
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from question_sampler import WeightedSampler
+
+
+def per_call_us(fn, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - start) / repeat * 1e6
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Weighted sampler benchmark")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 100000, 1000000], help="Pool sizes")
+    parser.add_argument("--sample", type=int, default=15, help="Questions per session")
+    parser.add_argument("--repeat", type=int, default=200, help="Repetitions per measurement")
+    args = parser.parse_args(argv)
+
+    rng = random.Random(1234)
+    print(f"{'pool':>9} {'shuffle us':>11} {'sample us':>10} {'update us':>10}")
+    for size in args.sizes:
+        pool = list(range(size))
+        sampler = WeightedSampler([rng.uniform(0.5, 3.0) for _ in range(size)])
+        sampler.sample(args.sample, rng)  # build the top-level table once
+
+        def shuffle():
+            questions = pool.copy()
+            rng.shuffle(questions)
+
+        def update():
+            sampler.update(rng.randrange(size), rng.uniform(0.5, 3.0))
+            sampler.draw(rng)
+
+        shuffle_us = per_call_us(shuffle, max(1, args.repeat // 20))
+        sample_us = per_call_us(lambda: sampler.sample(args.sample, rng), args.repeat)
+        update_us = per_call_us(update, args.repeat)
+        print(f"{size:>9} {shuffle_us:>11.1f} {sample_us:>10.1f} {update_us:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
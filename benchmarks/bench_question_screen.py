@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+bench_question_screen.py
+
+Time-to-next-question benchmark for the Tk question screen.
+
+Shows a session of questions in a real window and times each show_question call
+until Tk has processed the resulting layout and redraw. "rebuild" forces the old
+path (clear_screen and recreate every widget per question); "reuse" is the current
+one (widgets built once per session, then only updated). Needs a display.
+
+Usage examples:
+    python benchmarks/bench_question_screen.py
+    python benchmarks/bench_question_screen.py --questions 15 --sessions 10
+"""
+
+import argparse
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+
+def run_session(game, questions, rebuild):
+    """Show every question of one session; returns per-question times in ms."""
+    game.engine.start("Python", "Easy", questions)
+    game.question_screen_frame = None
+    times = []
+    while not game.engine.finished:
+        if rebuild:
+            game.question_screen_frame = None
+        start = time.perf_counter()
+        game.show_question()
+        game.root.update()
+        times.append((time.perf_counter() - start) * 1000)
+        game.timer_running = False
+        if game.timer_after_id:
+            game.scheduler.cancel(game.timer_after_id)
+            game.timer_after_id = None
+        game.engine.answer(game.engine.current["correct"])
+        game.engine.advance()
+    return times
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Time-to-next-question benchmark (needs a display)")
+    parser.add_argument("--questions", type=int, default=15, help="Questions per session")
+    parser.add_argument("--sessions", type=int, default=5, help="Sessions per mode")
+    args = parser.parse_args(argv)
+
+    from hangman_game import HangmanMCQGame
+    try:
+        game = HangmanMCQGame()
+    except Exception as e:
+        print(f"Cannot open a Tk window ({e}); run this benchmark on a machine with a display.")
+        return
+    game.play_sound = lambda name: None
+    pool = game.question_bank["Python"]["Easy"]
+    questions = [pool[i % len(pool)] for i in range(args.questions)]
+
+    print(f"{'Mode':<10}{'first ms':>10}{'mean ms':>10}{'p95 ms':>10}{'max ms':>10}")
+    for mode in ("rebuild", "reuse"):
+        firsts, rest = [], []
+        for _ in range(args.sessions):
+            times = run_session(game, questions, rebuild=(mode == "rebuild"))
+            firsts.append(times[0])
+            rest.extend(times[1:])
+        rest.sort()
+        p95 = rest[int(0.95 * (len(rest) - 1))] if rest else 0.0
+        mean = statistics.mean(rest) if rest else 0.0
+        print(f"{mode:<10}{statistics.mean(firsts):>10.2f}{mean:>10.2f}{p95:>10.2f}{max(rest, default=0.0):>10.2f}")
+    game.root.destroy()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+bench_question_search.py
+
+Build and query latency benchmark for the inverted question index.
+
+Usage examples:
+    python benchmarks/bench_question_search.py
+    python benchmarks/bench_question_search.py --questions 100000 --vocabulary 20000
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from question_search import QuestionSearchIndex
+
+LEVELS = ["Easy", "Intermediate", "Extreme"]
+
+
+def synthetic_bank(count, vocabulary, seed):
+    rng = random.Random(seed)
+    words = [f"w{i}" for i in range(vocabulary)] + ["join", "lambda", "select", "index"]
+    bank = {}
+    for i in range(count):
+        subject = f"Subject {i % 20}"
+        level = LEVELS[i % 3]
+        bank.setdefault(subject, {}).setdefault(level, []).append({
+            "question": " ".join(rng.choice(words) for _ in range(10)) + "?",
+            "options": [rng.choice(words) for _ in range(4)],
+            "correct": 0,
+        })
+    return bank
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Question search index benchmark")
+    parser.add_argument("--questions", type=int, default=100000, help="Questions in the synthetic bank")
+    parser.add_argument("--vocabulary", type=int, default=20000, help="Distinct filler words")
+    parser.add_argument("--repeat", type=int, default=1000, help="Repetitions per query")
+    parser.add_argument("--seed", type=int, default=1234, help="Random seed")
+    args = parser.parse_args(argv)
+
+    bank = synthetic_bank(args.questions, args.vocabulary, args.seed)
+    start = time.perf_counter()
+    index = QuestionSearchIndex.from_bank(bank)
+    print(f"build: {time.perf_counter() - start:.2f} s for {len(index)} questions, "
+          f"{len(index.vocabulary)} tokens")
+
+    queries = [
+        ("join", {}),
+        ("lamb*", {}),
+        ("join select", {}),
+        ("join", {"subject": "Subject 3"}),
+        ("sel*", {"level": "Easy"}),
+        ("index", {"subject": "Subject 7", "level": "Extreme"}),
+    ]
+    print(f"{'query':<16} {'filters':<40} {'hits':>6} {'ms':>8}")
+    for query, filters in queries:
+        start = time.perf_counter()
+        for _ in range(args.repeat):
+            results = index.search(query, limit=50, **filters)
+        elapsed_ms = (time.perf_counter() - start) / args.repeat * 1000
+        hits = len(index.search_ids(query, **filters))
+        print(f"{query:<16} {str(filters):<40} {hits:>6} {elapsed_ms:>8.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+bench_question_store.py
+
+Open-time, memory and sampling benchmark for the on-disk question bank backends.
+
+Generates synthetic banks of increasing size, compiles them and measures how long
+MmapQuestionBank takes to open, how much Python memory it allocates, and the cost
+of decoding a single question on demand. The same bank is loaded into a
+SQLiteQuestionStore to time drawing a session-sized random sample.
+
+Usage examples:
+    python benchmarks/bench_question_store.py
+    python benchmarks/bench_question_store.py --sizes 1000 100000 1000000
+"""
+
+import argparse
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from question_store import MmapQuestionBank, SQLiteQuestionStore, compile_bank
+
+SUBJECTS = ["Python", "SQL", "Power BI", "Tableau", "Statistics"]
+LEVELS = ["Easy", "Intermediate", "Extreme"]
+
+
+def synthetic_level(count, seed):
+    rng = random.Random(seed)
+    for i in range(count):
+        yield {
+            "question": f"Synthetic question {seed}-{i}: which option is right?",
+            "options": [f"Option {k} for {i}" for k in range(4)],
+            "correct": rng.randrange(4),
+        }
+
+
+class SyntheticBank(dict):
+    """{subject: {level: generator}} so compiling never holds the whole bank in memory."""
+
+    def __init__(self, total):
+        per_level = max(1, total // (len(SUBJECTS) * len(LEVELS)))
+        super().__init__({
+            s: {l: synthetic_level(per_level, hash((s, l)) & 0xFFFF) for l in LEVELS} for s in SUBJECTS
+        })
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compiled question bank benchmark")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 100000], help="Bank sizes to test")
+    parser.add_argument("--lookups", type=int, default=10000, help="Random single-question decodes to time")
+    parser.add_argument("--sample-size", type=int, default=15, help="Questions per SQLite sample")
+    parser.add_argument("--samples", type=int, default=1000, help="SQLite samples to time")
+    args = parser.parse_args(argv)
+
+    print(f"{'questions':>10} {'file MB':>8} {'open ms':>8} {'open KB':>8} {'decode us':>10} {'sample us':>10}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for size in args.sizes:
+            path = Path(tmp) / f"bank_{size}.hqb"
+            compile_bank(SyntheticBank(size), path)
+
+            tracemalloc.start()
+            start = time.perf_counter()
+            bank = MmapQuestionBank(path)
+            open_ms = (time.perf_counter() - start) * 1000
+            open_kb = tracemalloc.get_traced_memory()[1] / 1024
+            tracemalloc.stop()
+
+            pool = bank["Python"]["Easy"]
+            rng = random.Random(0)
+            picks = [rng.randrange(len(pool)) for _ in range(args.lookups)]
+            start = time.perf_counter()
+            for i in picks:
+                pool[i]
+            decode_us = (time.perf_counter() - start) / args.lookups * 1e6
+
+            store = SQLiteQuestionStore(Path(tmp) / f"bank_{size}.sqlite")
+            store.add_bank(bank)
+            bank.close()
+            start = time.perf_counter()
+            for _ in range(args.samples):
+                store.sample("Python", "Easy", args.sample_size, rng)
+            sample_us = (time.perf_counter() - start) / args.samples * 1e6
+            store.close()
+
+            file_mb = path.stat().st_size / (1024 * 1024)
+            print(f"{size:>10} {file_mb:>8.1f} {open_ms:>8.2f} {open_kb:>8.1f} {decode_us:>10.2f} {sample_us:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+bench_startup.py
+
+Time to first frame of HangmanMCQGame(): from a fresh interpreter to the start screen
+being drawn (root.update() after the constructor returns).
+
+Every run is a new Python process, so imports are always cold for the interpreter.
+The OS file cache stays warm, because each mode gets a discarded warm-up run first.
+"eager" first imports cv2, numpy, pygame and PIL.ImageTk, as the game used to at module
+import. "lazy" imports only what the game itself imports. Each mode also lists the
+heavy modules that were loaded by the time the first frame was drawn.
+
+Audio uses SDL's dummy driver by default, so runs on different machines compare.
+Without a display, tkinter.Tk is mocked and the result is construction time only.
+
+Usage examples:
+    python benchmarks/bench_startup.py
+    python benchmarks/bench_startup.py --runs 15 --real-audio
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+HEAVY = ("pygame", "cv2", "numpy", "PIL")
+
+CHILD = r"""
+import json, sys, time
+started = time.perf_counter()
+sys.path.insert(0, {root!r})
+if {eager!r}:
+    import cv2, numpy, pygame, PIL.ImageTk
+import tkinter
+try:
+    tkinter.Tk().destroy()
+    display = True
+except Exception:
+    display = False
+imported = time.perf_counter()
+if display:
+    import hangman_game
+    imported = time.perf_counter()
+    game = hangman_game.HangmanMCQGame()
+    game.root.update()
+else:
+    import unittest.mock
+    with unittest.mock.patch("tkinter.Tk"):
+        import hangman_game
+        imported = time.perf_counter()
+        game = hangman_game.HangmanMCQGame()
+first_frame = time.perf_counter()
+print(json.dumps({{
+    "import_ms": (imported - started) * 1000,
+    "first_frame_ms": (first_frame - started) * 1000,
+    "display": display,
+    "modules": [m for m in {heavy!r} if m in sys.modules],
+}}))
+"""
+
+
+def run_once(eager, env):
+    code = CHILD.format(root=str(ROOT), eager=eager, heavy=HEAVY)
+    out = subprocess.run([sys.executable, "-c", code], cwd=ROOT, env=env, capture_output=True, text=True, check=True)
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Time to first frame of HangmanMCQGame()")
+    parser.add_argument("--runs", type=int, default=7, help="Fresh processes per mode")
+    parser.add_argument("--real-audio", action="store_true", help="Use the system audio driver")
+    args = parser.parse_args(argv)
+
+    env = dict(os.environ)
+    env["PYGAME_HIDE_SUPPORT_PROMPT"] = "1"
+    if not args.real_audio:
+        env["SDL_AUDIODRIVER"] = "dummy"
+
+    print(f"{'Mode':<7}{'import ms':>11}{'first frame ms':>16}  loaded by first frame")
+    for name, eager in (("eager", True), ("lazy", False)):
+        run_once(eager, env)  # warm the OS file cache
+        results = [run_once(eager, env) for _ in range(args.runs)]
+        imports = statistics.median(r["import_ms"] for r in results)
+        frames = statistics.median(r["first_frame_ms"] for r in results)
+        print(f"{name:<7}{imports:>11.1f}{frames:>16.1f}  {', '.join(results[-1]['modules']) or '-'}")
+    if not results[-1]["display"]:
+        print("(no display: tkinter.Tk mocked, window drawing not included)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+bench_tones.py
+
+Cost of producing the fallback beeps: the old per-cue sine loop, one batched
+synthesis pass, and reading them back from the WAV tone cache.
+
+"legacy" is the old make_beep arithmetic (one np.sin per cue, no envelope), without
+the pygame step. "batch" is synthesize_tones over all cues at once, with envelopes.
+"cached" reads the WAV files a previous run wrote, which is all a later launch does.
+
+Usage examples:
+    python benchmarks/bench_tones.py
+    python benchmarks/bench_tones.py --cues 7 50 200 --repeat 20
+"""
+
+import argparse
+import sys
+import tempfile
+import time
+import wave
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import numpy as np
+
+from sound_bank import FALLBACK_TONES, ToneCache, synthesize_tones
+
+
+def make_tones(count):
+    """`count` distinct cues based on the game's own fallback tones."""
+    base = list(FALLBACK_TONES.values())
+    return {f"cue{i}": (base[i % len(base)][0] + 10 * (i // len(base)), base[i % len(base)][1]) for i in range(count)}
+
+
+def legacy(tones, sample_rate):
+    out = {}
+    for name, (freq, duration_ms) in tones.items():
+        frames = int(duration_ms * sample_rate / 1000)
+        out[name] = (32767 * 0.5 * np.sin(2 * np.pi * freq * np.arange(frames) / sample_rate)).astype('int16')
+    return out
+
+
+def read_cached(paths):
+    for path in paths.values():
+        with wave.open(str(path)) as f:
+            f.readframes(f.getnframes())
+
+
+def per_call_ms(fn, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - start) / repeat * 1000
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Fallback beep synthesis micro-benchmark")
+    parser.add_argument("--cues", type=int, nargs="+", default=[7, 50, 200], help="Numbers of cues")
+    parser.add_argument("--sample-rate", type=int, default=44100)
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args(argv)
+
+    print(f"{'Cues':>6}{'legacy ms':>12}{'batch ms':>12}{'cached ms':>12}")
+    for count in args.cues:
+        tones = make_tones(count)
+        with tempfile.TemporaryDirectory() as tmp:
+            paths = ToneCache(tmp, args.sample_rate).ensure(tones)
+            cached = per_call_ms(lambda: read_cached(paths), args.repeat)
+        old = per_call_ms(lambda: legacy(tones, args.sample_rate), args.repeat)
+        batch = per_call_ms(lambda: synthesize_tones(tones, args.sample_rate), args.repeat)
+        print(f"{count:>6}{old:>12.2f}{batch:>12.2f}{cached:>12.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,634 @@
+# celebration_video.py
+"""
+Celebration clip playback helpers that keep video work off the Tk thread.
+
+VideoDecoder owns the cv2.VideoCapture. A worker thread reads frames, scales them
+to fit the target box, converts BGR -> RGB and pushes them into a bounded FrameRing.
+Reads, scaling and conversion all write into preallocated buffers (FrameConverter),
+and the Tk side repaints one PhotoImage in place (FrameBlitter), so steady playback
+allocates no per-frame pixel buffers. At the end of the clip the worker seeks back to
+the first frame to loop. The Tk side only takes ready frames (take(), through
+PlaybackSync) and blits them, so a slow decode makes playback skip a beat instead of
+freezing buttons. The worker never touches Tk. stop() wakes it and waits for it to
+finish; the worker releases the capture on its way out.
+
+PlaybackSync paces playback by the wall clock rather than by counting callbacks:
+frame i is shown at start + i / fps. When the Tk thread falls behind, frames that
+are already overdue are dropped (and the decoder grabs past them without
+converting, except while it is still writing the cache), so the clip keeps real-time
+speed; counters record dropped and late frames.
+
+Decoded clips are also cached on disk, already scaled to the target size. A cache
+file is keyed by a hash of the source file and the frame size:
+
+    cache/clips/<blake2b of source>-<width>x<height>.clip
+    header   magic b"HCL1", u16 width, u16 height, u32 frame count, f32 fps (64 bytes)
+    frames   frame count x height x width x 3 bytes of RGB, back to back
+
+CachedClipSource memory-maps such a file and hands out frames as numpy views, so
+a cached celebration starts at once and costs almost no CPU while it loops. The
+decoder writes the cache during its first full pass over the clip, and the file can
+also be built ahead of time.
+
+Finding the cache file needs the source's hash and frame size, which mean reading
+the whole clip and opening it with cv2. Both are recorded in cache/clips/index.json
+(and kept in memory) under the source's path, size and mtime, so once known a cache
+hit costs a stat and the file header: no cv2 and no hashing.
+
+Usage examples:
+    python celebration_video.py build
+    python celebration_video.py build --source assets/files/images/stickman-dance.mp4 --box 290 390
+    python celebration_video.py info
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import struct
+import threading
+import time
+from collections import deque
+from pathlib import Path
+
+# cv2 and numpy take ~75 ms to import and are only needed once a clip plays, so they
+# are imported on first use by load_video_modules() (OPENCV_AVAILABLE and
+# NUMPY_AVAILABLE are worked out then too, when first read). Playing a cached clip
+# only needs numpy (load_numpy()).
+cv2 = None
+np = None
+_numpy_loaded = False
+_modules_loaded = False
+
+
+def load_numpy():
+    """Import numpy if not done yet; True if it is available."""
+    global np, _numpy_loaded
+    if not _numpy_loaded:
+        try:
+            import numpy
+            np = numpy
+        except Exception:
+            pass
+        _numpy_loaded = True
+    return np is not None
+
+
+def load_video_modules():
+    """Import cv2 and numpy if not done yet; True if OpenCV is available."""
+    global cv2, _modules_loaded
+    if not _modules_loaded:
+        load_numpy()
+        try:
+            import cv2 as opencv
+            cv2 = opencv
+        except Exception:
+            pass
+        _modules_loaded = True
+    return cv2 is not None
+
+
+def __getattr__(name):
+    if name == "OPENCV_AVAILABLE":
+        return load_video_modules()
+    if name == "NUMPY_AVAILABLE":
+        return load_numpy()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+DEFAULT_CLIP = Path("assets/files/images/stickman-dance.mp4")
+DEFAULT_CLIP_CACHE_DIR = Path("cache/clips")
+CLIP_INDEX_NAME = "index.json"
+DEFAULT_BOX = (290, 390)  # results canvas (300x400) minus padding
+
+CLIP_MAGIC = b"HCL1"
+CLIP_HEADER = struct.Struct("<4sHHIf")
+CLIP_HEADER_SIZE = 64
+
+
+def fit_size(width, height, box_w, box_h):
+    """Size of a width x height frame scaled down (never up) to fit box_w x box_h."""
+    scale = min(box_w / width, box_h / height, 1.0)
+    return max(1, round(width * scale)), max(1, round(height * scale))
+
+
+class FrameConverter:
+    """BGR -> scaled RGB into reused buffers (no per-frame array allocations).
+
+    The target size is fixed up front. Each convert() resizes into one scratch
+    buffer and colour-converts into the next of `buffers` output arrays, cycled
+    round-robin. Callers that hold on to frames (e.g. in a FrameRing) need enough
+    buffers that a frame is not overwritten while still queued or on screen.
+    """
+
+    def __init__(self, src_size, dst_size, buffers=1):
+        load_video_modules()
+        self.dst_size = dst_size
+        width, height = dst_size
+        self._scaled = np.empty((height, width, 3), np.uint8) if tuple(src_size) != tuple(dst_size) else None
+        self._out = [np.empty((height, width, 3), np.uint8) for _ in range(buffers)]
+        self._next = 0
+
+    def convert(self, bgr, out=None):
+        """Scaled RGB copy of `bgr`, in the next output buffer (or in `out`, if given)."""
+        if out is None:
+            out = self._out[self._next]
+            self._next = (self._next + 1) % len(self._out)
+        src = bgr
+        if self._scaled is not None:
+            cv2.resize(bgr, self.dst_size, dst=self._scaled, interpolation=cv2.INTER_AREA)
+            src = self._scaled
+        cv2.cvtColor(src, cv2.COLOR_BGR2RGB, dst=out)
+        return out
+
+
+class FrameBlitter:
+    """One PhotoImage on a canvas item, repainted in place from RGB frames (Tk thread only)."""
+
+    def __init__(self, canvas, item, size):
+        from PIL import Image, ImageTk
+        self._frombuffer = Image.frombuffer
+        self.size = tuple(size)
+        self.photo = ImageTk.PhotoImage("RGB", self.size, master=canvas)
+        canvas.itemconfigure(item, image=self.photo)
+
+    def blit(self, frame):
+        """Copy an RGB frame (height x width x 3, contiguous) into the PhotoImage."""
+        # frombuffer wraps the array's memory; paste copies it straight into Tk's photo
+        self.photo.paste(self._frombuffer("RGB", self.size, frame, "raw", "RGB", 0, 1))
+
+
+class FrameRing:
+    """Bounded, thread-safe frame queue: the producer blocks when full, the consumer never blocks."""
+
+    def __init__(self, capacity=8):
+        self.capacity = capacity
+        self._frames = deque()
+        self._cond = threading.Condition()
+
+    def __len__(self):
+        return len(self._frames)
+
+    def put(self, frame, stop_event):
+        """Add a frame, waiting for space; returns False if stop_event was set meanwhile."""
+        with self._cond:
+            while len(self._frames) >= self.capacity and not stop_event.is_set():
+                self._cond.wait(0.1)
+            if stop_event.is_set():
+                return False
+            self._frames.append(frame)
+            return True
+
+    def get_nowait(self):
+        """Oldest ready frame, or None if the producer has not caught up."""
+        with self._cond:
+            if not self._frames:
+                return None
+            frame = self._frames.popleft()
+            self._cond.notify()
+            return frame
+
+    def wake(self):
+        with self._cond:
+            self._cond.notify_all()
+
+
+class VideoDecoder:
+    """Decodes and scales a clip on a worker thread into a FrameRing of RGB frames.
+
+    Frames are numbered along the playback timeline (continuing across loops). When
+    playback falls behind, take() asks the worker to skip ahead: it then grabs frames
+    without converting them until it reaches the wanted index. While the first pass
+    is still being written to the clip cache, skipped frames are converted for the
+    cache (but not queued), so a slow start does not lose the cache.
+    """
+
+    def __init__(self, path, box, capacity=8, loop=True, cache_dir=None):
+        self.path = str(path)
+        self.cache_dir = cache_dir  # write the first full pass to the clip cache here
+        self.cache_path = None
+        self.box = box
+        self.loop = loop
+        self.ring = FrameRing(capacity)
+        self.fps = 24.0
+        self.size = None
+        self.error = None          # set by the worker when the clip cannot be read
+        self.frames_decoded = 0
+        self.frames_skipped = 0    # passed over and never queued (skip-ahead)
+        self._skip_to = 0
+        self._capture = None
+        self._converter = None
+        self._raw = None  # reused BGR read buffer
+        self._stop = threading.Event()
+        self._thread = None
+
+    def start(self):
+        """Open the clip (raises RuntimeError if it cannot be opened) and start decoding."""
+        if not load_video_modules():
+            raise RuntimeError("OpenCV is not available")
+        capture = cv2.VideoCapture(self.path)
+        if not capture or not capture.isOpened():
+            try:
+                capture.release()
+            except Exception:
+                pass
+            raise RuntimeError(f"Cannot open video file {self.path}")
+        self._capture = capture
+        fps = capture.get(cv2.CAP_PROP_FPS)
+        self.fps = fps if fps and fps > 0 else 24.0
+        width = int(capture.get(cv2.CAP_PROP_FRAME_WIDTH)) or self.box[0]
+        height = int(capture.get(cv2.CAP_PROP_FRAME_HEIGHT)) or self.box[1]
+        self.size = fit_size(width, height, *self.box)
+        # Queued frames + the one on screen + the one being written never share a buffer
+        self._converter = FrameConverter((width, height), self.size, buffers=self.ring.capacity + 2)
+        if self.cache_dir is not None and np is not None:
+            self.cache_path = cached_clip_path(self.path, self.box, self.cache_dir)
+        self._thread = threading.Thread(target=self._run, name="celebration-decoder", daemon=True)
+        self._thread.start()
+        return self
+
+    @property
+    def running(self):
+        return self._thread is not None and self._thread.is_alive()
+
+    def next_frame(self):
+        """Next ready RGB frame (numpy array) or None; safe to call from the Tk thread."""
+        item = self.ring.get_nowait()
+        return None if item is None else item[1]
+
+    def take(self, target):
+        """(frame, index) for playback position `target`, or (None, None); Tk thread only.
+
+        Queued frames before `target` are dropped. If none has reached it, the newest
+        one is returned (a late frame) and the worker is told to skip ahead past
+        `target`. If none is queued at all, the worker is told to skip only the frames
+        before `target`, which are overdue; at target 0 (playback not started) nothing is.
+        """
+        newest = None
+        while True:
+            item = self.ring.get_nowait()
+            if item is None:
+                break
+            if item[0] >= target:
+                return item[1], item[0]
+            newest = item
+        if newest is None:
+            self._skip_to = max(self._skip_to, target)
+            return None, None
+        self._skip_to = max(self._skip_to, target + 1)
+        return newest[1], newest[0]
+
+    def _rewind(self):
+        if not self.loop:
+            return False
+        self._capture.set(cv2.CAP_PROP_POS_FRAMES, 0)
+        return True
+
+    def _read(self):
+        """(BGR frame or None, whether the clip just wrapped around to its start)."""
+        ok, frame = self._capture.read(self._raw)
+        wrapped = False
+        if not ok and self._rewind():
+            # End of clip: seek back to the first frame and keep going
+            wrapped = True
+            ok, frame = self._capture.read(self._raw)
+        if ok:
+            self._raw = frame
+        return (frame if ok else None), wrapped
+
+    def _grab(self):
+        """Advance one frame without decoding it into an image; False at the end."""
+        return self._capture.grab() or (self._rewind() and self._capture.grab())
+
+    def _run(self):
+        writer = ClipCacheWriter(self.cache_path, self.size, self.fps) if self.cache_path else None
+        # Skipped frames still go into the cache during the first pass, via their own buffer
+        spare = np.empty((self.size[1], self.size[0], 3), np.uint8) if writer is not None else None
+        index = 0
+        try:
+            while not self._stop.is_set():
+                skipping = self._skip_to > index
+                if skipping and writer is None:
+                    if not self._grab():
+                        self.error = "cannot read frames"
+                        return
+                    index += 1
+                    self.frames_skipped += 1
+                    continue
+                frame, wrapped = self._read()
+                if wrapped and writer is not None:
+                    # The first full pass over the clip doubles as the cache build
+                    writer.commit()
+                    writer = None
+                if frame is None:
+                    self.error = "end of clip" if not self.loop else "cannot read frames"
+                    return
+                if skipping:
+                    if writer is not None:
+                        writer.add(self._converter.convert(frame, spare))
+                    index += 1
+                    self.frames_skipped += 1
+                    continue
+                rgb = self._converter.convert(frame)
+                self.frames_decoded += 1
+                if writer is not None:
+                    writer.add(rgb)
+                if not self.ring.put((index, rgb), self._stop):
+                    return
+                index += 1
+        except Exception as e:
+            self.error = str(e)
+        finally:
+            if writer is not None:
+                writer.abort()
+            # The worker owns the capture once started, so it also releases it
+            try:
+                self._capture.release()
+            except Exception:
+                pass
+            self._capture = None
+
+    def stop(self, timeout=1.0):
+        """Stop the worker and wait for it to release the capture (idempotent)."""
+        self._stop.set()
+        self.ring.wake()
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join(timeout)
+
+
+class PlaybackSync:
+    """Wall-clock playback: which frame is due now, and when the next one is.
+
+    The clip's timeline starts when its first frame is shown; frame i is due at
+    start + i / fps. Each poll() shows the frame due now, dropping any that were
+    missed, and returns the exact delay to the next frame's due time, so slow decoding
+    or late callbacks never make playback run slower than real time.
+    """
+
+    RETRY_FRAMES = 0.25  # how soon (in frame intervals) to look again when no frame is ready
+
+    def __init__(self, source, clock=time.monotonic):
+        self.source = source
+        self.fps = source.fps
+        self.clock = clock
+        self.start = None
+        self.next_index = 0
+        self.shown = 0
+        self.dropped = 0   # frames skipped to catch up with the clock
+        self.late = 0      # frames shown after the next one was already due
+
+    def __repr__(self):
+        return f"PlaybackSync(shown={self.shown}, dropped={self.dropped}, late={self.late})"
+
+    def poll(self):
+        """(frame to show or None, seconds until the next frame is due)."""
+        now = self.clock()
+        target = 0 if self.start is None else max(self.next_index, int((now - self.start) * self.fps))
+        frame, index = self.source.take(target)
+        if frame is None:
+            # Nothing decoded yet (the clock only starts with the first frame): look again soon
+            return None, self.RETRY_FRAMES / self.fps
+        if self.start is None:
+            self.start = now
+        self.shown += 1
+        if index < target:
+            self.late += 1
+        # Everything from next_index up to the new position, except this frame, is never shown
+        self.dropped += max(index, target) - self.next_index
+        self.next_index = max(index, target) + 1
+        return frame, max(0.0, self.start + self.next_index / self.fps - self.clock())
+
+
+# Disk cache -------------------------------------------------------------------
+def source_key(path):
+    """Hex digest identifying the contents of a source clip."""
+    digest = hashlib.blake2b(digest_size=16)
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def clip_cache_path(source, size, cache_dir=DEFAULT_CLIP_CACHE_DIR):
+    """Cache file for `source` decoded at `size` (width, height)."""
+    return Path(cache_dir) / f"{source_key(source)}-{size[0]}x{size[1]}.clip"
+
+
+def clip_frame_size(source, box):
+    """Size frames of `source` are scaled to for `box` (opens the clip to read its dimensions)."""
+    if not load_video_modules():
+        raise RuntimeError("OpenCV is not available")
+    capture = cv2.VideoCapture(str(source))
+    try:
+        if not capture.isOpened():
+            raise RuntimeError(f"Cannot open video file {source}")
+        return fit_size(int(capture.get(cv2.CAP_PROP_FRAME_WIDTH)),
+                        int(capture.get(cv2.CAP_PROP_FRAME_HEIGHT)), *box)
+    finally:
+        capture.release()
+
+
+_clip_indexes = {}  # index file -> {source path: {"size", "mtime_ns", "key", "frames"}}
+
+
+def _clip_index(cache_dir):
+    path = Path(cache_dir) / CLIP_INDEX_NAME
+    index = _clip_indexes.get(path)
+    if index is None:
+        try:
+            index = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            index = {}
+        _clip_indexes[path] = index
+    return path, index
+
+
+def cached_clip_path(source, box, cache_dir=DEFAULT_CLIP_CACHE_DIR):
+    """Cache file for `source` scaled into `box`, using the clip index when it is up to date.
+
+    Only a source not seen before (or changed since: different size or mtime) is hashed,
+    and only a new box opens the clip with cv2; the index is then rewritten.
+    """
+    stat = os.stat(source)
+    index_path, index = _clip_index(cache_dir)
+    name = os.path.abspath(source)
+    entry = index.get(name)
+    changed = False
+    if entry is None or entry["size"] != stat.st_size or entry["mtime_ns"] != stat.st_mtime_ns:
+        entry = index[name] = {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns, "key": source_key(source),
+                               "frames": {}}
+        changed = True
+    box_key = f"{box[0]}x{box[1]}"
+    size = entry["frames"].get(box_key)
+    if size is None:
+        size = entry["frames"][box_key] = list(clip_frame_size(source, box))
+        changed = True
+    if changed:
+        try:
+            index_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = index_path.with_name(f"{index_path.name}.{os.getpid()}.tmp")
+            tmp.write_text(json.dumps(index, indent=1), encoding="utf-8")
+            os.replace(tmp, index_path)
+        except OSError as e:
+            print(f"Could not update clip index {index_path}: {e}")
+    return Path(cache_dir) / f"{entry['key']}-{size[0]}x{size[1]}.clip"
+
+
+class ClipCacheWriter:
+    """Streams frames into a temporary cache file; commit() publishes it atomically."""
+
+    def __init__(self, path, size, fps):
+        self.path = Path(path)
+        self.size = size
+        self.fps = fps
+        self.count = 0
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._tmp = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+        self._file = open(self._tmp, "wb")
+        self._file.write(b"\0" * CLIP_HEADER_SIZE)
+
+    def add(self, rgb):
+        self._file.write(rgb)  # contiguous array: written straight from its buffer
+        self.count += 1
+
+    def commit(self):
+        self._file.seek(0)
+        self._file.write(CLIP_HEADER.pack(CLIP_MAGIC, self.size[0], self.size[1], self.count, self.fps))
+        self._file.close()
+        os.replace(self._tmp, self.path)
+
+    def abort(self):
+        self._file.close()
+        try:
+            self._tmp.unlink()
+        except OSError:
+            pass
+
+
+class CachedClipSource:
+    """Memory-mapped pre-scaled frames with the same interface as VideoDecoder."""
+
+    def __init__(self, path, loop=True):
+        self.path = Path(path)
+        self.loop = loop
+        with open(self.path, "rb") as f:
+            magic, width, height, count, fps = CLIP_HEADER.unpack(f.read(CLIP_HEADER.size))
+        if magic != CLIP_MAGIC:
+            raise ValueError(f"{self.path} is not a clip cache file")
+        load_numpy()
+        self.size = (width, height)
+        self.fps = fps if fps > 0 else 24.0
+        self.frames = np.memmap(self.path, dtype=np.uint8, mode="r", offset=CLIP_HEADER_SIZE,
+                                shape=(count, height, width, 3))
+        self.position = 0
+        self.error = None if count else "empty clip"
+        self.running = False
+        self._stopped = False
+
+    def __len__(self):
+        return len(self.frames)
+
+    def start(self):
+        return self
+
+    def frame(self, index):
+        """Frame `index` (wrapping around when looping) as a read-only view of the file."""
+        return self.frames[index % len(self.frames)]
+
+    def take(self, target):
+        """(frame, index) for playback position `target`: direct random access, no skipping cost."""
+        if self._stopped or not len(self.frames) or (not self.loop and target >= len(self.frames)):
+            return None, None
+        return self.frames[target % len(self.frames)], target
+
+    def next_frame(self):
+        if self._stopped:
+            return None
+        if self.position >= len(self.frames):
+            if not self.loop or not len(self.frames):
+                return None
+            self.position = 0
+        frame = self.frames[self.position]
+        self.position += 1
+        return frame
+
+    def stop(self, timeout=None):
+        """Stop handing out frames and unmap the file."""
+        self._stopped = True
+        frames, self.frames = self.frames, np.empty((0,) + self.frames.shape[1:], dtype=np.uint8)
+        mapping = getattr(frames, "_mmap", None)
+        del frames
+        if mapping is not None:
+            try:
+                mapping.close()
+            except BufferError:
+                pass  # a frame view is still in use; the mapping goes when it does
+
+
+def open_cached_clip(source, box, cache_dir=DEFAULT_CLIP_CACHE_DIR):
+    """CachedClipSource for `source` scaled into `box`, or None if it is not cached yet.
+
+    Needs numpy; cv2 only if the clip index does not know `source` at this box yet.
+    """
+    if not load_numpy():
+        return None
+    try:
+        path = cached_clip_path(source, box, cache_dir)
+    except (OSError, RuntimeError):
+        return None
+    if not path.exists():
+        return None
+    try:
+        return CachedClipSource(path)
+    except Exception as e:
+        print(f"Ignoring unreadable clip cache {path}: {e}")
+        return None
+
+
+def build_clip_cache(source, box=DEFAULT_BOX, cache_dir=DEFAULT_CLIP_CACHE_DIR):
+    """Decode and scale every frame of `source` into its cache file; returns the path."""
+    decoder = VideoDecoder(source, box, loop=False).start()
+    path = cached_clip_path(source, box, cache_dir)
+    writer = ClipCacheWriter(path, decoder.size, decoder.fps)
+    try:
+        while True:
+            frame = decoder.next_frame()
+            if frame is not None:
+                writer.add(frame)
+            elif not decoder.running and not len(decoder.ring):
+                break
+            else:
+                time.sleep(0.001)
+        writer.commit()
+    except BaseException:
+        writer.abort()
+        raise
+    finally:
+        decoder.stop()
+    return path
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="celebration_video.py", description="Celebration clip cache tools")
+    sub = parser.add_subparsers(dest="command", required=True)
+    build = sub.add_parser("build", help="Pre-decode and pre-scale a clip into the cache")
+    info = sub.add_parser("info", help="Show the cache file for a clip")
+    for p in (build, info):
+        p.add_argument("--source", default=str(DEFAULT_CLIP), help="Video file")
+        p.add_argument("--box", type=int, nargs=2, default=list(DEFAULT_BOX), metavar=("W", "H"),
+                       help="Box the frames are scaled to fit")
+        p.add_argument("--cache-dir", default=str(DEFAULT_CLIP_CACHE_DIR), help="Cache directory")
+    args = parser.parse_args(argv)
+
+    if args.command == "build":
+        path = build_clip_cache(args.source, tuple(args.box), args.cache_dir)
+        print(f"✅ Cached {len(CachedClipSource(path))} frames in {path} ({path.stat().st_size / 1e6:.1f} MB)")
+    else:
+        clip = open_cached_clip(args.source, tuple(args.box), args.cache_dir)
+        if clip is None:
+            print("⚠️ Not cached yet (run: python celebration_video.py build)")
+        else:
+            print(f"{clip.path}: {len(clip)} frames of {clip.size[0]}x{clip.size[1]} at {clip.fps:g} fps")
+
+
+if __name__ == "__main__":
+    main()
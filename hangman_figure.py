@@ -0,0 +1,194 @@
+# hangman_figure.py
+"""
+Geometry and incremental drawing of the hangman figure.
+
+The figure is described once as data: the gallows plus one group of items per
+wrong answer (1..6; the sixth also adds the X-eyes game-over face). Coordinates are
+for the 300x400 canvases used by the game.
+
+HangmanFigure draws onto a Tk canvas with tagged items. The gallows and every part
+are created once per canvas, with the parts hidden. Moving to another stage only
+shows or hides the parts between the old and new stage, so an extra wrong answer is
+a single itemconfigure instead of a full repaint.
+
+HangmanSprites goes one step further when Pillow is available. All seven stages are
+rendered once into images, cached by canvas size and DPI for the whole process (across
+sessions, "Play Again" and several windows), and the canvas holds a single image
+item. Switching stages is then one image swap.
+"""
+
+import weakref
+
+# Pillow is imported when the first figure is made (load_pil), not at startup;
+# PIL_AVAILABLE is worked out on first read.
+Image = ImageDraw = ImageTk = None
+_pil_loaded = False
+
+
+def load_pil():
+    """Import Pillow if not done yet; True if it is available."""
+    global Image, ImageDraw, ImageTk, _pil_loaded
+    if not _pil_loaded:
+        try:
+            from PIL import Image, ImageDraw, ImageTk
+        except Exception:
+            pass
+        _pil_loaded = True
+    return Image is not None
+
+
+def __getattr__(name):
+    if name == "PIL_AVAILABLE":
+        return load_pil()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+CANVAS_WIDTH = 300
+CANVAS_HEIGHT = 400
+MAX_STAGE = 6
+
+_WOOD = {"fill": "#795548", "outline": "#5D4037", "width": 2}
+_BODY = {"fill": "#333333", "width": 4}
+_FACE = {"fill": "red", "width": 3}
+
+# (kind, coords, options) with kind in rectangle / oval / line / arc
+GALLOWS = [
+    ("rectangle", (50, 350, 250, 370), _WOOD),
+    ("rectangle", (100, 50, 120, 350), _WOOD),
+    ("rectangle", (100, 50, 200, 70), _WOOD),
+    ("rectangle", (180, 70, 185, 100), _WOOD),
+]
+
+PARTS = [
+    [("oval", (160, 100, 200, 140), {"outline": "#333333", "width": 4})],  # Head
+    [("line", (180, 140, 180, 250), _BODY)],  # Body
+    [("line", (180, 170, 220, 200), _BODY)],  # Right arm
+    [("line", (180, 170, 140, 200), _BODY)],  # Left arm
+    [("line", (180, 250, 220, 300), _BODY)],  # Right leg
+    [
+        ("line", (180, 250, 140, 300), _BODY),  # Left leg
+        # X eyes and sad mouth for game over
+        ("line", (168, 115, 175, 122), _FACE),
+        ("line", (175, 115, 168, 122), _FACE),
+        ("line", (185, 115, 192, 122), _FACE),
+        ("line", (192, 115, 185, 122), _FACE),
+        ("arc", (165, 125, 195, 135), {"start": 0, "extent": -180, "outline": "red", "width": 3, "style": "arc"}),
+    ],
+]
+
+
+def part_tag(stage):
+    return f"hangman_part{stage}"
+
+
+class HangmanFigure:
+    """Persistent tagged hangman items on one canvas; set_stage() changes only what differs."""
+
+    def __init__(self, canvas):
+        self.canvas = canvas
+        self.stage = 0
+        for kind, coords, options in GALLOWS:
+            self._create(kind, coords, options, ("hangman", "hangman_gallows"))
+        for stage, items in enumerate(PARTS, start=1):
+            for kind, coords, options in items:
+                self._create(kind, coords, options, ("hangman", part_tag(stage)), state="hidden")
+
+    def _create(self, kind, coords, options, tags, state="normal"):
+        return getattr(self.canvas, f"create_{kind}")(*coords, tags=tags, state=state, **options)
+
+    def set_stage(self, stage):
+        """Show parts 1..stage and hide the rest, touching only parts that change."""
+        stage = max(0, min(MAX_STAGE, stage))
+        if stage > self.stage:
+            for s in range(self.stage + 1, stage + 1):
+                self.canvas.itemconfigure(part_tag(s), state="normal")
+        else:
+            for s in range(stage + 1, self.stage + 1):
+                self.canvas.itemconfigure(part_tag(s), state="hidden")
+        self.stage = stage
+
+
+# Sprites -------------------------------------------------------------------
+BASE_DPI = 96.0
+SUPERSAMPLE = 2  # render larger and downscale, for smoother edges than the vector canvas
+
+_STAGE_IMAGES = {}                        # (width, height, dpi) -> [PIL image per stage]
+_STAGE_PHOTOS = weakref.WeakKeyDictionary()  # toplevel -> {(width, height, dpi): [PhotoImage]}
+
+
+def _draw_item(draw, kind, coords, options, sx, sy, line_scale):
+    xy = [c * (sx if i % 2 == 0 else sy) for i, c in enumerate(coords)]
+    width = max(1, round(options.get("width", 1) * line_scale))
+    if kind == "rectangle":
+        draw.rectangle(xy, fill=options.get("fill"), outline=options.get("outline"), width=width)
+    elif kind == "oval":
+        draw.ellipse(xy, fill=options.get("fill"), outline=options.get("outline"), width=width)
+    elif kind == "line":
+        draw.line(xy, fill=options.get("fill"), width=width)
+    elif kind == "arc":
+        # Tk angles run counter-clockwise, Pillow's clockwise
+        start, extent = options.get("start", 0), options.get("extent", 90)
+        a, b = (-start, -(start + extent)) if extent < 0 else (-(start + extent), -start)
+        draw.arc(xy, a, b, fill=options.get("outline"), width=width)
+
+
+def render_stage_images(width=CANVAS_WIDTH, height=CANVAS_HEIGHT, dpi=BASE_DPI):
+    """Transparent RGBA images of stages 0..6 for a canvas of this size and DPI (cached)."""
+    key = (int(width), int(height), round(float(dpi), 1))
+    images = _STAGE_IMAGES.get(key)
+    if images is None:
+        load_pil()
+        w, h = key[0] * SUPERSAMPLE, key[1] * SUPERSAMPLE
+        sx, sy = w / CANVAS_WIDTH, h / CANVAS_HEIGHT
+        # Line widths follow the display DPI like Tk's point-sized fonts do
+        line_scale = SUPERSAMPLE * max(1.0, key[2] / BASE_DPI)
+        image = Image.new("RGBA", (w, h), (0, 0, 0, 0))
+        draw = ImageDraw.Draw(image)
+        for kind, coords, options in GALLOWS:
+            _draw_item(draw, kind, coords, options, sx, sy, line_scale)
+        images = [image.resize(key[:2], Image.LANCZOS)]
+        for items in PARTS:
+            for kind, coords, options in items:
+                _draw_item(draw, kind, coords, options, sx, sy, line_scale)
+            images.append(image.resize(key[:2], Image.LANCZOS))
+        _STAGE_IMAGES[key] = images
+    return images
+
+
+def stage_photos(canvas):
+    """Tk PhotoImages of every stage for `canvas`, shared by all canvases of its window."""
+    width, height = int(canvas.cget("width")), int(canvas.cget("height"))
+    dpi = round(float(canvas.winfo_fpixels("1i")), 1)
+    per_window = _STAGE_PHOTOS.setdefault(canvas.winfo_toplevel(), {})
+    photos = per_window.get((width, height, dpi))
+    if photos is None:
+        load_pil()
+        photos = [ImageTk.PhotoImage(img, master=canvas)
+                  for img in render_stage_images(width, height, dpi)]
+        per_window[(width, height, dpi)] = photos
+    return photos
+
+
+class HangmanSprites:
+    """One image item on `canvas`; set_stage() swaps in the cached image of that stage."""
+
+    def __init__(self, canvas, photos=None):
+        self.canvas = canvas
+        self.photos = photos if photos is not None else stage_photos(canvas)
+        self.stage = 0
+        self.item = canvas.create_image(0, 0, anchor="nw", image=self.photos[0], tags=("hangman",))
+
+    def set_stage(self, stage):
+        stage = max(0, min(MAX_STAGE, stage))
+        if stage != self.stage:
+            self.canvas.itemconfigure(self.item, image=self.photos[stage])
+            self.stage = stage
+
+
+def make_figure(canvas):
+    """Sprite-based figure when Pillow is available, else tagged vector items."""
+    if load_pil():
+        try:
+            return HangmanSprites(canvas)
+        except Exception as e:
+            print(f"Could not render hangman sprites, drawing vectors instead: {e}")
+    return HangmanFigure(canvas)
@@ -1,64 +1,143 @@
 # hangman_mcq_game_updated_attempts.py
+import time
+_IMPORTS_STARTED = time.perf_counter_ns()  # --profile-startup reports the module's own import time
+import sys
+
+from startup_profile import DEFAULT_PROFILE_OUTPUT, NO_PROFILE, ImportTimer, StartupProfile
+
+# --profile-startup also splits the import time per module (startup_profile.py)
+_IMPORT_TIMER = ImportTimer().install() if __name__ == "__main__" and "--profile-startup" in sys.argv else None
+
+import argparse
 import tkinter as tk
 from tkinter import messagebox
-import pygame
 import random
 from pathlib import Path
 import os
 
-# Optional imports for video playback (cv2 + Pillow). If unavailable we gracefully fallback.
-try:
-    import cv2
-    from PIL import Image, ImageTk
-    OPENCV_AVAILABLE = True
-except Exception:
-    OPENCV_AVAILABLE = False
+from audio_channels import ChannelManager
+from celebration_video import DEFAULT_CLIP_CACHE_DIR, FrameBlitter, PlaybackSync, VideoDecoder, open_cached_clip
+from hangman_figure import make_figure
+from question_bank import load_manifest, load_subject
+from question_store import (DEFAULT_COMPILED_BANK, DEFAULT_SQLITE_BANK, DEFAULT_SUBJECT_CACHE_BYTES,
+                            LazyQuestionBank, MmapQuestionBank, QuestionView, SQLiteQuestionStore,
+                            bank_subjects)
+from question_sampler import QuestionSampler
+from question_search import QuestionSearchIndex
+from quiz_engine import QuizEngine
+from render_stats import RenderStats, instrument_screens
+from sound_bank import DEFAULT_SOUNDS_DIR, SoundBank
+from spaced_repetition import ReviewScheduler
+from tick_scheduler import QUESTION, SCREEN, VIDEO, TickScheduler
+
+_IMPORTS_FINISHED = time.perf_counter_ns()
 
 
+def _engine_attr(name):
+    """Expose a QuizEngine attribute on the game object (keeps existing attribute access working)."""
+    return property(lambda self: getattr(self.engine, name),
+                    lambda self, value: setattr(self.engine, name, value))
+
+
+@instrument_screens  # screen methods report to self.render_stats while it is attached
 class HangmanMCQGame:
-    def __init__(self):
-        # Try initialize pygame for sound; if fails, continue without crash
+    # Quiz state lives in the headless QuizEngine; the window only renders it.
+    selected_language = _engine_attr("selected_language")
+    selected_level = _engine_attr("selected_level")
+    current_question = _engine_attr("current_question")
+    score = _engine_attr("score")
+    wrong_answers = _engine_attr("wrong_answers")
+    questions = _engine_attr("questions")
+    user_answers = _engine_attr("user_answers")
+    time_left = _engine_attr("time_left")
+
+    def __init__(self, profile=None):
+        # Startup phases are timed when a StartupProfile is given (--profile-startup)
+        phase = (profile or NO_PROFILE).phase
+
+        # Try initialize pygame for sound; if fails, continue without crash.
+        # Heavy modules are imported on first use: pygame here, cv2/numpy only when the
+        # celebration video plays (celebration_video.py), Pillow with the first hangman
+        # figure (hangman_figure.py) and numpy for beeps only if one has to be synthesized.
         try:
-            pygame.mixer.init()
+            with phase("import pygame"):
+                import pygame
+            with phase("pygame.mixer.init"):
+                pygame.mixer.init()
             self.pygame_available = True
         except Exception:
             self.pygame_available = False
+        # Cue priorities, voice limits and reserved channels for the results cues
+        self.audio_channels = None
+        if self.pygame_available:
+            try:
+                self.audio_channels = ChannelManager.for_mixer()
+            except Exception:
+                self.audio_channels = None
 
         # Main window setup
-        self.root = tk.Tk()
+        with phase("tk.Tk"):
+            self.root = tk.Tk()
         self.root.title("Interactive Hangman MCQ Game")
         self.root.geometry("1000x700")
         self.root.configure(bg="#1a1a2e")  # Darker background for better contrast
         self.root.resizable(True, True)
+        self.root.protocol("WM_DELETE_WINDOW", self.on_close)
+
+        # Every timed callback goes through one scheduler (one Tk wakeup, bulk cancel per screen)
+        self.scheduler = TickScheduler(self.root)
 
-        # Game state variables
+        # Render-latency histograms per screen (render_stats.py): off unless HANGMAN_RENDER_STATS=1
+        # or switched on with the hidden F12 key; Ctrl+F12 dumps them to render_stats.json
+        self.render_stats = RenderStats(self.root.after_idle)
+        if os.environ.get("HANGMAN_RENDER_STATS") == "1":
+            self.render_stats.attach(self)
+        self.root.bind_all("<F12>", lambda e: self.show_render_stats())
+        self.root.bind_all("<Control-F12>", lambda e: self.dump_render_stats())
+
+        # Game state variables (quiz rules and per-session state live in the engine)
+        self.engine = QuizEngine(time_per_question=15, clock=self.scheduler.clock)
         self.nickname = ""
-        self.selected_language = ""
-        self.selected_level = ""
-        self.current_question = 0
-        self.score = 0
-        # wrong_answers counts only timeups (per request)
-        self.wrong_answers = 0
-        self.questions = []
-        self.user_answers = []
         self.timer_running = False
-        self.time_left = 15
         self.timer_after_id = None  # store after() id to cancel if needed
+        # Timer drift measurement (HANGMAN_TIMER_DRIFT=1): per-question report on stdout
+        self.measure_timer_drift = os.environ.get("HANGMAN_TIMER_DRIFT") == "1"
+        self.timer_tick_expected = None
+        self.timer_tick_late = []
+        self.timer_drift_log = []
+
+        # On-disk question banks, preferred over the built-in bank when present:
+        #   SQLite (python question_store.py sqlite-import) then compiled (python question_store.py compile)
+        self.sqlite_bank_path = DEFAULT_SQLITE_BANK
+        self.compiled_bank_path = DEFAULT_COMPILED_BANK
+        self.questions_per_session = 15
+        # Weighted, no-repeat sampling that favours missed questions and rests recent ones
+        self.question_sampler = QuestionSampler()
+        self.review_scheduler = ReviewScheduler()
+        self.engine.result_listeners.append(self.record_question_result)
+        # Memory cap for built-in subjects loaded on demand (least recently used are dropped)
+        self.subject_cache_bytes = DEFAULT_SUBJECT_CACHE_BYTES
 
         # Video playback state
-        self.video_capture = None
+        self.video_decoder = None  # celebration clip decode thread (celebration_video.VideoDecoder)
         self.video_after_id = None
         self.video_frame_image = None  # keep reference to PhotoImage to avoid GC
         self.video_playing = False
+        self.video_stats = None  # PlaybackSync of the last celebration (shown/dropped/late frames)
         # Default video path (user provided)
         self.default_video_path = Path("assets/files/images/stickman-dance.mp4")
+        # Pre-scaled frames of the clip (python celebration_video.py build, or written by the first full play-through)
+        self.clip_cache_dir = DEFAULT_CLIP_CACHE_DIR
+        self.sounds_dir = DEFAULT_SOUNDS_DIR
 
         # UI Elements
         self.main_frame = None
         self.timer_label = None
         self.score_label = None
         self.hangman_canvas = None
+        self.hangman_figure = None  # tagged figure items on hangman_canvas
         self.feedback_label = None  # show "Incorrect - try again!" feedback
+        self.question_screen_frame = None  # main_frame the question screen was built in
 
         # Colors and styling - Updated color scheme
         self.colors = {
@@ -79,314 +158,89 @@ class HangmanMCQGame:
         self.BUTTON_FONT = ("Montserrat", 12, "bold")  # More modern font
 
         # Load questions and sounds
-        self.load_questions()
-        self.load_sounds()
+        with phase("load_questions"):
+            self.load_questions()
+        with phase("load_sounds"):
+            self.load_sounds()
 
         # Start with the initial screen
-        self.show_start_screen()
+        with phase("show_start_screen"):
+            self.show_start_screen()
 
     def load_questions(self):
-        """Full question bank (copied from your original)."""
-        self.question_bank = {
-            "Python": {
-                "Easy": [
-                    {"question": "What is the correct file extension for Python files?",
-                     "options": [".py", ".python", ".pt", ".p"], "correct": 0},
-                    {"question": "Which keyword is used to define a function in Python?",
-                     "options": ["function", "def", "define", "func"], "correct": 1},
-                    {"question": "What does 'len()' function return?",
-                     "options": ["Length of object", "Last element", "First element", "Type of object"], "correct": 0},
-                    {"question": "Which of these is a Python data type?",
-                     "options": ["int", "string", "boolean", "All of the above"], "correct": 3},
-                    {"question": "How do you create a comment in Python?",
-                     "options": ["// comment", "/* comment */", "# comment", "-- comment"], "correct": 2},
-                    {"question": "What is the output of print(2 + 3)?",
-                     "options": ["23", "5", "Error", "None"], "correct": 1}
-                ],
-                "Intermediate": [
-                    {"question": "What is a lambda function in Python?",
-                     "options": ["Anonymous function", "Built-in function", "Class method", "Module function"], "correct": 0},
-                    {"question": "Which method is used to add an element to a list?",
-                     "options": ["add()", "append()", "insert()", "Both b and c"], "correct": 3},
-                    {"question": "What is the purpose of '__init__' method?",
-                     "options": ["Initialize object", "Delete object", "Copy object", "Print object"], "correct": 0},
-                    {"question": "Which keyword is used for exception handling?",
-                     "options": ["catch", "try", "handle", "exception"], "correct": 1},
-                    {"question": "What does 'self' refer to in a class?",
-                     "options": ["Class name", "Method name", "Current instance", "Parent class"], "correct": 2},
-                    {"question": "Which of these is mutable in Python?",
-                     "options": ["tuple", "string", "list", "int"], "correct": 2}
-                ],
-                "Extreme": [
-                    {"question": "What is a decorator in Python?",
-                     "options": ["Design pattern", "Function wrapper", "Class inheritance", "Module import"], "correct": 1},
-                    {"question": "What is the Global Interpreter Lock (GIL)?",
-                     "options": ["Memory manager", "Thread synchronization", "File lock", "Network protocol"], "correct": 1},
-                    {"question": "Which method is called when an object is garbage collected?",
-                     "options": ["__del__", "__gc__", "__free__", "__destroy__"], "correct": 0},
-                    {"question": "What is monkey patching?",
-                     "options": ["Bug fixing", "Dynamic modification", "Code testing", "Memory optimization"], "correct": 1},
-                    {"question": "What does 'yield' keyword do?",
-                     "options": ["Return value", "Create generator", "Pause function", "Both b and c"], "correct": 3},
-                    {"question": "What is metaclass in Python?",
-                     "options": ["Class of class", "Super class", "Abstract class", "Inner class"], "correct": 0}
-                ]
-            },
-            "SQL": {
-                "Easy": [
-                    {"question": "Which command is used to retrieve data from a database?",
-                     "options": ["GET", "SELECT", "FETCH", "RETRIEVE"], "correct": 1},
-                    {"question": "What does SQL stand for?",
-                     "options": ["Simple Query Language", "Structured Query Language", "Standard Query Language", "Sequential Query Language"], "correct": 1},
-                    {"question": "Which clause is used to filter records?",
-                     "options": ["FILTER", "WHERE", "HAVING", "CONDITION"], "correct": 1},
-                    {"question": "What is a primary key?",
-                     "options": ["Main table", "Unique identifier", "First column", "Important data"], "correct": 1},
-                    {"question": "Which command adds new records to a table?",
-                     "options": ["ADD", "INSERT", "CREATE", "NEW"], "correct": 1},
-                    {"question": "What does ORDER BY clause do?",
-                     "options": ["Filter data", "Sort data", "Group data", "Join tables"], "correct": 1}
-                ],
-                "Intermediate": [
-                    {"question": "What is a foreign key?",
-                     "options": ["External table", "Reference to primary key", "Encrypted key", "Backup key"], "correct": 1},
-                    {"question": "Which JOIN returns all records from both tables?",
-                     "options": ["INNER JOIN", "LEFT JOIN", "FULL OUTER JOIN", "RIGHT JOIN"], "correct": 2},
-                    {"question": "What is normalization?",
-                     "options": ["Data backup", "Reduce redundancy", "Increase speed", "Data encryption"], "correct": 1},
-                    {"question": "Which aggregate function calculates average?",
-                     "options": ["MEAN()", "AVG()", "AVERAGE()", "CALC()"], "correct": 1},
-                    {"question": "What does HAVING clause do?",
-                     "options": ["Filter groups", "Sort data", "Join tables", "Create index"], "correct": 0},
-                    {"question": "Which constraint ensures unique values?",
-                     "options": ["PRIMARY", "UNIQUE", "NOT NULL", "CHECK"], "correct": 1}
-                ],
-                "Extreme": [
-                    {"question": "What is a CTE in SQL?",
-                     "options": ["Common Table Expression", "Computed Table Entry", "Complex Transaction Event", "Continuous Table Execution"], "correct": 0},
-                    {"question": "What is the difference between RANK() and DENSE_RANK()?",
-                     "options": ["No difference", "RANK() skips numbers", "DENSE_RANK() skips numbers", "Both are identical"], "correct": 1},
-                    {"question": "What is a window function?",
-                     "options": ["GUI function", "Performs calculation across rows", "Opens new window", "Time-based function"], "correct": 1},
-                    {"question": "What is ACID in database?",
-                     "options": ["Database type", "Transaction properties", "Query language", "Storage method"], "correct": 1},
-                    {"question": "What is a materialized view?",
-                     "options": ["Virtual table", "Physical copy of query result", "Indexed view", "Temporary table"], "correct": 1},
-                    {"question": "What is database sharding?",
-                     "options": ["Data encryption", "Horizontal partitioning", "Backup strategy", "Index optimization"], "correct": 1}
-                ]
-            },
-            "Power BI": {
-                "Easy": [
-                    {"question": "What is Power BI primarily used for?",
-                     "options": ["Data visualization", "Programming", "Web development", "Game development"], "correct": 0},
-                    {"question": "Which file format can Power BI import?",
-                     "options": ["Excel", "CSV", "JSON", "All of the above"], "correct": 3},
-                    {"question": "What is a Power BI Dashboard?",
-                     "options": ["Single page view", "Multi-page report", "Data source", "Query editor"], "correct": 0},
-                    {"question": "Which component is used to create calculations?",
-                     "options": ["Power Query", "DAX", "Power Pivot", "M Language"], "correct": 1},
-                    {"question": "What does ETL stand for?",
-                     "options": ["Extract Transform Load", "Edit Text Language", "Export Table Logic", "Execute Test Logic"], "correct": 0},
-                    {"question": "Which view is used to create relationships?",
-                     "options": ["Data view", "Report view", "Model view", "Table view"], "correct": 2}
-                ],
-                "Intermediate": [
-                    {"question": "What is a calculated column vs calculated measure?",
-                     "options": ["Same thing", "Column stores values, measure calculates", "Measure stores values, column calculates", "No difference"], "correct": 1},
-                    {"question": "What is row-level security?",
-                     "options": ["Data encryption", "User-based data filtering", "Password protection", "Backup security"], "correct": 1},
-                    {"question": "Which function creates a date table?",
-                     "options": ["CALENDAR()", "DATEADD()", "TODAY()", "MONTH()"], "correct": 0},
-                    {"question": "What is Power Query used for?",
-                     "options": ["Creating visuals", "Data transformation", "Publishing reports", "User management"], "correct": 1},
-                    {"question": "What is a slicer in Power BI?",
-                     "options": ["Data filter", "Chart type", "Data source", "Calculation"], "correct": 0},
-                    {"question": "What does SUMMARIZE function do?",
-                     "options": ["Creates summary table", "Adds totals", "Counts rows", "Filters data"], "correct": 0}
-                ],
-                "Extreme": [
-                    {"question": "What is the difference between DirectQuery and Import mode?",
-                     "options": ["No difference", "DirectQuery queries live data", "Import queries live data", "Both cache data"], "correct": 1},
-                    {"question": "What is a composite model?",
-                     "options": ["Multiple data sources", "Complex visual", "Calculated table", "Shared dataset"], "correct": 0},
-                    {"question": "What is incremental refresh?",
-                     "options": ["Full data reload", "Partial data update", "Real-time streaming", "Data compression"], "correct": 1},
-                    {"question": "What is the USERELATIONSHIP function for?",
-                     "options": ["Create relationship", "Activate inactive relationship", "Delete relationship", "Modify relationship"], "correct": 1},
-                    {"question": "What is a calculation group?",
-                     "options": ["Multiple measures", "Time intelligence shortcuts", "Data grouping", "Visual grouping"], "correct": 1},
-                    {"question": "What is Power BI Premium Per User?",
-                     "options": ["Free version", "Individual licensing", "Enterprise license", "Developer version"], "correct": 1}
-                ]
-            },
-            "Tableau": {
-                "Easy": [
-                    {"question": "What type of software is Tableau?",
-                     "options": ["Database", "Data visualization", "Programming IDE", "Web browser"], "correct": 1},
-                    {"question": "What is a worksheet in Tableau?",
-                     "options": ["Data source", "Single visualization", "Dashboard", "Story"], "correct": 1},
-                    {"question": "Which shelf is used for colors in Tableau?",
-                     "options": ["Rows", "Columns", "Marks", "Filters"], "correct": 2},
-                    {"question": "What does 'Show Me' panel do?",
-                     "options": ["Shows data", "Suggests chart types", "Shows errors", "Shows filters"], "correct": 1},
-                    {"question": "What is a dimension in Tableau?",
-                     "options": ["Numerical data", "Categorical data", "Calculated field", "Parameter"], "correct": 1},
-                    {"question": "How do you create a calculated field?",
-                     "options": ["Data menu", "Analysis menu", "Right-click in data pane", "All of the above"], "correct": 3}
-                ],
-                "Intermediate": [
-                    {"question": "What is the difference between a dashboard and a story?",
-                     "options": ["No difference", "Dashboard is interactive, story is sequential", "Story is interactive, dashboard is sequential", "Both are identical"], "correct": 1},
-                    {"question": "What is a parameter in Tableau?",
-                     "options": ["Data source", "User input control", "Calculated field", "Filter"], "correct": 1},
-                    {"question": "What does LOD stand for?",
-                     "options": ["Level of Detail", "Line of Data", "Logic of Display", "List of Dimensions"], "correct": 0},
-                    {"question": "Which join type returns all records from left table?",
-                     "options": ["Inner", "Left", "Right", "Full Outer"], "correct": 1},
-                    {"question": "What is a dual axis chart?",
-                     "options": ["Two separate charts", "Chart with two Y-axes", "Chart with two X-axes", "Two-dimensional chart"], "correct": 1},
-                    {"question": "What is data blending?",
-                     "options": ["Combining multiple data sources", "Mixing colors", "Joining tables", "Filtering data"], "correct": 0}
-                ],
-                "Extreme": [
-                    {"question": "What is the order of operations in Tableau?",
-                     "options": ["Random", "Extract, Data Source, Context, Dimension, Measure filters", "Alphabetical", "User-defined"], "correct": 1},
-                    {"question": "What is table calculation?",
-                     "options": ["Database calculation", "Calculation on query result", "Excel formula", "SQL function"], "correct": 1},
-                    {"question": "What is context filter?",
-                     "options": ["Regular filter", "High priority filter", "Dashboard filter", "Quick filter"], "correct": 1},
-                    {"question": "What is incremental extract refresh?",
-                     "options": ["Full data refresh", "Partial data update", "Real-time data", "No refresh"], "correct": 1},
-                    {"question": "What is Tableau Prep?",
-                     "options": ["Data preparation tool", "Advanced analytics", "Server administration", "Mobile app"], "correct": 0},
-                    {"question": "What is a Tableau hyperextract?",
-                     "options": ["Large file", "Optimized data engine", "Cloud storage", "Backup file"], "correct": 1}
-                ]
-            },
-            "Statistics": {
-                "Easy": [
-                    {"question": "What does mean represent?",
-                     "options": ["Most frequent value", "Middle value", "Average value", "Highest value"], "correct": 2},
-                    {"question": "What is the median of [1, 2, 3, 4, 5]?",
-                     "options": ["2", "3", "4", "5"], "correct": 1},
-                    {"question": "What does standard deviation measure?",
-                     "options": ["Central tendency", "Spread of data", "Data type", "Sample size"], "correct": 1},
-                    {"question": "What is population vs sample?",
-                     "options": ["Same thing", "Population is entire group, sample is subset", "Sample is entire group, population is subset", "No difference"], "correct": 1},
-                    {"question": "What is probability range?",
-                     "options": ["0 to 100", "0 to 1", "-1 to 1", "Any number"], "correct": 1},
-                    {"question": "What is mode in statistics?",
-                     "options": ["Average", "Most frequent value", "Middle value", "Range"], "correct": 1}
-                ],
-                "Intermediate": [
-                    {"question": "What is correlation coefficient range?",
-                     "options": ["0 to 1", "-1 to 1", "0 to 100", "Any number"], "correct": 1},
-                    {"question": "What does p-value indicate?",
-                     "options": ["Population size", "Probability of result", "Sample mean", "Standard error"], "correct": 1},
-                    {"question": "What is null hypothesis?",
-                     "options": ["No relationship exists", "Strong relationship exists", "Data is invalid", "Sample is biased"], "correct": 0},
-                    {"question": "What is Type I error?",
-                     "options": ["Accepting false null", "Rejecting true null", "Wrong sample", "Calculation error"], "correct": 1},
-                    {"question": "What is confidence interval?",
-                     "options": ["Range of possible values", "Single point estimate", "Error measurement", "Sample size"], "correct": 0},
-                    {"question": "What is regression analysis?",
-                     "options": ["Data sorting", "Relationship modeling", "Data cleaning", "Sampling method"], "correct": 1}
-                ],
-                "Extreme": [
-                    {"question": "What is heteroscedasticity?",
-                     "options": ["Equal variance", "Unequal variance", "Normal distribution", "Random sampling"], "correct": 1},
-                    {"question": "What is multicollinearity?",
-                     "options": ["Multiple samples", "Correlated predictors", "Multiple outcomes", "Complex model"], "correct": 1},
-                    {"question": "What is Bayesian statistics?",
-                     "options": ["Frequentist approach", "Prior probability approach", "Sample-based approach", "Population-based approach"], "correct": 1},
-                    {"question": "What is ANOVA used for?",
-                     "options": ["Two group comparison", "Multiple group comparison", "Correlation analysis", "Regression analysis"], "correct": 1},
-                    {"question": "What is Central Limit Theorem?",
-                     "options": ["Sample distribution normality", "Population normality", "Data symmetry", "Error distribution"], "correct": 0},
-                    {"question": "What is bootstrapping in statistics?",
-                     "options": ["Starting analysis", "Resampling method", "Data collection", "Model validation"], "correct": 1}
-                ]
-            }
-        }
+        """Load the question bank.
+
+        Prefers the shared SQLite bank, then the compiled memory-mapped bank (see
+        question_store.py), so questions are only read when shown. Otherwise uses the
+        built-in bank: only its manifest is read here, and each subject's file is loaded
+        the first time that subject is selected.
+
+        Also sets self.search_index (question_search.py): built whole from a SQLite
+        bank, otherwise filled with each subject as it is first selected.
+        """
+        for path, backend in ((self.sqlite_bank_path, SQLiteQuestionStore),
+                              (self.compiled_bank_path, MmapQuestionBank)):
+            if path.exists():
+                try:
+                    self.question_bank = backend(path)
+                except Exception as e:
+                    print(f"Could not open question bank {path}: {e}")
+                    continue
+                if backend is SQLiteQuestionStore:
+                    # one query; the store adds later writes (add_question, imports) to it
+                    self.search_index = self.question_bank.build_search_index()
+                else:
+                    self.search_index = QuestionSearchIndex()
+                return
+        manifest = load_manifest()
+        self.question_bank = LazyQuestionBank(
+            manifest,
+            lambda subject: load_subject(subject, manifest=manifest),
+            max_bytes=self.subject_cache_bytes,
+        )
+        self.search_index = QuestionSearchIndex()  # filled a subject at a time, see select_language
 
     def load_sounds(self):
         """
-        Load sounds from assets/files/sounds/ or fallback to generated beeps (if numpy available).
+        Start loading sounds from assets/files/sounds/ on a background thread (sound_bank.py).
         Expected filenames (you can provide either .wav or .mp3):
           - start.wav / start.mp3
+          - countdown.wav / countdown.mp3
           - alert.wav / alert.mp3
           - celebration.wav / celebration.mp3
           - crying.wav / crying.mp3
           - coin.wav / coin.mp3
+          - wrong.wav / wrong.mp3
+        Missing sounds fall back to generated beeps (if numpy available).
         """
-        self.sounds = {}
-        base_dir = Path("assets/files/sounds")
-        
-        expected = {
-            'start': ["start.wav", "start.mp3"],
-            'countdown': ["countdown.wav", "countdown.mp3"],   # NEW
-            'alert': ["alert.wav", "alert.mp3"],               # (optional legacy alert)
-            'celebration': ["celebration.wav", "celebration.mp3"],
-            'crying': ["crying.wav", "crying.mp3"],
-            'coin': ["coin.wav", "coin.mp3"],
-            'wrong': ["wrong.wav", "wrong.mp3"]                # NEW
-        }
-
-        # Attempt to load from files
+        self.sound_bank = SoundBank(self.sounds_dir)
+        self.sounds = self.sound_bank.sounds  # cue -> Sound, filled in as they load
         if self.pygame_available:
-            for name, candidates in expected.items():
-                sound_obj = None
-                for fname in candidates:
-                    p = base_dir / fname
-                    if p.exists():
-                        try:
-                            sound_obj = pygame.mixer.Sound(str(p))
-                            break
-                        except Exception:
-                            sound_obj = None
-                self.sounds[name] = sound_obj
-
-        # If any sound missing, try to create a beep fallback (numpy required)
-        def make_beep(freq, duration_ms):
-            try:
-                import numpy as np
-                sample_rate = 22050
-                frames = int(duration_ms * sample_rate / 1000)
-                arr = (32767 * 0.5 * np.sin(2 * np.pi * freq * np.arange(frames) / sample_rate)).astype('int16')
-                if self.pygame_available:
-                    return pygame.sndarray.make_sound(arr)
-            except Exception:
-                return None
-            return None
-
-        fallback_map = {
-            'start': (700, 300),
-            'countdown': (1200, 80),   # short high tick for each second
-            'alert': (900, 120),
-            'celebration': (600, 500),
-            'crying': (300, 800),   
-            'coin': (1100, 120),
-            'wrong': (350, 220)
-        }
-        for name, (f, d) in fallback_map.items():
-            if name not in self.sounds or self.sounds[name] is None:
-                self.sounds[name] = make_beep(f, d)
+            # start first, celebration and crying last; play_sound loads any cue not ready yet
+            self.sound_bank.start()
 
     def play_sound(self, sound_name):
         """Play a sound effect safely (no crash)."""
+        if not self.pygame_available:
+            return
         try:
-            snd = self.sounds.get(sound_name)
-            if snd:
+            snd = self.sound_bank.get(sound_name)
+            if not snd:
+                return
+            if self.audio_channels is not None:
+                self.audio_channels.play(sound_name, snd)
+            else:
                 snd.play()
         except Exception:
             pass
 
     def clear_screen(self):
-        """Clear the current screen (and cancel pending timers if any)."""
+        """Clear the current screen (and cancel everything scheduled for it)."""
+        self.scheduler.cancel_group(SCREEN)
+        self.scheduler.cancel_group(QUESTION)
         try:
             if self.timer_after_id:
-                self.root.after_cancel(self.timer_after_id)
+                self.scheduler.cancel(self.timer_after_id)
                 self.timer_after_id = None
         except Exception:
             self.timer_after_id = None
@@ -404,19 +258,17 @@ class HangmanMCQGame:
         self.video_playing = False
         try:
             if self.video_after_id:
-                self.root.after_cancel(self.video_after_id)
+                self.scheduler.cancel(self.video_after_id)
                 self.video_after_id = None
         except Exception:
             self.video_after_id = None
+        # Stop the decode thread; it releases the capture itself
         try:
-            if self.video_capture:
-                try:
-                    self.video_capture.release()
-                except Exception:
-                    pass
-                self.video_capture = None
+            if self.video_decoder:
+                self.video_decoder.stop()
         except Exception:
-            self.video_capture = None
+            pass
+        self.video_decoder = None
         self.video_frame_image = None
 
     def create_back_button(self):
@@ -461,6 +313,7 @@ class HangmanMCQGame:
 
     def show_start_screen(self):
         """Display the initial start screen."""
+        self.save_progress()  # Home can be pressed mid-session
         self.clear_screen()
 
         # Title
@@ -547,7 +400,7 @@ class HangmanMCQGame:
         self.animate_celebration()
 
         # Continue button (appears after animation)
-        self.root.after(1200, self.show_continue_button)
+        self.scheduler.after(1200, self.show_continue_button)
 
     def animate_celebration(self):
         """Removed celebration animation (disabled)."""
@@ -585,13 +438,8 @@ class HangmanMCQGame:
         lang_frame = tk.Frame(self.main_frame, bg=self.colors['dark'])
         lang_frame.pack(expand=True)
 
-        languages = [
-            ("🐍 Python", "Python"),
-            ("🗃️ SQL", "SQL"),
-            ("📊 Power BI", "Power BI"),
-            ("📈 Tableau", "Tableau"),
-            ("📉 Statistics", "Statistics")
-        ]
+        # Subjects come from the bank's manifest; no subject questions are loaded here
+        languages = [(entry.get("label", entry["name"]), entry["name"]) for entry in bank_subjects(self.question_bank)]
 
         colors = [self.colors['primary'], self.colors['secondary'],
                   self.colors['warning'], self.colors['danger'], '#9b59b6']
@@ -601,8 +449,10 @@ class HangmanMCQGame:
             btn.pack(pady=10)
 
     def select_language(self, language):
-        """Select language and show level selection."""
+        """Select language (loading its questions on first pick) and show level selection."""
         self.selected_language = language
+        # reads the subject's file now rather than when a level is picked
+        self.search_index.add_subject(language, self.question_bank[language])
         self.show_level_selection()
 
     def show_level_selection(self):
@@ -620,12 +470,17 @@ class HangmanMCQGame:
         )
         title.pack(pady=(30, 20))
 
-        # Level buttons
-        levels = [
-            ("🟢 Easy", "Easy", self.colors['secondary']),
-            ("🟡 Intermediate", "Intermediate", self.colors['warning']),
-            ("🔴 Extreme", "Extreme", self.colors['danger'])
-        ]
+        # Level buttons (levels listed by the manifest; known levels keep their look)
+        level_styles = {
+            "Easy": ("🟢 Easy", self.colors['secondary']),
+            "Intermediate": ("🟡 Intermediate", self.colors['warning']),
+            "Extreme": ("🔴 Extreme", self.colors['danger'])
+        }
+        entry = next(e for e in bank_subjects(self.question_bank) if e["name"] == self.selected_language)
+        levels = []
+        for level in entry["levels"]:
+            display_name, color = level_styles.get(level, (level, self.colors['primary']))
+            levels.append((display_name, level, color))
 
         level_frame = tk.Frame(self.main_frame, bg=self.colors['dark'])
         level_frame.pack(expand=True)
@@ -636,15 +491,29 @@ class HangmanMCQGame:
 
     def select_level(self, level):
         """Select level and start game."""
-        self.selected_level = level
-        self.questions = self.question_bank[self.selected_language][level].copy()
-        random.shuffle(self.questions)
-        self.current_question = 0
-        self.score = 0
-        self.wrong_answers = 0
-        self.user_answers = []
+        # Questions due for review come first (heap pops, see spaced_repetition.py),
+        # the rest is a weighted sample of the level, O(N + questions with history)
+        # (see question_sampler.py)
+        n = self.questions_per_session
+        pool = self.question_bank[self.selected_language][level]
+        due = self.review_scheduler.due(self.nickname, self.selected_language, level, n, pool)
+        sampled = self.question_sampler.sample(self.question_bank, self.selected_language, level, n)
+        if due:
+            due_set = set(due)
+            questions = QuestionView(pool, due + [i for i in sampled.order if i not in due_set][:n - len(due)])
+        else:
+            questions = sampled  # may hold questions the store already fetched
+        self.engine.start(self.selected_language, level, questions)
         self.show_ready_screen()
 
+    def record_question_result(self, engine, first_try):
+        """Feed each settled question back into the sampler's weights and review schedule."""
+        if engine.pool_index is not None:
+            self.question_sampler.record(engine.selected_language, engine.selected_level,
+                                         engine.pool_index, first_try)
+            self.review_scheduler.record(self.nickname, engine.selected_language, engine.selected_level,
+                                         engine.pool_index, engine.current, first_try)
+
     def show_ready_screen(self):
         """Show 'Let's go' screen briefly."""
         self.clear_screen()
@@ -659,40 +528,51 @@ class HangmanMCQGame:
         ready_msg.pack(expand=True)
 
         # Start first question after 800ms
-        self.root.after(800, self.show_question)
+        self.scheduler.after(800, self.show_question)
 
     def show_question(self):
         """Display current MCQ question."""
         # Cancel any pending timer callback before rendering a new question
         try:
             if self.timer_after_id:
-                self.root.after_cancel(self.timer_after_id)
+                self.scheduler.cancel(self.timer_after_id)
             self.timer_after_id = None
         except Exception:
             self.timer_after_id = None
 
-        if self.current_question >= len(self.questions):
+        if self.engine.finished:
             self.show_results()
             return
 
+        # The question screen is built once per session; later questions only update it
+        if self.question_screen_frame is not self.main_frame:
+            self.build_question_screen()
+
+        self.engine.begin_question()  # 15 seconds for each question
+        self.update_question_screen(self.engine.current)
+
+        # Start timer
+        self.timer_running = True
+        self.timer_tick_expected = None
+        self.update_timer()
+
+    def build_question_screen(self):
+        """Create the question screen widgets (header, timer, question, options, canvas)."""
         self.clear_screen()
         self.create_back_button()
 
-        question_data = self.questions[self.current_question]
-
         # Header with progress and score
         header_frame = tk.Frame(self.main_frame, bg=self.colors['dark'])
         header_frame.pack(fill=tk.X, pady=(0, 20))
 
-        progress_text = f"Question {self.current_question + 1}/{len(self.questions)} | {self.selected_language} - {self.selected_level}"
-        progress_label = tk.Label(
+        self.progress_label = tk.Label(
             header_frame,
-            text=progress_text,
+            text="",
             font=("Montserrat", 14, "bold"),
             fg=self.colors['light'],
             bg=self.colors['dark']
         )
-        progress_label.pack(side=tk.LEFT, padx=10)
+        self.progress_label.pack(side=tk.LEFT, padx=10)
 
         # Score label
         self.score_label = tk.Label(
@@ -713,10 +593,9 @@ class HangmanMCQGame:
         question_frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=(0, 20))
 
         # Timer
-        self.time_left = 15  # 15 seconds for each question
         self.timer_label = tk.Label(
             question_frame,
-            text=f"⏰ {self.time_left}",
+            text="",
             font=("Montserrat", 24, "bold"),
             fg=self.colors['warning'],
             bg=self.colors['dark']
@@ -727,46 +606,24 @@ class HangmanMCQGame:
         question_container = tk.Frame(question_frame, bg=self.colors['panel'], relief=tk.FLAT, bd=0, padx=15, pady=15)
         question_container.pack(fill=tk.X, pady=(0, 18))
 
-        question_text = tk.Label(
+        self.question_label = tk.Label(
             question_container,
-            text=question_data["question"],
+            text="",
             font=("Montserrat", 16, "bold"),
             fg=self.colors['light'],
             bg=self.colors['panel'],
             wraplength=520,
             justify=tk.LEFT
         )
-        question_text.pack()
+        self.question_label.pack()
 
-        # Options
+        # Options (radio buttons are created on demand and reused across questions)
         self.selected_option = tk.IntVar()
         self.selected_option.set(-1)  # No option selected initially
 
-        options_frame = tk.Frame(question_frame, bg=self.colors['dark'])
-        options_frame.pack(fill=tk.X, pady=(0, 10))
-
-        for i, option in enumerate(question_data["options"]):
-            option_frame = tk.Frame(options_frame, bg=self.colors['dark'])
-            option_frame.pack(fill=tk.X, pady=6)
-            
-            radio_btn = tk.Radiobutton(
-                option_frame,
-                text=f"{chr(65+i)}) {option}",
-                variable=self.selected_option,
-                value=i,
-                font=("Montserrat", 14),
-                fg=self.colors['light'],
-                bg=self.colors['dark'],
-                selectcolor=self.colors['panel'],
-                activebackground=self.colors['dark'],
-                activeforeground=self.colors['white'],
-                wraplength=450,
-                justify=tk.LEFT,
-                anchor='w',
-                indicatoron=1,
-                relief=tk.FLAT
-            )
-            radio_btn.pack(anchor=tk.W)
+        self.options_frame = tk.Frame(question_frame, bg=self.colors['dark'])
+        self.options_frame.pack(fill=tk.X, pady=(0, 10))
+        self.option_buttons = []
 
         # Feedback label (for wrong attempts)
         self.feedback_label = tk.Label(question_frame, text="", font=("Montserrat", 14, "bold"),
@@ -795,85 +652,143 @@ class HangmanMCQGame:
         )
         self.hangman_canvas.pack()
 
-        self.draw_hangman()
+        self.question_screen_frame = self.main_frame
 
-        # Start timer
-        self.timer_running = True
-        self.update_timer()
+    def _option_button(self, i):
+        """Radio button for option `i`, created the first time a question needs it."""
+        while len(self.option_buttons) <= i:
+            option_frame = tk.Frame(self.options_frame, bg=self.colors['dark'])
+            radio_btn = tk.Radiobutton(
+                option_frame,
+                text="",
+                variable=self.selected_option,
+                value=len(self.option_buttons),
+                font=("Montserrat", 14),
+                fg=self.colors['light'],
+                bg=self.colors['dark'],
+                selectcolor=self.colors['panel'],
+                activebackground=self.colors['dark'],
+                activeforeground=self.colors['white'],
+                wraplength=450,
+                justify=tk.LEFT,
+                anchor='w',
+                indicatoron=1,
+                relief=tk.FLAT
+            )
+            radio_btn.pack(anchor=tk.W)
+            self.option_buttons.append((option_frame, radio_btn))
+        return self.option_buttons[i]
+
+    def update_question_screen(self, question_data):
+        """Show `question_data` on the existing question screen widgets."""
+        self.scheduler.cancel_group(QUESTION)  # the last question's feedback clear and pulse
+        progress_text = f"Question {self.current_question + 1}/{len(self.questions)} | {self.selected_language} - {self.selected_level}"
+        self.progress_label.config(text=progress_text)
+        self.score_label.config(text=f"Score: {self.score}")
+        self.timer_label.config(text=f"⏰ {self.time_left}", fg=self.colors['warning'], font=("Montserrat", 24, "bold"))
+        self.question_label.config(text=question_data["question"])
+
+        options = question_data["options"]
+        for i, option in enumerate(options):
+            option_frame, radio_btn = self._option_button(i)
+            radio_btn.config(text=f"{chr(65+i)}) {option}")
+            if not option_frame.winfo_manager():
+                option_frame.pack(fill=tk.X, pady=6)
+        for option_frame, _ in self.option_buttons[len(options):]:
+            option_frame.pack_forget()
+        self.selected_option.set(-1)
+
+        self.feedback_label.config(text="")
+        self.draw_hangman()
 
     def draw_hangman(self):
-        """Draw hangman based on wrong answers."""
+        """Draw hangman based on wrong answers.
+
+        The figure is created once per canvas (see hangman_figure.py): a cached image per
+        stage when Pillow is available, else tagged vector items. Later calls only swap
+        the image or show/hide the parts that changed.
+        """
         canvas = self.hangman_canvas
         if not canvas:
             return
 
-        canvas.delete("all")
-
-        # Draw gallows
-        canvas.create_rectangle(50, 350, 250, 370, fill="#795548", outline="#5D4037", width=2)
-        canvas.create_rectangle(100, 50, 120, 350, fill="#795548", outline="#5D4037", width=2)
-        canvas.create_rectangle(100, 50, 200, 70, fill="#795548", outline="#5D4037", width=2)
-        canvas.create_rectangle(180, 70, 185, 100, fill="#795548", outline="#5D4037", width=2)
-
-        # Draw hangman parts according to wrong_answers
-        if self.wrong_answers >= 1:
-            canvas.create_oval(160, 100, 200, 140, outline="#333333", width=4)  # Head
-        if self.wrong_answers >= 2:
-            canvas.create_line(180, 140, 180, 250, fill="#333333", width=4)  # Body
-        if self.wrong_answers >= 3:
-            canvas.create_line(180, 170, 220, 200, fill="#333333", width=4)  # Right arm
-        if self.wrong_answers >= 4:
-            canvas.create_line(180, 170, 140, 200, fill="#333333", width=4)  # Left arm
-        if self.wrong_answers >= 5:
-            canvas.create_line(180, 250, 220, 300, fill="#333333", width=4)  # Right leg
-        if self.wrong_answers >= 6:
-            canvas.create_line(180, 250, 140, 300, fill="#333333", width=4)  # Left leg
-            # X eyes and sad mouth for game over
-            canvas.create_line(168, 115, 175, 122, fill="red", width=3)
-            canvas.create_line(175, 115, 168, 122, fill="red", width=3)
-            canvas.create_line(185, 115, 192, 122, fill="red", width=3)
-            canvas.create_line(192, 115, 185, 122, fill="red", width=3)
-            canvas.create_arc(165, 125, 195, 135, start=0, extent=-180, outline="red", width=3, style=tk.ARC)
+        if self.hangman_figure is None or self.hangman_figure.canvas is not canvas:
+            self.hangman_figure = make_figure(canvas)
+        self.hangman_figure.set_stage(self.wrong_answers)
 
     def update_timer(self):
-        """Update the countdown timer (safe cancelable scheduling)."""
+        """Update the countdown timer (safe cancelable scheduling).
+
+        The countdown follows the engine's monotonic deadline: each tick re-reads the
+        time left and is scheduled for the next whole-second boundary, so late Tk
+        callbacks never add up to a longer question.
+        """
         # If timer not running, don't schedule
         if not self.timer_running:
             return
 
-        if self.time_left > 0:
+        if self.measure_timer_drift:
+            self.note_timer_tick()
+
+        time_left = self.engine.sync_time()
+        if time_left > 0:
             # Last 5 seconds: warning look + alert sound per second
-            if self.time_left <= 5:
-                self.timer_label.config(text=f"⏰ {self.time_left}", fg=self.colors['danger'], font=("Montserrat", 32, "bold"))
+            if time_left <= 5:
+                self.timer_label.config(text=f"⏰ {time_left}", fg=self.colors['danger'], font=("Montserrat", 32, "bold"))
                 # play alert sound once per second
                 self.play_sound('countdown')
                 # pulsing effect
                 self.pulse_timer()
             else:
-                self.timer_label.config(text=f"⏰ {self.time_left}", fg=self.colors['warning'], font=("Montserrat", 24, "bold"))
+                self.timer_label.config(text=f"⏰ {time_left}", fg=self.colors['warning'], font=("Montserrat", 24, "bold"))
 
-            # decrement and schedule next
-            self.time_left -= 1
-            self.timer_after_id = self.root.after(1000, self.update_timer)
+            # schedule the next tick at the next whole-second boundary (+1 ms so it has passed)
+            delay = self.engine.seconds_to_next_tick()
+            self.timer_tick_expected = self.engine.clock() + delay
+            self.timer_after_id = self.scheduler.after(round(delay * 1000) + 1, self.update_timer)
         else:
             # Time's up -> increment hangman body once (per your request)
             self.timer_running = False
             self.timer_after_id = None
-            # record unanswered (timeout)
-            self.user_answers.append(-1)
-            # Only timeouts increase the hangman body
-            self.wrong_answers += 1
+            if self.measure_timer_drift:
+                self.report_timer_drift(timed_out=True)
+            # record unanswered (timeout); only timeouts increase the hangman body
+            self.engine.timeout()
             self.draw_hangman()
             # Show time's up overlay and then show correct answer and move next
             self.show_timeout_message()
 
+    def note_timer_tick(self):
+        """Drift measurement: how late this tick ran against its scheduled boundary."""
+        if self.timer_tick_expected is None:
+            self.timer_tick_late = []
+            return
+        self.timer_tick_late.append(self.engine.clock() - self.timer_tick_expected)
+
+    def report_timer_drift(self, timed_out):
+        """Drift measurement: log how far the question's timing strayed from the deadline."""
+        late = self.timer_tick_late or [0.0]
+        entry = {
+            "question": self.current_question + 1,
+            "timed_out": timed_out,
+            # For a timeout: how long after the deadline it fired (a 15 s question lasted 15 s + drift)
+            "drift_ms": (self.engine.clock() - self.engine.deadline) * 1000 if timed_out else None,
+            "ticks": len(self.timer_tick_late),
+            "max_tick_late_ms": max(late) * 1000,
+        }
+        self.timer_drift_log.append(entry)
+        drift = f"{entry['drift_ms']:+.1f} ms" if timed_out else "answered"
+        print(f"⏱️ Question {entry['question']}: drift {drift}, "
+              f"{entry['ticks']} ticks, worst tick late by {entry['max_tick_late_ms']:.1f} ms")
+        self.timer_tick_expected = None
+
     def pulse_timer(self):
         """Create pulsing effect for timer in final seconds."""
         if not (hasattr(self, 'timer_label') and self.timer_label and self.timer_label.winfo_exists()):
             return
         try:
             self.timer_label.config(font=("Montserrat", 28, "bold"))
-            self.root.after(250, lambda: self.timer_label.config(font=("Montserrat", 32, "bold")))
+            self.scheduler.after(250, lambda: self.timer_label.config(font=("Montserrat", 32, "bold")), group=QUESTION)
         except Exception:
             pass
 
@@ -895,7 +810,7 @@ class HangmanMCQGame:
         self.play_sound('crying')
 
         # After a short pause show correct answer (reuses show_correct_answer but without touching wrong_answers further)
-        self.root.after(1000, lambda: [overlay.destroy(), self.show_correct_answer(autonext=True)])
+        self.scheduler.after(1000, lambda: [overlay.destroy(), self.show_correct_answer(autonext=True)])
 
     def answer_question(self):
         """Process the selected answer.
@@ -911,22 +826,19 @@ class HangmanMCQGame:
             messagebox.showwarning("Warning", "Please select an answer!")
             return
 
-        question_data = self.questions[self.current_question]
-        correct_answer = question_data["correct"]
-
-        if selected == correct_answer:
-            # Correct answer: stop timer, reward, record and move on
+        if self.engine.answer(selected):
+            # Correct answer (engine already awarded points and recorded it): stop timer and move on
             self.timer_running = False
             try:
                 if self.timer_after_id:
-                    self.root.after_cancel(self.timer_after_id)
+                    self.scheduler.cancel(self.timer_after_id)
                     self.timer_after_id = None
             except Exception:
                 self.timer_after_id = None
 
-            self.score += 2
+            if self.measure_timer_drift:
+                self.report_timer_drift(timed_out=False)
             self.play_sound('coin')
-            self.user_answers.append(selected)
             # Clear any feedback if present
             if self.feedback_label:
                 self.feedback_label.config(text="")
@@ -938,15 +850,15 @@ class HangmanMCQGame:
             if self.feedback_label:
                 self.feedback_label.config(text="Incorrect — try again!")
                 # clear the feedback after a short time so it doesn't clutter UI
-                self.root.after(1200, lambda: self.feedback_label.config(text=""))
+                self.scheduler.after(1200, lambda: self.feedback_label.config(text=""), group=QUESTION)
             # play a small alert sound indicating wrong attempt (no hangman increment)
             self.play_sound('wrong')
-            # Do not append to user_answers here; wait for correct or timeout
+            # Engine does not record wrong selections; wait for correct or timeout
 
     def show_correct_answer(self, autonext=False):
         """Briefly show the correct answer before proceeding."""
 
-        question_data = self.questions[self.current_question]
+        question_data = self.engine.current
         correct_option_text = question_data["options"][question_data["correct"]]
 
         overlay = tk.Frame(self.main_frame, bg=self.colors['panel'])
@@ -974,21 +886,21 @@ class HangmanMCQGame:
             # we leave user_answers as-is (it contains -1).
             self.next_question()
 
-        self.root.after(1400, cleanup_and_next)
+        self.scheduler.after(1400, cleanup_and_next)
 
     def next_question(self):
         """Move to next question (reset timer properly)."""
-        self.current_question += 1
+        finished = self.engine.advance()
 
         # update score label if exists
         if self.score_label:
             self.score_label.config(text=f"Score: {self.score}")
 
         # If game finished go to results
-        if self.current_question >= len(self.questions):
+        if finished:
             try:
                 if self.timer_after_id:
-                    self.root.after_cancel(self.timer_after_id)
+                    self.scheduler.cancel(self.timer_after_id)
                     self.timer_after_id = None
             except Exception:
                 self.timer_after_id = None
@@ -996,13 +908,13 @@ class HangmanMCQGame:
             return
 
         # Small delay to let UI breathe (keeps consistent)
-        self.root.after(300, self.show_question)
+        self.scheduler.after(300, self.show_question)
 
     def show_results(self):
         """Show final results screen."""
         try:
             if self.timer_after_id:
-                self.root.after_cancel(self.timer_after_id)
+                self.scheduler.cancel(self.timer_after_id)
                 self.timer_after_id = None
         except Exception:
             self.timer_after_id = None
@@ -1013,8 +925,10 @@ class HangmanMCQGame:
         self.clear_screen()
         self.create_back_button()
 
-        total_questions = len(self.questions)
-        correct_answers = self.score // 2
+        summary = self.engine.summary()
+        total_questions = summary["total"]
+        self.save_progress()
+        correct_answers = summary["correct"]
 
         results_frame = tk.Frame(self.main_frame, bg=self.colors['dark'])
         results_frame.pack(expand=True)
@@ -1064,7 +978,7 @@ class HangmanMCQGame:
         stats_text = f"""
 ✅ Correct Answers: {correct_answers}/{total_questions}
 ❌ Wrong (timeouts): {self.wrong_answers}
-📈 Accuracy: {(correct_answers/total_questions)*100:.1f}%
+📈 Accuracy: {summary['accuracy']:.1f}%
         """
 
         stats_label = tk.Label(
@@ -1094,7 +1008,7 @@ class HangmanMCQGame:
         self.draw_hangman()
 
         # Determine outcome
-        if correct_answers == total_questions:
+        if summary["perfect"]:
             # Perfect
             self.play_sound('celebration')
             celebration_text = tk.Label(
@@ -1107,7 +1021,7 @@ class HangmanMCQGame:
             celebration_text.pack(pady=10)
             # Attempt to play video inside this final canvas; fallback to existing animation if video can't play
             self.show_celebration_animation(final_canvas)
-        elif self.wrong_answers >= 6:
+        elif summary["lost"]:
             # Lost
             self.play_sound('crying')
             game_over_text = tk.Label(
@@ -1122,7 +1036,7 @@ class HangmanMCQGame:
         else:
             # Mixed: play coin sounds for correct answers
             for i in range(correct_answers):
-                self.root.after(i * 200, lambda: self.play_sound('coin'))
+                self.scheduler.after(i * 200, lambda: self.play_sound('coin'))
 
         # Action buttons
         button_frame = tk.Frame(results_frame, bg=self.colors['dark'])
@@ -1150,29 +1064,25 @@ class HangmanMCQGame:
             y = random.randint(50, 300)
             canvas.create_text(x, y, text="✨", font=("Arial", 16), fill="gold")
 
-        # If OpenCV & Pillow are available and the file exists, attempt to play the video
+        # If the file exists (and it is cached, or OpenCV is available), attempt to play the video
+        # (numpy, and cv2 if the clip has to be decoded, are first imported here)
         video_path = self.default_video_path
-        if OPENCV_AVAILABLE and video_path.exists():
+        if video_path.exists():
             try:
-                cap = cv2.VideoCapture(str(video_path))
-                if not cap or not cap.isOpened():
-                    try:
-                        cap.release()
-                    except Exception:
-                        pass
-                    raise RuntimeError("Cannot open video file")
-
-                # Store capture and start loop via after; do not block
-                self.video_capture = cap
-                self.video_playing = True
-
-                # compute fps and delay
-                fps = cap.get(cv2.CAP_PROP_FPS) or 24.0
-                delay_ms = int(1000 / fps) if fps > 0 else 42
-
-                # precompute canvas size
+                # Frames come pre-scaled from the memory-mapped clip cache, or else from a
+                # worker thread that decodes (and caches) them (celebration_video.py; its
+                # start() raises without OpenCV); this Tk-side loop only pops ready frames and blits them
                 canvas_w = int(canvas.cget('width') or 300)
                 canvas_h = int(canvas.cget('height') or 400)
+                box = (canvas_w - 10, canvas_h - 10)
+                decoder = open_cached_clip(video_path, box, self.clip_cache_dir)
+                if decoder is None:
+                    decoder = VideoDecoder(video_path, box, cache_dir=self.clip_cache_dir).start()
+                self.video_decoder = decoder
+                self.video_playing = True
+                # Frames are paced by the clock, dropping any that are already overdue
+                sync = PlaybackSync(decoder, clock=self.scheduler.clock)
+                self.video_stats = sync
 
                 # Center coordinates
                 center_x = canvas_w // 2
@@ -1180,63 +1090,43 @@ class HangmanMCQGame:
 
                 # create image item placeholder
                 img_item = canvas.create_image(center_x, center_y, image=None)
+                # One PhotoImage for the whole clip, repainted in place every frame
+                blitter = FrameBlitter(canvas, img_item, decoder.size)
+                # Keep reference to avoid GC
+                self.video_frame_image = blitter.photo
+
+                def show_star():
+                    try:
+                        canvas.create_text(center_x, center_y, text="⭐", font=("Arial", 56), tags="celebration_star")
+                    except Exception:
+                        pass
 
                 def stream_frame():
                     # stop condition
-                    if not self.video_playing or self.video_capture is None:
+                    if not self.video_playing or self.video_decoder is not decoder:
                         try:
                             canvas.delete(img_item)
                         except Exception:
                             pass
                         return
 
-                    ret, frame = self.video_capture.read()
-                    # If frame not read (EOF or error), attempt to loop by seeking to frame 0 and continue
-                    if not ret:
-                        try:
-                            # Try seek to beginning
-                            self.video_capture.set(cv2.CAP_PROP_POS_FRAMES, 0)
-                            ret, frame = self.video_capture.read()
-                        except Exception:
-                            ret = False
-
-                        if not ret:
-                            # If still failing, fallback to a static celebratory star and stop playback
-                            self.stop_video_playback()
-                            try:
-                                canvas.create_text(center_x, center_y, text="⭐", font=("Arial", 56), tags="celebration_star")
-                            except Exception:
-                                pass
-                            return
-
-                    # Convert BGR -> RGB
+                    frame, delay = sync.poll()
+                    if frame is None and decoder.error and not decoder.running:
+                        # Clip could not be read: fallback to a static celebratory star and stop playback
+                        self.stop_video_playback()
+                        show_star()
+                        return
+
                     try:
-                        frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-                        img = Image.fromarray(frame_rgb)
-                        # Resize to fit canvas while maintaining aspect ratio
-                        img.thumbnail((canvas_w - 10, canvas_h - 10), Image.LANCZOS)
-                        photo = ImageTk.PhotoImage(img)
-                        # Keep reference to avoid GC
-                        self.video_frame_image = photo
-                        # Update canvas image
-                        try:
-                            canvas.itemconfigure(img_item, image=photo)
-                        except Exception:
-                            # in rare cases itemconfigure may fail, recreate image
-                            try:
-                                canvas.delete(img_item)
-                            except Exception:
-                                pass
-                            img_item_local = canvas.create_image(center_x, center_y, image=photo)
-                        # Schedule next frame
-                        self.video_after_id = self.root.after(delay_ms, stream_frame)
+                        if frame is not None:
+                            blitter.blit(frame)
+                        # Wake up when the next frame is due (or shortly, if none was ready)
+                        self.video_after_id = self.scheduler.after(max(1, round(delay * 1000)), stream_frame,
+                                                                   group=VIDEO)
                     except Exception:
                         # On any error during frame processing, fallback to static star and stop playback.
                         self.stop_video_playback()
-                        try:
-                            canvas.create_text(center_x, center_y, text="⭐", font=("Arial", 56), tags="celebration_star")
-                        except Exception:
-                            pass
+                        show_star()
                         return
 
                 # launch streaming loop
@@ -1259,7 +1149,7 @@ class HangmanMCQGame:
                 offset = 2 if count % 2 == 0 else -2
                 if self.wrong_answers >= 1:
                     canvas.create_oval(160+offset, 100, 200+offset, 140, outline="green", width=3, tags="hangman_parts")
-                self.root.after(200, lambda: animate_dance(count + 1))
+                self.scheduler.after(200, lambda: animate_dance(count + 1))
 
         animate_dance()
 
@@ -1275,10 +1165,45 @@ class HangmanMCQGame:
                 x = random.randint(165, 195)
                 y = 140 + count * 15
                 canvas.create_text(x, y, text="💧", font=("Arial", 10), fill="blue")
-                self.root.after(300, lambda: add_tears(count + 1))
+                self.scheduler.after(300, lambda: add_tears(count + 1))
 
         add_tears()
 
+    def show_render_stats(self):
+        """Hidden debug key: switch render timing on, or show the per-screen latency report."""
+        if not self.render_stats.enabled:
+            self.render_stats.attach(self)
+            messagebox.showinfo("Render stats", "Render timing is on. Press F12 again to see the report.")
+            return
+        window = tk.Toplevel(self.root)
+        window.title("Render latency (ms)")
+        text = tk.Text(window, width=80, height=14, font=("Courier", 10))
+        text.insert("1.0", self.render_stats.report())
+        text.configure(state="disabled")
+        text.pack(padx=10, pady=10)
+        tk.Button(window, text="Dump to file", command=self.dump_render_stats).pack(pady=(0, 10))
+
+    def dump_render_stats(self):
+        """Write the render-latency histograms to render_stats.json."""
+        try:
+            path = self.render_stats.dump()
+            print(f"📊 Render stats saved to {path}")
+        except Exception as e:
+            print(f"Could not save render stats: {e}")
+
+    def save_progress(self):
+        """Write the player's review progress (no-op when nothing was answered since the last save)."""
+        try:
+            self.review_scheduler.save(self.nickname)
+        except Exception as e:
+            messagebox.showwarning("Warning", f"Could not save your progress: {e}")
+
+    def on_close(self):
+        """Window close: save progress and stop playback before the window goes away."""
+        self.save_progress()
+        self.stop_video_playback()
+        self.root.destroy()
+
     def run(self):
         """Start the game application."""
         self.root.update_idletasks()
@@ -1287,9 +1212,48 @@ class HangmanMCQGame:
         self.root.geometry(f"1000x700+{x}+{y}")
         self.root.mainloop()
 
+def profile_startup(label="", output=DEFAULT_PROFILE_OUTPUT):
+    """Start the game while timing each startup phase; prints the table and saves JSON."""
+    profile = StartupProfile(label)
+    imports = (_IMPORTS_FINISHED - _IMPORTS_STARTED) / 1e9
+    if _IMPORT_TIMER is not None:
+        # The game's own imports, one phase each; later imports are listed per phase
+        for module, seconds in _IMPORT_TIMER.entries:
+            profile.add(f"import {module}", seconds)
+            imports -= seconds
+        _IMPORT_TIMER.profile = profile
+    profile.add("import hangman_game", max(0.0, imports))
+    timed = profile.total()
+    started = time.perf_counter_ns()
+    game = HangmanMCQGame(profile=profile)
+    # Whatever the constructor spent outside its named phases
+    constructor = (time.perf_counter_ns() - started) / 1e9
+    profile.add("other __init__ work", max(0.0, constructor - (profile.total() - timed)))
+    with profile.phase("first frame (root.update)"):
+        game.root.update()
+    if _IMPORT_TIMER is not None:
+        _IMPORT_TIMER.uninstall()
+    print(profile.table())
+    print(f"Saved startup profile to {profile.save(output)}")
+    return game
+
+
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Interactive Hangman MCQ Game")
+    parser.add_argument("--profile-startup", action="store_true",
+                        help="Time each startup phase, print a table and save it as JSON")
+    parser.add_argument("--profile-output", default=str(DEFAULT_PROFILE_OUTPUT), help="JSON file for the profile")
+    parser.add_argument("--profile-label", default="", help="Label saved with the profile (e.g. release)")
+    parser.add_argument("--profile-exit", action="store_true", help="Exit after profiling instead of playing")
+    args = parser.parse_args()
     try:
-        game = HangmanMCQGame()
+        if args.profile_startup:
+            game = profile_startup(args.profile_label, args.profile_output)
+            if args.profile_exit:
+                game.root.destroy()
+                raise SystemExit(0)
+        else:
+            game = HangmanMCQGame()
         game.run()
     except Exception as e:
         print(f"Error starting game: {e}")
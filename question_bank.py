@@ -0,0 +1,111 @@
+# question_bank.py
+"""
+Built-in question bank for the Interactive Hangman MCQ Game.
+
+Layout: {subject: {level: [{"question": str, "options": [4 x str], "correct": int}]}}.
+
+The questions are stored as one JSON file per subject in assets/files/questions/builtin/,
+next to a small manifest.json that lists each subject's label, file, levels and counts.
+The selection screens only need the manifest, so a subject's file is read the first
+time that subject is picked (see LazyQuestionBank in question_store.py).
+
+BUILTIN_QUESTION_BANK is still available as a plain dict of every subject for tools
+and tests; it is only assembled when that name is first used.
+
+Usage examples:
+    python question_bank.py split other_bank.json --output assets/files/questions/builtin
+"""
+
+import argparse
+import json
+import re
+from pathlib import Path
+
+BUILTIN_BANK_DIR = Path(__file__).resolve().parent / "assets" / "files" / "questions" / "builtin"
+MANIFEST_NAME = "manifest.json"
+
+
+def load_manifest(bank_dir=BUILTIN_BANK_DIR):
+    """Return the manifest's subject entries: [{"name", "label", "file", "levels", "counts"}, ...]."""
+    with (Path(bank_dir) / MANIFEST_NAME).open(encoding="utf-8") as f:
+        return json.load(f)["subjects"]
+
+
+def load_subject(subject, bank_dir=BUILTIN_BANK_DIR, manifest=None):
+    """Read one subject's {level: [question, ...]} from its JSON file."""
+    manifest = manifest if manifest is not None else load_manifest(bank_dir)
+    for entry in manifest:
+        if entry["name"] == subject:
+            with (Path(bank_dir) / entry["file"]).open(encoding="utf-8") as f:
+                return json.load(f)
+    raise KeyError(subject)
+
+
+def load_all(bank_dir=BUILTIN_BANK_DIR):
+    """Eagerly read every subject into a plain {subject: {level: [question]}} dict."""
+    manifest = load_manifest(bank_dir)
+    return {entry["name"]: load_subject(entry["name"], bank_dir, manifest) for entry in manifest}
+
+
+def _subject_json(levels):
+    """One question per line, so diffs of the data files stay readable."""
+    lines = ["{"]
+    for i, (level, questions) in enumerate(levels.items()):
+        lines.append(f"  {json.dumps(level)}: [")
+        for j, q in enumerate(questions):
+            comma = "," if j < len(questions) - 1 else ""
+            lines.append("    " + json.dumps(q, ensure_ascii=False) + comma)
+        lines.append("  ]" + ("," if i < len(levels) - 1 else ""))
+    lines.append("}")
+    return "\n".join(lines) + "\n"
+
+
+def write_subject_files(bank, bank_dir, labels=None):
+    """Split a {subject: {level: [question]}} bank into per-subject JSON files plus manifest.json."""
+    bank_dir = Path(bank_dir)
+    bank_dir.mkdir(parents=True, exist_ok=True)
+    labels = labels or {}
+    subjects = []
+    for name, levels in bank.items():
+        fname = re.sub(r"[^a-z0-9]+", "_", name.lower()).strip("_") + ".json"
+        (bank_dir / fname).write_text(_subject_json(levels), encoding="utf-8")
+        subjects.append({
+            "name": name,
+            "label": labels.get(name, name),
+            "file": fname,
+            "levels": list(levels),
+            "counts": {level: len(qs) for level, qs in levels.items()},
+        })
+    lines = ['{', '  "version": 1,', '  "subjects": [']
+    for i, entry in enumerate(subjects):
+        comma = "," if i < len(subjects) - 1 else ""
+        lines.append("    " + json.dumps(entry, ensure_ascii=False) + comma)
+    lines += ["  ]", "}"]
+    (bank_dir / MANIFEST_NAME).write_text("\n".join(lines) + "\n", encoding="utf-8")
+    return subjects
+
+
+def __getattr__(name):
+    # Assemble the full built-in bank only for callers that really want all of it
+    if name == "BUILTIN_QUESTION_BANK":
+        return load_all()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="question_bank.py", description="Split a JSON bank into per-subject files")
+    sub = parser.add_subparsers(dest="command", required=True)
+    p_split = sub.add_parser("split", help="Write per-subject files and a manifest from one JSON bank")
+    p_split.add_argument("source", help="JSON file holding {subject: {level: [question, ...]}}")
+    p_split.add_argument("--output", default=str(BUILTIN_BANK_DIR), help="Directory for subject files")
+    args = parser.parse_args(argv)
+
+    if args.command == "split":
+        with open(args.source, encoding="utf-8") as f:
+            bank = json.load(f)
+        subjects = write_subject_files(bank, args.output)
+        print(f"✅ Wrote {len(subjects)} subjects to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
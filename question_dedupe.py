@@ -0,0 +1,297 @@
+# question_dedupe.py
+"""
+Near-duplicate question detection with MinHash signatures and an LSH index.
+
+Each question is normalized (lowercase, punctuation dropped, whitespace collapsed)
+together with its options and cut into character shingles. A MinHash signature of
+`num_perm` values estimates the Jaccard similarity between two questions; signatures
+are split into `bands` and bucketed, so only questions sharing at least one band are
+compared. Detection is therefore roughly linear in the bank size instead of comparing
+every pair. Candidate pairs are confirmed against `threshold` and grouped into
+clusters (union-find).
+
+Works over any bank shaped like the one load_questions produces (built-in, lazy,
+compiled or SQLite) and over external CSV/JSONL files.
+
+Usage examples:
+    python question_dedupe.py
+    python question_dedupe.py --source assets/files/questions/question_bank.sqlite --threshold 0.5
+    python question_dedupe.py --source new_questions.csv
+"""
+
+import argparse
+import random
+import re
+import zlib
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except Exception:
+    NUMPY_AVAILABLE = False
+
+_PRIME = (1 << 31) - 1  # hash values and coefficients < 2^31, so a * x + b fits in 64 bits
+_NON_WORD = re.compile(r"[^\w]+")
+_BAND_MULT = 0x9E3779B97F4A7C15  # odd 64-bit multiplier folding a band's rows into one key
+_CHUNK_CELLS = 1 << 20  # shingles x num_perm hashed at once (8 MB of uint64)
+
+
+def question_text(q):
+    """Question plus its options as a single normalized string."""
+    text = " ".join([q["question"], *map(str, q.get("options", []))])
+    return " ".join(_NON_WORD.sub(" ", text.lower()).split())
+
+
+def shingles(text, size=5):
+    """32-bit hashes of the character shingles of `text` (at least one, even for short text)."""
+    if len(text) <= size:
+        return [zlib.crc32(text.encode("utf-8"))]
+    return list({zlib.crc32(text[i:i + size].encode("utf-8")) for i in range(len(text) - size + 1)})
+
+
+class MinHashIndex:
+    """MinHash signatures bucketed by LSH bands; add() items, then clusters() or query().
+
+    With numpy, signatures live in one uint32 array (a row per item, grown by doubling)
+    and each band of a signature is folded into a single uint64 key, kept in a second
+    array. Buckets are never materialized: clusters() sorts each band's key column and
+    compares the items of each run of equal keys, and query() compares against the
+    column. A 100k-question bank then needs about 80 MB of index. Without numpy, tuples
+    in per-band dicts are used, which is fine for small banks.
+    """
+
+    def __init__(self, num_perm=128, bands=32, threshold=0.6, shingle_size=5, seed=1, capacity=1024):
+        if num_perm % bands:
+            raise ValueError("num_perm must be a multiple of bands")
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.threshold = threshold
+        self.shingle_size = shingle_size
+        rng = random.Random(seed)
+        self._a = [rng.randrange(1, _PRIME) for _ in range(num_perm)]
+        self._b = [rng.randrange(0, _PRIME) for _ in range(num_perm)]
+        self.keys = []
+        if NUMPY_AVAILABLE:
+            self._np_a = np.array(self._a, dtype=np.uint64)
+            self._np_b = np.array(self._b, dtype=np.uint64)
+            self._signatures = np.empty((capacity, num_perm), np.uint32)
+            self._band_keys = np.empty((capacity, bands), np.uint64)
+        else:
+            self._signatures = []
+            self._buckets = [{} for _ in range(bands)]
+
+    def __len__(self):
+        return len(self.keys)
+
+    @property
+    def signatures(self):
+        """Signatures of the indexed items, in insertion order."""
+        return self._signatures[:len(self.keys)]
+
+    # Signatures --------------------------------------------------------
+    def signature(self, text):
+        return self.signatures_for([text])[0]
+
+    def signatures_for(self, texts):
+        """MinHash signatures for a batch of normalized texts (uint32 rows, or tuples without numpy)."""
+        all_shingles = [shingles(t, self.shingle_size) for t in texts]
+        if not NUMPY_AVAILABLE:
+            return [tuple(min((a * (x % _PRIME) + b) % _PRIME for x in sh) for a, b in zip(self._a, self._b))
+                    for sh in all_shingles]
+        # Hash every shingle with every permutation and take each document's minimum, a
+        # bounded chunk of shingles at a time; a document split across chunks takes the
+        # minimum of its parts
+        lengths = np.array([len(sh) for sh in all_shingles])
+        doc_of = np.repeat(np.arange(len(texts)), lengths)
+        x = np.fromiter((h for sh in all_shingles for h in sh), dtype=np.uint64, count=int(lengths.sum()))
+        x %= np.uint64(_PRIME)
+        out = np.full((len(texts), self.num_perm), _PRIME, dtype=np.uint64)
+        step = max(1, _CHUNK_CELLS // self.num_perm)
+        for start in range(0, len(x), step):
+            docs = doc_of[start:start + step]
+            hashed = x[start:start + step, None] * self._np_a[None, :]
+            hashed += self._np_b[None, :]
+            hashed %= np.uint64(_PRIME)
+            offsets = np.flatnonzero(np.r_[True, docs[1:] != docs[:-1]])
+            first = docs[0]
+            rows = slice(first, first + len(offsets))
+            np.minimum(out[rows], np.minimum.reduceat(hashed, offsets, axis=0), out=out[rows])
+        return out.astype(np.uint32)
+
+    def band_keys_for(self, sigs):
+        """One uint64 key per band of each signature row (numpy only)."""
+        folded = sigs.reshape(len(sigs), self.bands, self.rows).astype(np.uint64)
+        keys = np.zeros((len(sigs), self.bands), np.uint64)
+        for row in range(self.rows):
+            keys *= np.uint64(_BAND_MULT)
+            keys += folded[:, :, row]
+        return keys
+
+    @staticmethod
+    def similarity(sig_a, sig_b):
+        """Estimated Jaccard similarity of two signatures."""
+        if NUMPY_AVAILABLE:
+            return np.count_nonzero(np.asarray(sig_a) == np.asarray(sig_b)) / len(sig_a)
+        return sum(1 for x, y in zip(sig_a, sig_b) if x == y) / len(sig_a)
+
+    # Index -------------------------------------------------------------
+    def _band_tuples(self, sig):
+        r = self.rows
+        return [sig[i * r:(i + 1) * r] for i in range(self.bands)]
+
+    def add(self, key, text):
+        self.add_many([(key, text)])
+
+    def add_many(self, items, batch_size=512):
+        """Index (key, normalized text) pairs, computing signatures in batches."""
+        batch = []
+        for item in items:
+            batch.append(item)
+            if len(batch) >= batch_size:
+                self._add_batch(batch)
+                batch = []
+        if batch:
+            self._add_batch(batch)
+
+    def _add_batch(self, batch):
+        sigs = self.signatures_for([text for _, text in batch])
+        start = len(self.keys)
+        self.keys.extend(key for key, _ in batch)
+        if not NUMPY_AVAILABLE:
+            for idx, sig in enumerate(sigs, start):
+                self._signatures.append(sig)
+                for band, band_key in zip(self._buckets, self._band_tuples(sig)):
+                    band.setdefault(band_key, []).append(idx)
+            return
+        if len(self.keys) > len(self._signatures):
+            capacity = max(len(self.keys), 2 * len(self._signatures))
+            self._signatures = _grown(self._signatures, capacity)
+            self._band_keys = _grown(self._band_keys, capacity)
+        self._signatures[start:len(self.keys)] = sigs
+        self._band_keys[start:len(self.keys)] = self.band_keys_for(sigs)
+
+    def _candidates(self, sig):
+        if not NUMPY_AVAILABLE:
+            found = set()
+            for band, band_key in zip(self._buckets, self._band_tuples(sig)):
+                found.update(band.get(band_key, ()))
+            return found
+        keys = self.band_keys_for(np.asarray(sig).reshape(1, -1))[0]
+        return np.flatnonzero((self._band_keys[:len(self.keys)] == keys).any(axis=1)).tolist()
+
+    def query(self, text):
+        """[(key, similarity)] of indexed items similar to `text`, most similar first."""
+        sig = self.signature(text)
+        hits = [(self.keys[i], self.similarity(sig, self._signatures[i])) for i in self._candidates(sig)]
+        return sorted([h for h in hits if h[1] >= self.threshold], key=lambda h: -h[1])
+
+    def _buckets_of_band(self, band):
+        """Index lists of items sharing a key in `band` (only those with 2+ items)."""
+        if not NUMPY_AVAILABLE:
+            return [members for members in self._buckets[band].values() if len(members) > 1]
+        column = self._band_keys[:len(self.keys), band]
+        order = np.argsort(column, kind="stable")
+        ordered = column[order]
+        starts = np.flatnonzero(np.r_[True, ordered[1:] != ordered[:-1]])
+        ends = np.r_[starts[1:], len(ordered)]
+        shared = ends - starts > 1
+        return [order[s:e] for s, e in zip(starts[shared], ends[shared])]
+
+    def clusters(self):
+        """Groups of keys whose pairwise-linked similarity is at least `threshold`."""
+        parent = list(range(len(self.keys)))
+
+        def find(i):
+            while parent[i] != i:
+                parent[i] = parent[parent[i]]
+                i = parent[i]
+            return i
+
+        for band in range(self.bands):
+            for members in self._buckets_of_band(band):
+                # Buckets hold items agreeing on a whole band, so they are small in practice
+                members = [int(i) for i in members]
+                for pos, i in enumerate(members):
+                    for j in members[pos + 1:]:
+                        root_i, root_j = find(i), find(j)
+                        if root_i != root_j and \
+                                self.similarity(self._signatures[i], self._signatures[j]) >= self.threshold:
+                            parent[root_j] = root_i
+
+        groups = {}
+        for i in range(len(self.keys)):
+            groups.setdefault(find(i), []).append(self.keys[i])
+        return [g for g in groups.values() if len(g) > 1]
+
+
+def _grown(array, capacity):
+    """Copy of `array` with room for `capacity` rows."""
+    grown = np.empty((capacity,) + array.shape[1:], array.dtype)
+    grown[:len(array)] = array
+    return grown
+
+
+def iter_bank_items(bank):
+    """Yield ((subject, level, index), question) for every question of a bank mapping."""
+    for subject in bank:
+        for level, questions in bank[subject].items():
+            for i, q in enumerate(questions):
+                yield (subject, level, i), q
+
+
+def find_duplicates(items, threshold=0.6, num_perm=128, bands=32):
+    """Cluster near-duplicate questions from (key, question) pairs (see iter_bank_items)."""
+    index = MinHashIndex(num_perm=num_perm, bands=bands, threshold=threshold)
+    texts = {}
+
+    def normalized():
+        for key, q in items:
+            texts[key] = q["question"]
+            yield key, question_text(q)
+
+    index.add_many(normalized())
+    return [[(key, texts[key]) for key in cluster] for cluster in index.clusters()]
+
+
+def _file_items(path):
+    from question_import import iter_rows, validate_question
+    for line, row in iter_rows(path):
+        try:
+            subject, level, q, _ = validate_question(row)
+        except ValueError:
+            continue
+        yield (subject, level, f"line {line}"), q
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="question_dedupe.py", description="Report near-duplicate questions")
+    parser.add_argument("--source", default="builtin",
+                        help="'builtin', a compiled .hqb / .sqlite bank, or a CSV/JSONL file")
+    parser.add_argument("--threshold", type=float, default=0.6, help="Minimum estimated Jaccard similarity")
+    parser.add_argument("--num-perm", type=int, default=128, help="MinHash signature length")
+    parser.add_argument("--bands", type=int, default=32, help="LSH bands (more bands = more recall)")
+    args = parser.parse_args(argv)
+
+    if args.source == "builtin":
+        from question_bank import BUILTIN_QUESTION_BANK
+        items = iter_bank_items(BUILTIN_QUESTION_BANK)
+    elif args.source.endswith((".csv", ".jsonl", ".ndjson")):
+        items = _file_items(args.source)
+    else:
+        from question_store import open_question_bank
+        items = iter_bank_items(open_question_bank(args.source))
+
+    clusters = find_duplicates(items, args.threshold, args.num_perm, args.bands)
+    for n, cluster in enumerate(clusters, start=1):
+        print(f"Cluster {n} ({len(cluster)} questions):")
+        for (subject, level, where), text in cluster:
+            print(f"  [{subject} / {level} / {where}] {text}")
+    if clusters:
+        print(f"⚠️ {len(clusters)} near-duplicate clusters found")
+    else:
+        print("✅ No near-duplicate questions found")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,227 @@
+# question_import.py
+"""
+Streaming bulk importer for CSV / JSONL question banks.
+
+Rows are read one at a time, validated in batches across a process pool and written
+to a SQLiteQuestionStore batch by batch, so memory stays constant whatever the file
+size. Rows that fail validation are written to a reject file (JSONL, one object per
+bad row with its source line number and the reason) instead of aborting the import.
+
+Validation checks the same invariants as the built-in bank tests: a non-empty
+subject, level and question, exactly four options, and a `correct` index in 0..3.
+
+CSV files need a header row with: subject, level, question, option_a, option_b,
+option_c, option_d, correct and optionally tags (separated by ";"). `correct` may be
+an index (0-3) or a letter (A-D). JSONL rows use the bank layout:
+{"subject", "level", "question", "options": [4 x str], "correct": int, "tags": [str]}.
+
+Usage examples:
+    python question_import.py questions.csv
+    python question_import.py questions.jsonl --db assets/files/questions/question_bank.sqlite
+    python question_import.py big.csv --rejects big.rejects.jsonl --workers 8 --dry-run
+"""
+
+import argparse
+import csv
+import json
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from question_store import DEFAULT_SQLITE_BANK, SQLiteQuestionStore
+
+OPTION_COUNT = 4
+CSV_OPTION_COLUMNS = ["option_a", "option_b", "option_c", "option_d"]
+BATCH_SIZE = 5000
+
+
+class ImportStats:
+    """Counters reported at the end of an import."""
+
+    def __init__(self):
+        self.rows = 0
+        self.imported = 0
+        self.rejected = 0
+
+    def __repr__(self):
+        return f"ImportStats(rows={self.rows}, imported={self.imported}, rejected={self.rejected})"
+
+
+def _parse_correct(value):
+    if isinstance(value, bool):
+        raise ValueError("correct must be an index 0-3 or a letter A-D")
+    if isinstance(value, int):
+        return value
+    text = str(value).strip()
+    if len(text) == 1 and text.upper() in "ABCD":
+        return "ABCD".index(text.upper())
+    return int(text)
+
+
+def validate_question(row):
+    """Normalize one raw row into (subject, level, question, tags).
+
+    Raises ValueError with a readable reason when the row breaks a bank invariant.
+    """
+    if not isinstance(row, dict):
+        raise ValueError("row is not an object")
+    subject = str(row.get("subject") or "").strip()
+    level = str(row.get("level") or "").strip()
+    text = str(row.get("question") or "").strip()
+    if not subject:
+        raise ValueError("missing subject")
+    if not level:
+        raise ValueError("missing level")
+    if not text:
+        raise ValueError("missing question text")
+
+    options = row.get("options")
+    if options is None:
+        options = [row.get(col) for col in CSV_OPTION_COLUMNS if row.get(col) not in (None, "")]
+    if not isinstance(options, list):
+        raise ValueError("options must be a list")
+    if len(options) != OPTION_COUNT:
+        raise ValueError(f"expected {OPTION_COUNT} options, got {len(options)}")
+    options = [str(o).strip() for o in options]
+    if any(not o for o in options):
+        raise ValueError("empty option")
+
+    try:
+        correct = _parse_correct(row.get("correct"))
+    except (TypeError, ValueError):
+        raise ValueError(f"invalid correct value {row.get('correct')!r}")
+    if not 0 <= correct < OPTION_COUNT:
+        raise ValueError(f"correct index {correct} out of range 0-{OPTION_COUNT - 1}")
+
+    tags = row.get("tags") or []
+    if isinstance(tags, str):
+        tags = [t.strip() for t in tags.split(";") if t.strip()]
+    return subject, level, {"question": text, "options": options, "correct": correct}, list(tags)
+
+
+def validate_batch(batch):
+    """Validate [(line, row)] in a worker; returns [(line, result, error)] in order."""
+    results = []
+    for line, row in batch:
+        try:
+            results.append((line, validate_question(row), None))
+        except ValueError as e:
+            results.append((line, None, str(e)))
+    return results
+
+
+def iter_rows(path):
+    """Yield (line number, raw row) from a CSV or JSONL file, one row at a time."""
+    path = Path(path)
+    with path.open(encoding="utf-8", newline="") as f:
+        if path.suffix.lower() in (".jsonl", ".ndjson"):
+            for line_no, line in enumerate(f, start=1):
+                if not line.strip():
+                    continue
+                try:
+                    yield line_no, json.loads(line)
+                except json.JSONDecodeError as e:
+                    yield line_no, {"__error__": f"invalid JSON: {e.msg}", "__raw__": line.rstrip("\n")}
+        else:
+            reader = csv.DictReader(f)
+            reader.fieldnames  # consume the header so line numbers refer to data rows
+            start = reader.line_num + 1
+            for row in reader:
+                yield start, row
+                start = reader.line_num + 1
+
+
+def iter_batches(rows, size):
+    batch = []
+    for item in rows:
+        batch.append(item)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def _validated_batches(batches, workers):
+    """Validate batches in order, keeping at most 2 x workers batches in flight."""
+    if workers <= 1:
+        for batch in batches:
+            yield validate_batch(batch)
+        return
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending = deque()
+        for batch in batches:
+            pending.append(pool.submit(validate_batch, batch))
+            if len(pending) >= workers * 2:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+def _reject_raw(row):
+    if isinstance(row, dict) and "__error__" in row:
+        return row["__error__"], row.get("__raw__")
+    return None, row
+
+
+def import_questions(path, store=None, rejects_path=None, workers=None, batch_size=BATCH_SIZE):
+    """Stream `path` into `store` (a SQLiteQuestionStore, or None for a dry run).
+
+    Returns ImportStats. Rejected rows go to `rejects_path` (default: <path>.rejects.jsonl).
+    Each batch is written with store.add_questions, which also adds it to the store's
+    search index when one has been built, so imported questions are searchable at once.
+    """
+    path = Path(path)
+    rejects_path = Path(rejects_path) if rejects_path else path.with_suffix(".rejects.jsonl")
+    workers = (os.cpu_count() or 1) if workers is None else workers
+    stats = ImportStats()
+    rows_by_line = {}
+
+    def rows():
+        # Keep raw rows of the in-flight batches so rejects can echo them back
+        for line, row in iter_rows(path):
+            rows_by_line[line] = row
+            yield line, row
+
+    with rejects_path.open("w", encoding="utf-8") as rejects:
+        for results in _validated_batches(iter_batches(rows(), batch_size), workers):
+            good = []
+            for line, result, error in results:
+                stats.rows += 1
+                raw = rows_by_line.pop(line, None)
+                if error is None:
+                    subject, level, q, tags = result
+                    good.append((subject, level, q, tags))
+                    continue
+                parse_error, raw = _reject_raw(raw)
+                rejects.write(json.dumps({"line": line, "error": parse_error or error, "row": raw},
+                                         ensure_ascii=False) + "\n")
+                stats.rejected += 1
+            if store is not None and good:
+                store.add_questions(good)
+            stats.imported += len(good)
+    return stats
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="question_import.py", description="Import CSV/JSONL questions")
+    parser.add_argument("source", help="CSV or JSONL file to import")
+    parser.add_argument("--db", default=str(DEFAULT_SQLITE_BANK), help="SQLite bank to import into")
+    parser.add_argument("--rejects", help="Reject file (default: <source>.rejects.jsonl)")
+    parser.add_argument("--workers", type=int, default=None, help="Validation processes (default: CPU count)")
+    parser.add_argument("--batch-size", type=int, default=BATCH_SIZE, help="Rows per validation batch")
+    parser.add_argument("--dry-run", action="store_true", help="Validate only; do not write to the bank")
+    args = parser.parse_args(argv)
+
+    store = None if args.dry_run else SQLiteQuestionStore(args.db)
+    try:
+        stats = import_questions(args.source, store, args.rejects, args.workers, args.batch_size)
+    finally:
+        if store is not None:
+            store.close()
+    print(f"✅ {stats.imported} imported, ⚠️ {stats.rejected} rejected of {stats.rows} rows")
+
+
+if __name__ == "__main__":
+    main()
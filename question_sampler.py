@@ -0,0 +1,276 @@
+# question_sampler.py
+"""
+Weighted question sampling for select_level.
+
+WeightedSampler keeps per-item weights in blocks of about sqrt(n) items, each with
+its own Vose alias table, plus an alias table over the block totals. A draw is two
+O(1) alias lookups; changing one weight rebuilds only its block (O(sqrt n)) and
+marks the top table for a lazy O(sqrt n) rebuild before the next draw.
+
+A no-repeat sample of N is drawn by rejecting repeats, which is O(N) while N is
+small next to the pool. If repeats pile up (N close to the pool size or very skewed
+weights) the rest is drawn exactly with weighted reservoir keys.
+
+QuestionSampler applies this per (subject, level): a question's weight is
+
+    priority * (1 + miss_boost * miss_rate) * recency
+
+where `priority` is an editorial weight (a "priority" field on in-memory questions,
+or set_priority), `miss_rate` comes from the results recorded so far, and `recency`
+ramps from low back to 1 over the `recency_window` sessions after a question was
+shown. Questions without history all weigh 1, so only the questions that have a
+history (or a priority) are kept in a WeightedSampler; the rest of the level is a
+uniform remainder drawn by position. A level with no history at all is sampled by
+sample_questions (the SQLite store's indexed sample), so the cost of a session stays
+O(N + questions with history), not O(level size), and nothing is decoded until shown.
+"""
+
+import heapq
+import math
+import random
+
+from question_store import QuestionView, sample_questions
+
+HOT_BLOCK_SIZE = 64  # block size of the per-level table of questions with a history
+
+
+class AliasTable:
+    """Vose's alias method: O(n) build, O(1) draws proportional to `weights`."""
+
+    def __init__(self, weights):
+        n = len(weights)
+        self.total = float(sum(weights))
+        self.prob = [0.0] * n
+        self.alias = [0] * n
+        if n == 0 or self.total <= 0:
+            return
+        scaled = [w * n / self.total for w in weights]
+        small = [i for i, p in enumerate(scaled) if p < 1.0]
+        large = [i for i, p in enumerate(scaled) if p >= 1.0]
+        while small and large:
+            s, l = small.pop(), large.pop()
+            self.prob[s] = scaled[s]
+            self.alias[s] = l
+            scaled[l] -= 1.0 - scaled[s]
+            (small if scaled[l] < 1.0 else large).append(l)
+        for i in large + small:  # leftovers are 1 up to rounding
+            self.prob[i] = 1.0
+
+    def draw(self, rng=random):
+        i = int(rng.random() * len(self.prob))
+        return i if rng.random() < self.prob[i] else self.alias[i]
+
+
+class WeightedSampler:
+    """Two-level alias sampler over item weights: O(1) draws, O(sqrt n) weight updates."""
+
+    def __init__(self, weights, block_size=None):
+        self._weights = [float(w) for w in weights]
+        n = len(self._weights)
+        self.block_size = block_size or max(1, int(math.sqrt(n)))
+        self._blocks = []
+        for start in range(0, n, self.block_size):
+            self._blocks.append(AliasTable(self._weights[start:start + self.block_size]))
+        self._top = None
+        self.positive = sum(1 for w in self._weights if w > 0)
+
+    def __len__(self):
+        return len(self._weights)
+
+    @property
+    def total(self):
+        return sum(block.total for block in self._blocks)
+
+    def weight(self, i):
+        return self._weights[i]
+
+    def append(self, weight):
+        """Add an item at the end (in the last block, or a new one); returns its index."""
+        weight = float(weight)
+        self._weights.append(weight)
+        i = len(self._weights) - 1
+        b = i // self.block_size
+        start = b * self.block_size
+        table = AliasTable(self._weights[start:start + self.block_size])
+        if b < len(self._blocks):
+            self._blocks[b] = table
+        else:
+            self._blocks.append(table)
+        self.positive += weight > 0
+        self._top = None
+        return i
+
+    def update(self, i, weight):
+        """Change one item's weight, rebuilding only its block."""
+        weight = float(weight)
+        old = self._weights[i]
+        if old == weight:
+            return
+        self.positive += (weight > 0) - (old > 0)
+        self._weights[i] = weight
+        b = i // self.block_size
+        start = b * self.block_size
+        self._blocks[b] = AliasTable(self._weights[start:start + self.block_size])
+        self._top = None
+
+    def draw(self, rng=random):
+        """One index drawn proportionally to its weight (None if every weight is 0)."""
+        if self._top is None:
+            self._top = AliasTable([block.total for block in self._blocks])
+        if self._top.total <= 0:
+            return None
+        b = self._top.draw(rng)
+        return b * self.block_size + self._blocks[b].draw(rng)
+
+    def sample(self, n, rng=random):
+        """Up to `n` distinct indices, each draw weighted, without repeats."""
+        n = min(n, self.positive)
+        picked = []
+        seen = set()
+        attempts = 0
+        max_attempts = 4 * n + 32
+        while len(picked) < n and attempts < max_attempts:
+            attempts += 1
+            i = self.draw(rng)
+            if i not in seen:
+                seen.add(i)
+                picked.append(i)
+        if len(picked) < n:
+            # Exact weighted sampling without replacement for the remainder (A-ES keys)
+            keyed = ((rng.random() ** (1.0 / w), i) for i, w in enumerate(self._weights)
+                     if w > 0 and i not in seen)
+            picked.extend(i for _, i in heapq.nlargest(n - len(picked), keyed))
+        return picked
+
+
+class _LevelState:
+    def __init__(self, size):
+        self.size = size
+        # Only questions with a non-default weight at some point get a slot here
+        self.hot = WeightedSampler([], block_size=HOT_BLOCK_SIZE)
+        self.slots = []    # hot slot -> pool position
+        self.slot_of = {}  # pool position -> hot slot
+        self.attempts = {}
+        self.misses = {}
+        self.priority = {}
+        self.last_seen = {}
+        self.session = 0
+
+
+class QuestionSampler:
+    """Per-(subject, level) weighted, no-repeat question sampling with result feedback."""
+
+    def __init__(self, miss_boost=2.0, recency_window=3, rng=random):
+        self.miss_boost = miss_boost
+        self.recency_window = recency_window
+        self.rng = rng
+        self._levels = {}
+        self._priorities = {}  # (subject, level) -> {index: priority}, kept across pool changes
+
+    def _state(self, subject, level, pool):
+        state = self._levels.get((subject, level))
+        if state is None or state.size != len(pool):
+            old = state
+            state = _LevelState(len(pool))
+            if isinstance(pool, list):
+                # In-memory pools are cheap to scan for editorial priorities
+                for i, q in enumerate(pool):
+                    if "priority" in q:
+                        state.priority[i] = float(q["priority"])
+            state.priority.update({i: p for i, p in self._priorities.get((subject, level), {}).items()
+                                   if i < len(pool)})
+            if old is not None:
+                for name in ("attempts", "misses", "last_seen"):
+                    getattr(state, name).update({i: v for i, v in getattr(old, name).items() if i < len(pool)})
+                state.session = old.session
+            for i in set(state.priority) | set(state.attempts) | set(state.last_seen):
+                self._update(state, i)
+            self._levels[(subject, level)] = state
+        return state
+
+    def _weight(self, state, i):
+        attempts = state.attempts.get(i, 0)
+        miss_rate = state.misses.get(i, 0) / attempts if attempts else 0.0
+        weight = state.priority.get(i, 1.0) * (1.0 + self.miss_boost * miss_rate)
+        if i in state.last_seen:
+            age = state.session - state.last_seen[i]
+            weight *= min(1.0, (age + 1) / (self.recency_window + 1))
+        return weight
+
+    def _update(self, state, i):
+        """Recompute question i's weight, giving it a hot slot once it is not 1."""
+        weight = self._weight(state, i)
+        slot = state.slot_of.get(i)
+        if slot is not None:
+            state.hot.update(slot, weight)
+        elif weight != 1.0:
+            state.slot_of[i] = state.hot.append(weight)
+            state.slots.append(i)
+
+    def _draw_order(self, state, n):
+        """Up to `n` distinct positions: hot slots by weight, the remainder uniformly."""
+        rng = self.rng
+        cold = state.size - len(state.slots)
+        hot_total = state.hot.total
+        n = min(n, cold + state.hot.positive)
+        picked = []
+        seen = set()
+        attempts = 0
+        max_attempts = 4 * n + 32
+        while len(picked) < n and attempts < max_attempts:
+            attempts += 1
+            if rng.random() * (cold + hot_total) < cold:
+                i = rng.randrange(state.size)
+                if i in state.slot_of:
+                    continue  # only positions without a slot are in the uniform remainder
+            else:
+                i = state.slots[state.hot.draw(rng)]
+            if i not in seen:
+                seen.add(i)
+                picked.append(i)
+        if len(picked) < n:
+            # Exact weighted sampling without replacement for the remainder (A-ES keys);
+            # only reached when N is close to the level size or most of it is hot
+            weights = ((i, state.hot.weight(state.slot_of[i]) if i in state.slot_of else 1.0)
+                       for i in range(state.size) if i not in seen)
+            keyed = ((rng.random() ** (1.0 / w), i) for i, w in weights if w > 0)
+            picked.extend(i for _, i in heapq.nlargest(n - len(picked), keyed))
+        return picked
+
+    def sample(self, bank, subject, level, n):
+        """QuestionView of up to `n` distinct questions from bank[subject][level]."""
+        pool = bank[subject][level]
+        state = self._state(subject, level, pool)
+        state.session += 1
+        # Questions shown within the recency window regain weight as sessions pass
+        for i, seen in list(state.last_seen.items()):
+            if state.session - seen > self.recency_window:
+                del state.last_seen[i]
+            self._update(state, i)
+        if state.slots:
+            view = QuestionView(pool, self._draw_order(state, n))
+        else:
+            # Every weight is 1: a plain uniform sample through the backend's index
+            view = sample_questions(bank, subject, level, n, self.rng)
+        for i in view.order:
+            state.last_seen[i] = state.session
+            self._update(state, i)
+        return view
+
+    def record(self, subject, level, index, correct):
+        """Feed back one result for pool position `index` (timeouts count as misses)."""
+        state = self._levels.get((subject, level))
+        if state is None or index >= state.size:
+            return
+        state.attempts[index] = state.attempts.get(index, 0) + 1
+        if not correct:
+            state.misses[index] = state.misses.get(index, 0) + 1
+        self._update(state, index)
+
+    def set_priority(self, subject, level, index, priority):
+        """Editorial weight for one question (1.0 = normal, 0 = never drawn)."""
+        self._priorities.setdefault((subject, level), {})[index] = float(priority)
+        state = self._levels.get((subject, level))
+        if state is not None and index < state.size:
+            state.priority[index] = float(priority)
+            self._update(state, index)
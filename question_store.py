@@ -0,0 +1,609 @@
+# question_store.py
+"""
+Question bank backends for the Interactive Hangman MCQ Game.
+
+Every backend looks like the built-in bank: bank[subject][level] is a sequence of
+{"question", "options", "correct"} dicts. The backends are:
+
+- LazyQuestionBank: per-subject files loaded on first use, kept in a size-capped LRU.
+- MmapQuestionBank: read-only compiled file (.hqb), decoded on demand.
+- SQLiteQuestionStore: editable SQLite file with indexed subject/level/tag lookups.
+
+A compiled bank (.hqb) is a single file:
+
+    header   magic b"HQB1", u16 version, u32 group count
+    index    per (subject, level) group:
+               u16 len + utf-8 subject, u16 len + utf-8 level, u32 count, u64 offsets position
+    offsets  per group: (count + 1) x u64 absolute record offsets
+    records  per question: u8 correct, u8 option count,
+               u32 len + utf-8 question, then u16 len + utf-8 for each option
+
+Only the (small) index is parsed when the bank is opened; the file is read through
+mmap and a question is decoded only when it is indexed, so startup time and resident
+memory stay flat no matter how large the bank is.
+
+The SQLite store numbers the questions of each (subject, level) densely (seq 0..n-1,
+kept dense on delete), so sampling N questions is N random seqs looked up with one
+indexed query: O(N), independent of bank size.
+
+Usage examples:
+    python question_store.py compile
+    python question_store.py compile --output assets/files/questions/question_bank.hqb
+    python question_store.py info assets/files/questions/question_bank.hqb
+    python question_store.py sqlite-import --db assets/files/questions/question_bank.sqlite
+"""
+
+import argparse
+import json
+import mmap
+import random
+import sqlite3
+import struct
+import sys
+from collections.abc import Mapping, Sequence
+from pathlib import Path
+
+from question_search import QuestionSearchIndex
+
+MAGIC = b"HQB1"
+VERSION = 1
+DEFAULT_COMPILED_BANK = Path("assets/files/questions/question_bank.hqb")
+DEFAULT_SQLITE_BANK = Path("assets/files/questions/question_bank.sqlite")
+DEFAULT_SUBJECT_CACHE_BYTES = 32 * 1024 * 1024
+
+_HEADER = struct.Struct("<4sHI")
+_U16 = struct.Struct("<H")
+_U32 = struct.Struct("<I")
+_U64 = struct.Struct("<Q")
+_GROUP_TAIL = struct.Struct("<IQ")
+_RECORD_HEAD = struct.Struct("<BB")
+
+
+def _encode_question(q):
+    """Encode one question dict as a binary record."""
+    parts = [_RECORD_HEAD.pack(q["correct"], len(q["options"]))]
+    text = q["question"].encode("utf-8")
+    parts.append(_U32.pack(len(text)))
+    parts.append(text)
+    for option in q["options"]:
+        raw = str(option).encode("utf-8")
+        parts.append(_U16.pack(len(raw)))
+        parts.append(raw)
+    return b"".join(parts)
+
+
+def _decode_question(buf, pos):
+    """Decode the record starting at `pos` into a question dict."""
+    correct, n_options = _RECORD_HEAD.unpack_from(buf, pos)
+    pos += _RECORD_HEAD.size
+    (length,) = _U32.unpack_from(buf, pos)
+    pos += _U32.size
+    text = bytes(buf[pos:pos + length]).decode("utf-8")
+    pos += length
+    options = []
+    for _ in range(n_options):
+        (length,) = _U16.unpack_from(buf, pos)
+        pos += _U16.size
+        options.append(bytes(buf[pos:pos + length]).decode("utf-8"))
+        pos += length
+    return {"question": text, "options": options, "correct": correct}
+
+
+def _encode_name(name):
+    raw = name.encode("utf-8")
+    return _U16.pack(len(raw)) + raw
+
+
+def compile_bank(bank, path):
+    """Write a {subject: {level: [question, ...]}} bank to `path` in the compiled format.
+
+    Questions are streamed to disk group by group, so `bank` levels may be any iterables.
+    Returns the number of questions written.
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    groups = [(subject, level) for subject, levels in bank.items() for level in levels]
+
+    # Size of header + index is known up front (counts are patched in once written)
+    index_size = sum(len(_encode_name(s)) + len(_encode_name(l)) + _GROUP_TAIL.size for s, l in groups)
+    total = 0
+    with path.open("w+b") as f:
+        f.write(_HEADER.pack(MAGIC, VERSION, len(groups)))
+        f.write(b"\0" * index_size)
+        index = []
+        for subject, level in groups:
+            offsets = []
+            # Records first, then their offsets table, so each level is written in one pass
+            for q in bank[subject][level]:
+                offsets.append(f.tell())
+                f.write(_encode_question(q))
+            offsets.append(f.tell())
+            offsets_pos = f.tell()
+            f.write(b"".join(_U64.pack(o) for o in offsets))
+            index.append((subject, level, len(offsets) - 1, offsets_pos))
+            total += len(offsets) - 1
+        f.seek(_HEADER.size)
+        for subject, level, count, offsets_pos in index:
+            f.write(_encode_name(subject) + _encode_name(level) + _GROUP_TAIL.pack(count, offsets_pos))
+    return total
+
+
+class QuestionList(Sequence):
+    """Read-only list of the questions of one (subject, level); decodes on access."""
+
+    def __init__(self, buf, count, offsets_pos):
+        self._buf = buf
+        self._count = count
+        self._offsets_pos = offsets_pos
+
+    def __len__(self):
+        return self._count
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self[j] for j in range(*i.indices(self._count))]
+        if i < 0:
+            i += self._count
+        if not 0 <= i < self._count:
+            raise IndexError("question index out of range")
+        (pos,) = _U64.unpack_from(self._buf, self._offsets_pos + i * _U64.size)
+        return _decode_question(self._buf, pos)
+
+    def copy(self):
+        """Materialize as a plain list (mirrors list.copy for code written against dict banks)."""
+        return list(self)
+
+
+class QuestionView(Sequence):
+    """A reordered/sampled view over a question sequence, without decoding up front.
+
+    `pool` is anything indexable by pool position: the level itself, or a
+    {position: question} dict of questions already fetched (SQLiteQuestionStore.sample).
+    """
+
+    def __init__(self, pool, order):
+        self._pool = pool
+        self.order = order  # pool positions, in session order
+
+    def __len__(self):
+        return len(self.order)
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self._pool[j] for j in self.order[i]]
+        return self._pool[self.order[i]]
+
+
+class MmapQuestionBank(Mapping):
+    """Compiled question bank opened through mmap: bank[subject][level] -> QuestionList."""
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self._file = self.path.open("rb")
+        try:
+            self._buf = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except Exception:
+            self._file.close()
+            raise
+        magic, version, n_groups = _HEADER.unpack_from(self._buf, 0)
+        if magic != MAGIC or version != VERSION:
+            self.close()
+            raise ValueError(f"{self.path} is not a compiled question bank (v{VERSION})")
+        self._subjects = {}
+        pos = _HEADER.size
+        for _ in range(n_groups):
+            subject, pos = self._read_name(pos)
+            level, pos = self._read_name(pos)
+            count, offsets_pos = _GROUP_TAIL.unpack_from(self._buf, pos)
+            pos += _GROUP_TAIL.size
+            self._subjects.setdefault(subject, {})[level] = QuestionList(self._buf, count, offsets_pos)
+
+    def _read_name(self, pos):
+        (length,) = _U16.unpack_from(self._buf, pos)
+        pos += _U16.size
+        return bytes(self._buf[pos:pos + length]).decode("utf-8"), pos + length
+
+    def __getitem__(self, subject):
+        return self._subjects[subject]
+
+    def __iter__(self):
+        return iter(self._subjects)
+
+    def __len__(self):
+        return len(self._subjects)
+
+    def close(self):
+        self._subjects = {}
+        try:
+            self._buf.close()
+        finally:
+            self._file.close()
+
+
+def _approx_size(obj):
+    """Rough deep size in bytes of a subject's nested dict/list/str data."""
+    size = sys.getsizeof(obj)
+    if isinstance(obj, dict):
+        size += sum(_approx_size(k) + _approx_size(v) for k, v in obj.items())
+    elif isinstance(obj, (list, tuple)):
+        size += sum(_approx_size(v) for v in obj)
+    return size
+
+
+class LazyQuestionBank(dict):
+    """Question bank whose subjects are loaded on first access and kept in a size-capped LRU.
+
+    Subclasses dict so code written against the built-in bank (isinstance checks,
+    bank[subject][level]) keeps working. Membership, iteration and len() come from the
+    manifest, not from whichever subjects happen to be loaded. Once the loaded subjects
+    exceed `max_bytes` the least recently used ones are dropped (and reloaded if picked
+    again); the subject just requested is never evicted.
+    """
+
+    def __init__(self, manifest, loader, max_bytes=DEFAULT_SUBJECT_CACHE_BYTES):
+        super().__init__()
+        self.manifest = {entry["name"]: entry for entry in manifest}
+        self.loader = loader
+        self.max_bytes = max_bytes
+        self.loaded_bytes = 0
+        self.loads = 0
+        self.evictions = 0
+        self._sizes = {}
+
+    def __getitem__(self, subject):
+        if dict.__contains__(self, subject):
+            # Re-insert to mark as most recently used
+            levels = dict.pop(self, subject)
+            dict.__setitem__(self, subject, levels)
+            return levels
+        if subject not in self.manifest:
+            raise KeyError(subject)
+        levels = self.loader(subject)
+        size = _approx_size(levels)
+        dict.__setitem__(self, subject, levels)
+        self._sizes[subject] = size
+        self.loaded_bytes += size
+        self.loads += 1
+        self._evict()
+        return levels
+
+    def _evict(self):
+        while self.loaded_bytes > self.max_bytes and dict.__len__(self) > 1:
+            oldest = next(dict.__iter__(self))
+            dict.__delitem__(self, oldest)
+            self.loaded_bytes -= self._sizes.pop(oldest)
+            self.evictions += 1
+
+    def __contains__(self, subject):
+        return subject in self.manifest
+
+    def __iter__(self):
+        return iter(self.manifest)
+
+    def __len__(self):
+        return len(self.manifest)
+
+    def keys(self):
+        return self.manifest.keys()
+
+    def values(self):
+        return [self[s] for s in self.manifest]
+
+    def items(self):
+        return [(s, self[s]) for s in self.manifest]
+
+    def get(self, subject, default=None):
+        return self[subject] if subject in self.manifest else default
+
+    def levels(self, subject):
+        """Level names for a subject, straight from the manifest (does not load it)."""
+        return list(self.manifest[subject]["levels"])
+
+    def is_loaded(self, subject):
+        return dict.__contains__(self, subject)
+
+    def subjects(self):
+        """Manifest entries in display order (used by the selection screens)."""
+        return list(self.manifest.values())
+
+
+def bank_subjects(bank):
+    """[{"name", "label", "levels"}] for any backend, without loading lazy subjects."""
+    if hasattr(bank, "subjects"):
+        return bank.subjects()
+    return [{"name": subject, "label": subject, "levels": list(bank[subject])} for subject in bank]
+
+
+def sample_questions(bank, subject, level, n, rng=random):
+    """Random sample of up to `n` questions from bank[subject][level] in O(n).
+
+    The result is a QuestionView whose `order` holds the sampled pool positions.
+    Backends with their own `sample` method (SQLiteQuestionStore) are delegated to;
+    otherwise the view is over the level itself, so nothing is copied and compiled
+    banks only decode the questions that are actually shown.
+    """
+    if hasattr(bank, "sample"):
+        return bank.sample(subject, level, n, rng)
+    pool = bank[subject][level]
+    return QuestionView(pool, rng.sample(range(len(pool)), min(n, len(pool))))
+
+
+_SQLITE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS question_groups (
+    id INTEGER PRIMARY KEY,
+    subject TEXT NOT NULL,
+    level TEXT NOT NULL,
+    count INTEGER NOT NULL DEFAULT 0,
+    UNIQUE (subject, level)
+);
+CREATE TABLE IF NOT EXISTS questions (
+    id INTEGER PRIMARY KEY,
+    subject TEXT NOT NULL,
+    level TEXT NOT NULL,
+    seq INTEGER NOT NULL,
+    question TEXT NOT NULL,
+    options TEXT NOT NULL,
+    correct INTEGER NOT NULL
+);
+CREATE UNIQUE INDEX IF NOT EXISTS idx_questions_subject_level_seq ON questions (subject, level, seq);
+CREATE TABLE IF NOT EXISTS question_tags (
+    question_id INTEGER NOT NULL REFERENCES questions (id) ON DELETE CASCADE,
+    tag TEXT NOT NULL,
+    PRIMARY KEY (tag, question_id)
+);
+CREATE INDEX IF NOT EXISTS idx_question_tags_question ON question_tags (question_id);
+"""
+
+
+def _row_to_question(row):
+    question, options, correct = row
+    return {"question": question, "options": json.loads(options), "correct": correct}
+
+
+class SQLiteLevel(Sequence):
+    """Questions of one (subject, level) in a SQLiteQuestionStore, fetched by seq on access."""
+
+    def __init__(self, store, subject, level):
+        self._store = store
+        self.subject = subject
+        self.level = level
+
+    def __len__(self):
+        return self._store.count(self.subject, self.level)
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self[j] for j in range(*i.indices(len(self)))]
+        count = len(self)
+        if i < 0:
+            i += count
+        if not 0 <= i < count:
+            raise IndexError("question index out of range")
+        row = self._store.conn.execute(
+            "SELECT question, options, correct FROM questions WHERE subject = ? AND level = ? AND seq = ?",
+            (self.subject, self.level, i)).fetchone()
+        return _row_to_question(row)
+
+    def copy(self):
+        return list(self)
+
+
+class SQLiteQuestionStore(Mapping):
+    """Editable question bank in a local SQLite file: store[subject][level] -> SQLiteLevel.
+
+    The file can be shared by several kiosks and updated in place (add_question /
+    delete_question or `python question_store.py sqlite-import`) without shipping code.
+    """
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(str(self.path))
+        self.conn.execute("PRAGMA foreign_keys = ON")
+        self.conn.executescript(_SQLITE_SCHEMA)
+        self.search_index = None  # QuestionSearchIndex once build_search_index() has run
+
+    # Mapping interface -------------------------------------------------
+    def _levels(self, subject):
+        rows = self.conn.execute(
+            "SELECT level FROM question_groups WHERE subject = ? ORDER BY id", (subject,)).fetchall()
+        return [r[0] for r in rows]
+
+    def __getitem__(self, subject):
+        levels = self._levels(subject)
+        if not levels:
+            raise KeyError(subject)
+        return {level: SQLiteLevel(self, subject, level) for level in levels}
+
+    def __contains__(self, subject):
+        return self.conn.execute(
+            "SELECT 1 FROM question_groups WHERE subject = ? LIMIT 1", (subject,)).fetchone() is not None
+
+    def __iter__(self):
+        rows = self.conn.execute("SELECT subject FROM question_groups GROUP BY subject ORDER BY MIN(id)")
+        return iter([r[0] for r in rows])
+
+    def __len__(self):
+        return self.conn.execute("SELECT COUNT(DISTINCT subject) FROM question_groups").fetchone()[0]
+
+    # Queries -----------------------------------------------------------
+    def count(self, subject, level):
+        row = self.conn.execute(
+            "SELECT count FROM question_groups WHERE subject = ? AND level = ?", (subject, level)).fetchone()
+        return row[0] if row else 0
+
+    def sample(self, subject, level, n, rng=random, tag=None):
+        """Random sample of up to `n` questions with one indexed query.
+
+        Without `tag` this is O(n): n distinct seqs are drawn in Python and fetched through
+        the (subject, level, seq) index. With `tag` the tag index bounds the scan to the
+        tagged seqs of that subject/level, and n of them are drawn the same way. Either way
+        the result is a QuestionView whose `order` holds the drawn seqs (the questions'
+        positions in store[subject][level]).
+        """
+        if tag is not None:
+            seqs = [r[0] for r in self.conn.execute(
+                "SELECT q.seq FROM question_tags t JOIN questions q ON q.id = t.question_id "
+                "WHERE t.tag = ? AND q.subject = ? AND q.level = ? ORDER BY q.seq",
+                (tag, subject, level))]
+            picks = rng.sample(seqs, min(n, len(seqs)))
+        else:
+            count = self.count(subject, level)
+            picks = rng.sample(range(count), min(n, count))
+        if not picks:
+            return QuestionView({}, [])
+        placeholders = ",".join("?" * len(picks))
+        rows = self.conn.execute(
+            f"SELECT seq, question, options, correct FROM questions "
+            f"WHERE subject = ? AND level = ? AND seq IN ({placeholders})",
+            (subject, level, *picks)).fetchall()
+        return QuestionView({r[0]: _row_to_question(r[1:]) for r in rows}, picks)
+
+    def build_search_index(self):
+        """Index every question with one query and keep the index current on later writes."""
+        rows = self.conn.execute(
+            "SELECT subject, level, seq, question, options, correct FROM questions "
+            "ORDER BY subject, level, seq")
+        self.search_index = QuestionSearchIndex.from_items(((r[0], r[1], r[2]), _row_to_question(r[3:])) for r in rows)
+        self.search_index.subjects.update(self)
+        return self.search_index
+
+    def tags(self, question_id):
+        rows = self.conn.execute("SELECT tag FROM question_tags WHERE question_id = ? ORDER BY tag", (question_id,))
+        return [r[0] for r in rows]
+
+    # Updates -----------------------------------------------------------
+    def _add(self, subject, level, q, tags):
+        self.conn.execute(
+            "INSERT OR IGNORE INTO question_groups (subject, level, count) VALUES (?, ?, 0)", (subject, level))
+        seq = self.count(subject, level)
+        cur = self.conn.execute(
+            "INSERT INTO questions (subject, level, seq, question, options, correct) VALUES (?, ?, ?, ?, ?, ?)",
+            (subject, level, seq, q["question"], json.dumps(list(q["options"])), int(q["correct"])))
+        self.conn.execute(
+            "UPDATE question_groups SET count = count + 1 WHERE subject = ? AND level = ?", (subject, level))
+        self.conn.executemany(
+            "INSERT OR IGNORE INTO question_tags (question_id, tag) VALUES (?, ?)",
+            [(cur.lastrowid, t) for t in tags])
+        if self.search_index is not None:
+            self.search_index.add((subject, level, seq), q)
+        return cur.lastrowid
+
+    def add_question(self, subject, level, q, tags=()):
+        """Insert one question; returns its id."""
+        with self.conn:
+            return self._add(subject, level, q, tags)
+
+    def add_questions(self, rows):
+        """Bulk insert (subject, level, question[, tags]) tuples in one transaction; returns the count."""
+        counts = {}  # next seq per group, read once per group and written back at the end
+        added = 0
+        indexed = [] if self.search_index is not None else None
+        with self.conn:
+            for row in rows:
+                subject, level, q = row[:3]
+                key = (subject, level)
+                if key not in counts:
+                    self.conn.execute(
+                        "INSERT OR IGNORE INTO question_groups (subject, level, count) VALUES (?, ?, 0)", key)
+                    counts[key] = self.count(subject, level)
+                cur = self.conn.execute(
+                    "INSERT INTO questions (subject, level, seq, question, options, correct) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    (subject, level, counts[key], q["question"], json.dumps(list(q["options"])), int(q["correct"])))
+                counts[key] += 1
+                tags = row[3] if len(row) > 3 else ()
+                if tags:
+                    self.conn.executemany(
+                        "INSERT OR IGNORE INTO question_tags (question_id, tag) VALUES (?, ?)",
+                        [(cur.lastrowid, t) for t in tags])
+                added += 1
+                if indexed is not None:
+                    indexed.append(((subject, level, counts[key] - 1), q))
+            self.conn.executemany(
+                "UPDATE question_groups SET count = ? WHERE subject = ? AND level = ?",
+                [(count, subject, level) for (subject, level), count in counts.items()])
+        if indexed:  # only once the transaction has committed
+            for key, q in indexed:
+                self.search_index.add(key, q)
+        return added
+
+    def add_bank(self, bank):
+        """Insert every question of a {subject: {level: [question]}} bank."""
+        return self.add_questions(
+            (subject, level, q) for subject, levels in bank.items() for level, qs in levels.items() for q in qs)
+
+    def delete_question(self, question_id):
+        """Delete a question, moving the last question of its level into the freed seq."""
+        with self.conn:
+            row = self.conn.execute(
+                "SELECT subject, level, seq FROM questions WHERE id = ?", (question_id,)).fetchone()
+            if row is None:
+                return False
+            subject, level, seq = row
+            last = self.count(subject, level) - 1
+            self.conn.execute("DELETE FROM questions WHERE id = ?", (question_id,))
+            if seq != last:
+                self.conn.execute(
+                    "UPDATE questions SET seq = ? WHERE subject = ? AND level = ? AND seq = ?",
+                    (seq, subject, level, last))
+            self.conn.execute(
+                "UPDATE question_groups SET count = count - 1 WHERE subject = ? AND level = ?", (subject, level))
+        index = self.search_index
+        if index is not None:
+            index.remove(index.ids[(subject, level, seq)])
+            if seq != last:
+                index.rekey((subject, level, last), (subject, level, seq))
+        return True
+
+    def close(self):
+        self.conn.close()
+
+
+def open_question_bank(path):
+    """Open an on-disk bank, picking the backend from the file suffix."""
+    path = Path(path)
+    if path.suffix in (".sqlite", ".db"):
+        return SQLiteQuestionStore(path)
+    return MmapQuestionBank(path)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="question_store.py", description="Compile or inspect question banks")
+    sub = parser.add_subparsers(dest="command", required=True)
+    p_compile = sub.add_parser("compile", help="Compile the built-in question bank")
+    p_compile.add_argument("--output", default=str(DEFAULT_COMPILED_BANK), help="Output .hqb file")
+    p_info = sub.add_parser("info", help="Show subjects/levels/counts of an on-disk bank")
+    p_info.add_argument("path", help="Compiled .hqb or .sqlite file")
+    p_sqlite = sub.add_parser("sqlite-import", help="Add questions to a SQLite bank")
+    p_sqlite.add_argument("--db", default=str(DEFAULT_SQLITE_BANK), help="SQLite bank file (created if missing)")
+    p_sqlite.add_argument("--source", default="builtin", help="'builtin' or a compiled .hqb file")
+    args = parser.parse_args(argv)
+
+    if args.command == "compile":
+        from question_bank import BUILTIN_QUESTION_BANK
+        total = compile_bank(BUILTIN_QUESTION_BANK, args.output)
+        print(f"✅ Compiled {total} questions to {args.output}")
+    elif args.command == "sqlite-import":
+        if args.source == "builtin":
+            from question_bank import BUILTIN_QUESTION_BANK as source
+        else:
+            source = MmapQuestionBank(args.source)
+        store = SQLiteQuestionStore(args.db)
+        try:
+            total = store.add_bank(source)
+        finally:
+            store.close()
+        print(f"✅ Added {total} questions to {args.db}")
+    elif args.command == "info":
+        bank = open_question_bank(args.path)
+        try:
+            for subject, levels in bank.items():
+                for level, questions in levels.items():
+                    print(f"{subject:<20} {level:<15} {len(questions):>8}")
+        finally:
+            bank.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,169 @@
+# quiz_engine.py
+"""
+Headless quiz rules for the Interactive Hangman MCQ Game.
+
+QuizEngine owns all per-session state (questions, score, timeouts, answers and the
+countdown) and the rules that change it. It never touches Tk, pygame or any other
+UI library, so a full session can be driven from tests or benchmarks without a
+display. HangmanMCQGame drives one engine instance and only renders its state.
+
+The countdown can run two ways: tick() consumes one logical second (simulations and
+tests), while sync_time() derives time_left from a monotonic deadline set by
+begin_question(), so late timer callbacks never stretch a question.
+"""
+
+import math
+import time
+
+
+class QuizEngine:
+    """Tk-free quiz session: scoring, wrong retries, timeouts and hangman progression."""
+
+    POINTS_PER_CORRECT = 2
+    MAX_WRONG = 6               # hangman is complete after this many timeouts
+    TIMEOUT_ANSWER = -1         # recorded in user_answers when a question times out
+
+    def __init__(self, time_per_question=15, clock=time.monotonic):
+        self.time_per_question = time_per_question
+        self.clock = clock
+        self.deadline = None  # clock() value at which the current question times out
+        self.selected_language = ""
+        self.selected_level = ""
+        # Called as listener(engine, first_try) when a question is settled (correct or timed out);
+        # first_try is True only for a correct answer with no wrong attempt before it.
+        self.result_listeners = []
+        self.reset()
+
+    def reset(self, questions=None):
+        """Reset per-session state, optionally installing a new question sequence."""
+        # Kept as given (not copied) so lazily-decoded sequences stay lazy
+        self.questions = questions if questions is not None else []
+        self.current_question = 0
+        self.score = 0
+        # wrong_answers counts only timeouts (wrong selections may be retried)
+        self.wrong_answers = 0
+        self.user_answers = []
+        self.wrong_attempts = 0
+        self.question_wrong_attempts = 0
+        self.time_left = self.time_per_question
+
+    def start(self, language, level, questions):
+        """Begin a new session for the given subject/level with an already-ordered question list."""
+        self.selected_language = language
+        self.selected_level = level
+        self.reset(questions)
+
+    @property
+    def total_questions(self):
+        return len(self.questions)
+
+    @property
+    def finished(self):
+        return self.current_question >= len(self.questions)
+
+    @property
+    def current(self):
+        """The question dict currently being asked (None once the session is over)."""
+        if self.finished:
+            return None
+        return self.questions[self.current_question]
+
+    @property
+    def pool_index(self):
+        """Position of the current question in its level's pool (None if unknown)."""
+        order = getattr(self.questions, "order", None)
+        if order is None or self.finished:
+            return None
+        return order[self.current_question]
+
+    @property
+    def correct_answers(self):
+        return self.score // self.POINTS_PER_CORRECT
+
+    @property
+    def hangman_complete(self):
+        return self.wrong_answers >= self.MAX_WRONG
+
+    @property
+    def perfect(self):
+        return self.total_questions > 0 and self.correct_answers == self.total_questions
+
+    def begin_question(self):
+        """Reset the countdown for the current question."""
+        self.time_left = self.time_per_question
+        self.deadline = self.clock() + self.time_per_question
+        self.question_wrong_attempts = 0
+
+    def answer(self, selected):
+        """Submit an option index for the current question.
+
+        Returns True when the answer is correct (score awarded, answer recorded).
+        Wrong selections only bump `wrong_attempts`; the player may retry until timeout.
+        """
+        question = self.current
+        if question is None:
+            return False
+        if selected == question["correct"]:
+            self.score += self.POINTS_PER_CORRECT
+            self.user_answers.append(selected)
+            self._notify(self.question_wrong_attempts == 0)
+            return True
+        self.wrong_attempts += 1
+        self.question_wrong_attempts += 1
+        return False
+
+    def tick(self):
+        """Consume one second of the countdown; returns the seconds still left."""
+        if self.time_left > 0:
+            self.time_left -= 1
+        return self.time_left
+
+    def remaining(self):
+        """Exact seconds left on the deadline (float, never negative)."""
+        if self.deadline is None:
+            return float(self.time_left)
+        return max(0.0, self.deadline - self.clock())
+
+    def sync_time(self):
+        """Set time_left to the whole seconds still showing (rounded up); returns it."""
+        self.time_left = math.ceil(self.remaining())
+        return self.time_left
+
+    def seconds_to_next_tick(self):
+        """Delay until the displayed second changes (the next whole-second boundary)."""
+        remaining = self.remaining()
+        fraction = remaining - math.floor(remaining)
+        return fraction if fraction > 0 else 1.0
+
+    def timeout(self):
+        """Record the current question as unanswered and grow the hangman by one part."""
+        self.user_answers.append(self.TIMEOUT_ANSWER)
+        self.wrong_answers += 1
+        self._notify(False)
+
+    def _notify(self, first_try):
+        for listener in self.result_listeners:
+            listener(self, first_try)
+
+    def advance(self):
+        """Move to the next question; returns True when the session is finished."""
+        self.current_question += 1
+        if not self.finished:
+            self.begin_question()
+        return self.finished
+
+    def summary(self):
+        """Plain-dict snapshot of the session outcome (used by the results screen and benchmarks)."""
+        total = self.total_questions
+        correct = self.correct_answers
+        return {
+            "language": self.selected_language,
+            "level": self.selected_level,
+            "total": total,
+            "correct": correct,
+            "score": self.score,
+            "timeouts": self.wrong_answers,
+            "accuracy": (correct / total) * 100 if total else 0.0,
+            "perfect": self.perfect,
+            "lost": self.hangman_complete,
+        }
@@ -0,0 +1,193 @@
+# render_stats.py
+"""
+In-process render-latency histograms, one per screen.
+
+instrument_screens(cls) routes the screen methods of a class (show_start_screen,
+show_question, show_results, the overlays, ...) through a small dispatcher, once, at
+import. Wrapping the class rather than an instance means callbacks bound before timing
+was switched on (Tk command=, scheduler callbacks) are timed as well.
+RenderStats.attach(game) switches timing on for one game object. Each call then
+records the time from entering the method until Tk is next idle. The end is marked by
+an after_idle callback queued once the screen is built, so it runs after the redraws
+the build queued. A screen method called from inside another one (show_question ->
+show_results when the last question is answered) is part of the outer span and is not
+recorded on its own, so no time is counted twice. Latencies go into fixed-bucket
+histograms, so memory stays constant however long the kiosk runs. p50/p95/p99 are read
+from the buckets; each is the upper edge of the bucket holding that rank, capped at the
+largest latency seen.
+
+While no RenderStats is attached, the dispatcher only checks that and calls the
+method, and nothing is measured. detach() switches timing off again.
+
+In the game, F12 switches collection on and, once it is on, shows the report.
+Ctrl+F12 dumps it to render_stats.json. HANGMAN_RENDER_STATS=1 collects from startup.
+
+Usage examples:
+    HANGMAN_RENDER_STATS=1 python hangman_game.py
+    python render_stats.py render_stats.json
+"""
+
+import argparse
+import bisect
+import functools
+import json
+import math
+import time
+from pathlib import Path
+
+DEFAULT_RENDER_STATS_OUTPUT = Path("render_stats.json")
+
+# Screen builders and overlays that are timed
+SCREENS = (
+    "show_start_screen",
+    "show_welcome_screen",
+    "show_language_selection",
+    "show_level_selection",
+    "show_ready_screen",
+    "show_question",
+    "show_results",
+    "show_timeout_message",
+    "show_correct_answer",
+)
+
+# Upper bucket edges in ms; one more bucket holds everything slower
+BUCKET_EDGES_MS = (1, 2, 4, 8, 16, 33, 50, 100, 200, 500, 1000, 2000)
+
+
+class LatencyHistogram:
+    """Counts of latencies per fixed bucket, plus count, sum and max."""
+
+    __slots__ = ("counts", "count", "total_ms", "max_ms")
+
+    def __init__(self):
+        self.counts = [0] * (len(BUCKET_EDGES_MS) + 1)
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+    def record(self, ms):
+        self.counts[bisect.bisect_left(BUCKET_EDGES_MS, ms)] += 1
+        self.count += 1
+        self.total_ms += ms
+        if ms > self.max_ms:
+            self.max_ms = ms
+
+    def percentile(self, p):
+        """Upper edge of the bucket holding the p-th percentile (capped at the max seen)."""
+        if not self.count:
+            return None
+        rank = max(1, math.ceil(p / 100 * self.count))
+        seen = 0
+        for i, n in enumerate(self.counts):
+            seen += n
+            if seen >= rank:
+                edge = BUCKET_EDGES_MS[i] if i < len(BUCKET_EDGES_MS) else self.max_ms
+                return min(edge, self.max_ms)
+        return self.max_ms
+
+    def to_dict(self):
+        return {
+            "count": self.count,
+            "mean_ms": round(self.total_ms / self.count, 3) if self.count else None,
+            "max_ms": round(self.max_ms, 3),
+            "p50_ms": self.percentile(50),
+            "p95_ms": self.percentile(95),
+            "p99_ms": self.percentile(99),
+            "buckets_ms": list(BUCKET_EDGES_MS) + ["inf"],
+            "counts": list(self.counts),
+        }
+
+
+def instrument_screens(cls, names=SCREENS):
+    """Route `cls`'s screen methods through RenderStats; returns `cls` (usable as a decorator)."""
+    for name in names:
+        method = cls.__dict__.get(name)
+        if method is not None:
+            setattr(cls, name, _dispatcher(name, method))
+    return cls
+
+
+def _dispatcher(name, method):
+    @functools.wraps(method)
+    def dispatch(self, *args, **kwargs):
+        stats = getattr(self, "render_stats", None)
+        if stats is None or stats._attached is not self:
+            return method(self, *args, **kwargs)
+        return stats.timed_call(name, method, self, *args, **kwargs)
+    return dispatch
+
+
+class RenderStats:
+    """Per-screen LatencyHistograms, fed by the screen dispatchers while attached to a game."""
+
+    def __init__(self, after_idle, clock=time.perf_counter):
+        self.after_idle = after_idle  # root.after_idle: runs a callback once Tk is idle
+        self.clock = clock
+        self.histograms = {}
+        self._attached = None
+        self._depth = 0  # screen methods currently running; only the outermost is timed
+
+    @property
+    def enabled(self):
+        return self._attached is not None
+
+    def attach(self, game):
+        """Start timing `game`'s screen methods (its class must be instrument_screens'd)."""
+        if self._attached is None:
+            self._attached = game
+
+    def detach(self):
+        """Stop timing."""
+        self._attached = None
+
+    def timed_call(self, name, method, *args, **kwargs):
+        """Call a screen method; unless it runs inside another one, time it until Tk is idle."""
+        clock = self.clock
+        started = clock()
+        self._depth += 1
+        try:
+            return method(*args, **kwargs)
+        finally:
+            self._depth -= 1
+            if not self._depth:
+                histogram = self.histograms.get(name)
+                if histogram is None:
+                    histogram = self.histograms[name] = LatencyHistogram()
+                self.after_idle(lambda: histogram.record((clock() - started) * 1000))
+
+    def to_dict(self):
+        return {name: histogram.to_dict() for name, histogram in self.histograms.items() if histogram.count}
+
+    def report(self):
+        """Table of count, mean, p50, p95, p99 and max per screen (ms)."""
+        return format_report(self.to_dict())
+
+    def dump(self, path=DEFAULT_RENDER_STATS_OUTPUT):
+        path = Path(path)
+        path.write_text(json.dumps({"timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"), "screens": self.to_dict()},
+                                   indent=2) + "\n", encoding="utf-8")
+        return path
+
+
+def format_report(screens):
+    if not screens:
+        return "No screens timed yet."
+    width = max(len("Screen"), max(len(name) for name in screens))
+    lines = [f"{'Screen':<{width}}{'n':>6}{'mean':>9}{'p50':>7}{'p95':>7}{'p99':>7}{'max':>9}"]
+    for name, h in screens.items():
+        lines.append(f"{name:<{width}}{h['count']:>6}{h['mean_ms']:>9.1f}{h['p50_ms']:>7.1f}{h['p95_ms']:>7.1f}"
+                     f"{h['p99_ms']:>7.1f}{h['max_ms']:>9.1f}")
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Show a dumped render-latency report")
+    parser.add_argument("path", nargs="?", default=str(DEFAULT_RENDER_STATS_OUTPUT))
+    args = parser.parse_args(argv)
+    data = json.loads(Path(args.path).read_text(encoding="utf-8"))
+    print(f"{args.path} ({data.get('timestamp', '?')}), latencies in ms")
+    print(format_report(data["screens"]))
+
+
+if __name__ == "__main__":
+    main()
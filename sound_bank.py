@@ -0,0 +1,403 @@
+# sound_bank.py
+"""
+Sound effects, loaded in the background in priority order.
+
+Decoding every mp3 with pygame.mixer.Sound used to happen in HangmanMCQGame.__init__,
+before the first window was drawn. SoundBank instead starts a daemon thread that loads
+the cues one by one in LOAD_ORDER: the start jingle first, the per-question cues next,
+and the long results cues (celebration, crying) last, since they are needed minutes
+later. get() loads a cue on the spot if the thread has not reached it yet, so a sound
+is never missing just because it was asked for early. Each cue has its own lock, so
+it is decoded only once and waiting for it never blocks other cues.
+
+A cue with no readable file falls back to a synthesized beep. All the beeps that are
+needed are synthesized together in one vectorized numpy pass, with raised-cosine
+attack and release ramps so they do not click, and written to WAV files keyed by
+their parameters:
+
+    cache/sounds/tone-<freq>hz-<duration>ms-<blake2b of the synthesis parameters>.wav
+
+Later launches load those files and need no synthesis (numpy is only needed to create
+them). Loading a WAV also lets the mixer convert it to its own rate and channel count.
+
+Decoding the mp3 assets is most of the loading time, so the first time an mp3 is
+loaded its decoded samples (Sound.get_raw(), already in the mixer's format) are also
+written out as a WAV file, keyed by a hash of the mp3's contents and the mixer settings:
+
+    cache/sounds/pcm/<name>-<blake2b of mp3 contents + mixer frequency/format/channels>.wav
+
+Later launches load that file instead, with no MP3 decoding and no resampling. A
+changed asset or different mixer settings give a new key. The loader thread hands the
+cues, in priority order, to a small thread pool, so a cold cache transcodes several
+files at once.
+
+Usage examples:
+    python sound_bank.py
+    python sound_bank.py --sounds-dir assets/files/sounds
+    python sound_bank.py --tone-cache-dir cache/sounds
+    python sound_bank.py --pcm-cache-dir cache/sounds/pcm --workers 4
+"""
+
+import argparse
+import hashlib
+import math
+import os
+import threading
+import time
+import wave
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+DEFAULT_SOUNDS_DIR = Path("assets/files/sounds")
+
+# Cue name -> candidate files (first one that loads wins)
+SOUND_FILES = {
+    'start': ["start.wav", "start.mp3"],
+    'countdown': ["countdown.wav", "countdown.mp3"],
+    'alert': ["alert.wav", "alert.mp3"],
+    'celebration': ["celebration.wav", "celebration.mp3"],
+    'crying': ["crying.wav", "crying.mp3"],
+    'coin': ["coin.wav", "coin.mp3"],
+    'wrong': ["wrong.wav", "wrong.mp3"],
+}
+
+# Background loading order: what the player hears first comes first
+LOAD_ORDER = ("start", "countdown", "wrong", "coin", "alert", "celebration", "crying")
+
+# Cue name -> (frequency Hz, duration ms) of the beep used when no file loads
+FALLBACK_TONES = {
+    'start': (700, 300),
+    'countdown': (1200, 80),   # short high tick for each second
+    'alert': (900, 120),
+    'celebration': (600, 500),
+    'crying': (300, 800),
+    'coin': (1100, 120),
+    'wrong': (350, 220),
+}
+
+
+DEFAULT_PCM_CACHE_DIR = Path("cache/sounds/pcm")
+DEFAULT_LOAD_WORKERS = min(4, os.cpu_count() or 1)
+
+# Beep synthesis parameters (part of every cached tone's key)
+TONE_CACHE_VERSION = 1
+DEFAULT_TONE_CACHE_DIR = Path("cache/sounds")
+TONE_SAMPLE_RATE = 22050  # used when the mixer is not initialized
+TONE_AMPLITUDE = 0.5
+ATTACK_MS = 5.0
+RELEASE_MS = 30.0
+
+
+def mixer_sample_rate():
+    """The mixer's output rate (so cached tones need no resampling), or TONE_SAMPLE_RATE."""
+    try:
+        import pygame
+        return pygame.mixer.get_init()[0]
+    except Exception:
+        return TONE_SAMPLE_RATE
+
+
+def synthesize_tones(tones, sample_rate=TONE_SAMPLE_RATE):
+    """name -> int16 mono samples for every (frequency Hz, duration ms) in `tones`.
+
+    The tones are written back to back into one int16 array and returned as views of
+    it. Each is a sine shaped by raised-cosine attack and release ramps. The ramp gains
+    are computed once and applied to the first and last samples of each tone only, and
+    one float scratch buffer is reused for every tone, so the per-tone work is a
+    multiply, a sine and a scale with no temporary arrays.
+    """
+    import numpy as np
+    names = list(tones)
+    if not names:
+        return {}
+    lengths = [int(tones[name][1] * sample_rate / 1000) for name in names]
+    ends = np.cumsum(lengths)
+    out = np.empty(int(ends[-1]), dtype=np.int16)
+    times = np.arange(max(lengths), dtype=np.float64)
+    scratch = np.empty(len(times), dtype=np.float64)
+    attack = max(1.0, ATTACK_MS * sample_rate / 1000)
+    release = max(1.0, RELEASE_MS * sample_rate / 1000)
+
+    def gains(ramp):
+        return np.where(ramp < 1.0, 0.5 - 0.5 * np.cos(np.pi * np.minimum(ramp, 1.0)), 1.0)
+
+    # Only the first `head` and last `tail` samples of a tone can be below full gain, and
+    # those gains do not depend on its length unless the two ramps overlap
+    head, tail = math.ceil(attack), math.ceil(release) + 1
+    head_gain = gains(np.arange(head) / attack)
+    tail_gain = gains(np.arange(tail, 0, -1) / release)
+    samples = {}
+    for name, length, end in zip(names, lengths, ends.tolist()):
+        buf = scratch[:length]
+        np.multiply(times[:length], tones[name][0] * (2 * np.pi / sample_rate), out=buf)
+        np.sin(buf, out=buf)
+        if head + tail < length:
+            buf[:head] *= head_gain
+            buf[length - tail:] *= tail_gain
+        else:
+            t = times[:length]
+            buf *= gains(np.minimum(t / attack, (length - t) / release))
+        buf *= 32767 * TONE_AMPLITUDE
+        tone = out[end - length:end]
+        tone[:] = buf  # truncates toward zero, like astype(np.int16)
+        samples[name] = tone
+    return samples
+
+
+def write_wav(path, samples, sample_rate):
+    """Write int16 mono samples to a WAV file (atomically)."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    with wave.open(str(tmp), "wb") as f:
+        f.setnchannels(1)
+        f.setsampwidth(2)
+        f.setframerate(sample_rate)
+        f.writeframes(samples.tobytes())
+    os.replace(tmp, path)
+
+
+class ToneCache:
+    """Synthesized beeps as WAV files, keyed by their synthesis parameters."""
+
+    def __init__(self, cache_dir=DEFAULT_TONE_CACHE_DIR, sample_rate=TONE_SAMPLE_RATE):
+        self.cache_dir = Path(cache_dir)
+        self.sample_rate = sample_rate
+        self.synthesized = 0  # tones created by this cache (not found on disk)
+
+    def path_for(self, tone):
+        freq, duration_ms = tone
+        params = (TONE_CACHE_VERSION, freq, duration_ms, self.sample_rate, TONE_AMPLITUDE, ATTACK_MS, RELEASE_MS)
+        key = hashlib.blake2b(repr(params).encode("utf-8"), digest_size=8).hexdigest()
+        return self.cache_dir / f"tone-{freq}hz-{duration_ms}ms-{key}.wav"
+
+    def ensure(self, tones):
+        """name -> WAV path for every tone in `tones`, synthesizing the missing ones in one batch.
+
+        Tones that cannot be created (no numpy, unwritable cache) are left out.
+        """
+        paths = {name: self.path_for(tone) for name, tone in tones.items()}
+        missing = {name: tones[name] for name, path in paths.items() if not path.exists()}
+        if missing:
+            try:
+                for name, samples in synthesize_tones(missing, self.sample_rate).items():
+                    write_wav(paths[name], samples, self.sample_rate)
+                    self.synthesized += 1
+            except Exception as e:
+                print(f"Could not synthesize fallback sounds: {e}")
+        return {name: path for name, path in paths.items() if path.exists()}
+
+
+def load_sound(path):
+    """pygame Sound from a file (pygame is imported on first use, by the game's mixer init)."""
+    import pygame
+    return pygame.mixer.Sound(str(path))
+
+
+def mixer_settings():
+    """(frequency, format, channels) of the initialized mixer, or None."""
+    try:
+        import pygame
+        return pygame.mixer.get_init()
+    except Exception:
+        return None
+
+
+class PcmCache:
+    """Decoded copies of compressed sound files, as WAVs in the mixer's own format."""
+
+    def __init__(self, cache_dir=DEFAULT_PCM_CACHE_DIR, settings=None, decode=None):
+        self.cache_dir = Path(cache_dir)
+        self.settings = settings  # mixer (frequency, format, channels)
+        self.decode = decode or load_sound
+        self.hits = 0
+        self.transcoded = 0
+
+    def path_for(self, source):
+        source = Path(source)
+        digest = hashlib.blake2b(source.read_bytes(), digest_size=8)
+        digest.update(repr(self.settings).encode("utf-8"))
+        return self.cache_dir / f"{source.stem}-{digest.hexdigest()}.wav"
+
+    def load(self, source):
+        """Sound for `source`: from its cached WAV if there is one, else decoded and cached."""
+        source = Path(source)
+        frequency, fmt, channels = self.settings or (0, 0, 0)
+        if source.suffix.lower() == ".wav" or fmt != -16:
+            return self.decode(source)  # nothing to gain, or a format WAV cannot hold
+        path = self.path_for(source)
+        if path.exists():
+            try:
+                sound = self.decode(path)
+                self.hits += 1
+                return sound
+            except Exception:
+                pass
+        sound = self.decode(source)
+        try:
+            self.store(path, sound.get_raw(), frequency, channels)
+            self.transcoded += 1
+        except Exception as e:
+            print(f"Could not cache decoded {source.name}: {e}")
+        return sound
+
+    @staticmethod
+    def store(path, pcm, frequency, channels):
+        """Write signed 16-bit interleaved PCM as a WAV file (atomically)."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        with wave.open(str(tmp), "wb") as f:
+            f.setnchannels(channels)
+            f.setsampwidth(2)
+            f.setframerate(frequency)
+            f.writeframes(pcm)
+        os.replace(tmp, path)
+
+
+class SoundBank:
+    """Cue name -> pygame Sound (or None), filled by a background loader thread."""
+
+    def __init__(self, base_dir=DEFAULT_SOUNDS_DIR, files=SOUND_FILES, order=LOAD_ORDER,
+                 fallback_tones=FALLBACK_TONES, load_file=None, tone_cache=None,
+                 pcm_cache_dir=DEFAULT_PCM_CACHE_DIR, workers=DEFAULT_LOAD_WORKERS):
+        self.base_dir = Path(base_dir)
+        self.files = files
+        self.order = [name for name in order if name in files] + [name for name in files if name not in order]
+        self.fallback_tones = fallback_tones
+        self.load_file = load_file or self._load_file
+        self.tone_cache = tone_cache  # created on first need, at the mixer's rate
+        self.pcm_cache_dir = pcm_cache_dir  # None: always decode the mp3s
+        self.pcm_cache = None  # created on first load, for the mixer's settings
+        self.workers = workers
+        # Every cue is present from the start; None until it is loaded (or if nothing loads)
+        self.sounds = dict.fromkeys(self.order)
+        self.load_seconds = {}   # cue -> time spent loading it
+        self._ready = set()
+        self._locks = {name: threading.Lock() for name in self.order}
+        self._cache_lock = threading.Lock()
+        self._tone_paths = None
+        self._stop = threading.Event()
+        self._thread = None
+
+    def start(self):
+        """Start loading every cue on a daemon thread; returns self."""
+        self._thread = threading.Thread(target=self._run, name="sound-loader", daemon=True)
+        self._thread.start()
+        return self
+
+    def _run(self):
+        # Tasks start in priority order; a cold PCM cache is filled by several workers at once
+        with ThreadPoolExecutor(max_workers=max(1, self.workers), thread_name_prefix="sound-loader") as pool:
+            for _ in pool.map(self._preload, self.order):
+                pass
+
+    def _preload(self, name):
+        if not self._stop.is_set():
+            self.get(name)
+
+    def _load_file(self, path):
+        if self.pcm_cache_dir is None:
+            return load_sound(path)
+        with self._cache_lock:
+            if self.pcm_cache is None:
+                self.pcm_cache = PcmCache(self.pcm_cache_dir, mixer_settings())
+        return self.pcm_cache.load(path)
+
+    def is_ready(self, name):
+        return name in self._ready
+
+    def get(self, name):
+        """The Sound for `name` (None if it has none), loading it now if needed."""
+        if name in self._ready:
+            return self.sounds.get(name)
+        lock = self._locks.get(name)
+        if lock is None:
+            return None
+        with lock:
+            if name not in self._ready:
+                started = time.perf_counter()
+                self.sounds[name] = self._load(name)
+                self.load_seconds[name] = time.perf_counter() - started
+                self._ready.add(name)
+        return self.sounds[name]
+
+    def _has_file(self, name):
+        return any((self.base_dir / fname).exists() for fname in self.files[name])
+
+    def _tone_path(self, name):
+        """Cached beep for `name`. The first call creates the beeps of every cue without a file."""
+        with self._cache_lock:
+            if self.tone_cache is None:
+                self.tone_cache = ToneCache(sample_rate=mixer_sample_rate())
+            if self._tone_paths is None:
+                self._tone_paths = self.tone_cache.ensure({
+                    cue: tone for cue, tone in self.fallback_tones.items()
+                    if cue in self.files and not self._has_file(cue)})
+            if name not in self._tone_paths and name in self.fallback_tones:
+                # Its file exists but could not be loaded
+                self._tone_paths.update(self.tone_cache.ensure({name: self.fallback_tones[name]}))
+            return self._tone_paths.get(name)
+
+    def _load(self, name):
+        for fname in self.files[name]:
+            path = self.base_dir / fname
+            if path.exists():
+                try:
+                    return self.load_file(path)
+                except Exception:
+                    pass
+        path = self._tone_path(name) if name in self.fallback_tones else None
+        if path is None:
+            return None
+        try:
+            return self.load_file(path)
+        except Exception:
+            return None
+
+    def wait(self, timeout=None):
+        """Block until the loader thread has finished (True) or `timeout` passes."""
+        if self._thread is not None:
+            self._thread.join(timeout)
+            return not self._thread.is_alive()
+        return True
+
+    def stop(self):
+        """Let the loader thread finish after the cue it is loading."""
+        self._stop.set()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Load the game's sound cues and report timings")
+    parser.add_argument("--sounds-dir", default=str(DEFAULT_SOUNDS_DIR), help="Directory with the sound files")
+    parser.add_argument("--tone-cache-dir", default=str(DEFAULT_TONE_CACHE_DIR), help="Cache of synthesized beeps")
+    parser.add_argument("--pcm-cache-dir", default=str(DEFAULT_PCM_CACHE_DIR), help="Cache of decoded mp3s")
+    parser.add_argument("--no-pcm-cache", action="store_true", help="Decode the mp3s without the cache")
+    parser.add_argument("--workers", type=int, default=DEFAULT_LOAD_WORKERS, help="Parallel loader threads")
+    args = parser.parse_args(argv)
+
+    try:
+        import pygame
+    except ImportError:
+        print("pygame is not installed")
+        return
+    try:
+        pygame.mixer.init()
+    except Exception as e:
+        print(f"Cannot initialize the mixer: {e}")
+        return
+    started = time.perf_counter()
+    bank = SoundBank(args.sounds_dir, tone_cache=ToneCache(args.tone_cache_dir, mixer_sample_rate()),
+                     pcm_cache_dir=None if args.no_pcm_cache else args.pcm_cache_dir, workers=args.workers).start()
+    bank.wait()
+    total = time.perf_counter() - started
+    for name in bank.order:
+        sound = bank.sounds[name]
+        length = f"{sound.get_length():.2f} s" if sound is not None else "-"
+        print(f"{name:<12}{bank.load_seconds[name] * 1000:>9.1f} ms  {length}")
+    print(f"total {total * 1000:.1f} ms ({bank.tone_cache.synthesized if bank.tone_cache else 0} beeps synthesized)")
+    if bank.pcm_cache is not None:
+        print(f"pcm cache: {bank.pcm_cache.hits} hits, {bank.pcm_cache.transcoded} transcoded")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,258 @@
+# spaced_repetition.py
+"""
+Per-player spaced-repetition scheduling of questions.
+
+Each (player, question) pair has a review state: when it is next due, the current
+interval, an ease factor and repetition/lapse counts. A correct first-try answer
+stretches the interval (1 day, 3 days, then interval x ease); a wrong-first answer
+or a timeout resets it to a short relearning step and lowers the ease (SM-2 style).
+
+Questions are identified by (subject, level, position in the level), with a CRC of
+the question text stored alongside. due() checks that CRC against the question now at
+that position, so entries left stale by bank edits (a question reworded, removed or
+moved) are dropped instead of serving another question on their schedule.
+For every (subject, level) the player's states sit in a min-heap keyed by due time,
+so select_level can pull the next due questions in O(log n) each. Superseded heap
+entries are skipped when popped, and the heap is rebuilt once they outnumber the
+live ones.
+
+Progress is stored per player (keyed by nickname) in a compact binary file:
+
+    header   magic b"HSR1", u16 version, u32 group count
+    groups   u16 len + utf-8 subject, u16 len + utf-8 level, u32 record count,
+             then records of <u32 index, u32 crc, f64 due, f32 interval days,
+             f32 ease, u16 reps, u16 lapses> (28 bytes each)
+
+so thousands of reviewed items load with one struct.iter_unpack per level.
+
+Usage examples:
+    python spaced_repetition.py Alice
+    python spaced_repetition.py Alice --progress-dir progress
+"""
+
+import argparse
+import heapq
+import os
+import re
+import struct
+import time
+import zlib
+from pathlib import Path
+
+MAGIC = b"HSR1"
+VERSION = 1
+DEFAULT_PROGRESS_DIR = Path("progress")
+
+DAY = 86400.0
+RELEARN_SECONDS = 600.0
+MIN_EASE = 1.3
+START_EASE = 2.5
+
+_HEADER = struct.Struct("<4sHI")
+_U16 = struct.Struct("<H")
+_U32 = struct.Struct("<I")
+_RECORD = struct.Struct("<IIdffHH")
+
+
+def question_crc(question):
+    return zlib.crc32(question["question"].encode("utf-8"))
+
+
+class ReviewState:
+    __slots__ = ("crc", "due", "interval", "ease", "reps", "lapses")
+
+    def __init__(self, crc, due, interval=0.0, ease=START_EASE, reps=0, lapses=0):
+        self.crc = crc
+        self.due = due
+        self.interval = interval
+        self.ease = ease
+        self.reps = reps
+        self.lapses = lapses
+
+    def review(self, first_try, now):
+        """Apply one result (SM-2 style) and set the next due time."""
+        if first_try:
+            self.reps += 1
+            if self.reps == 1:
+                self.interval = 1.0
+            elif self.reps == 2:
+                self.interval = 3.0
+            else:
+                self.interval *= self.ease
+            self.ease += 0.1
+            self.due = now + self.interval * DAY
+        else:
+            self.reps = 0
+            self.lapses += 1
+            self.interval = 0.0
+            self.ease = max(MIN_EASE, self.ease - 0.2)
+            self.due = now + RELEARN_SECONDS
+
+
+class PlayerReviews:
+    """One player's review states, with a due-time min-heap per (subject, level)."""
+
+    def __init__(self):
+        self.states = {}  # (subject, level) -> {index: ReviewState}
+        self.heaps = {}   # (subject, level) -> [(due, index)], may hold stale entries
+        self.dirty = False
+
+    def record(self, subject, level, index, question, first_try, now):
+        group = self.states.setdefault((subject, level), {})
+        crc = question_crc(question)
+        state = group.get(index)
+        if state is None or state.crc != crc:
+            state = group[index] = ReviewState(crc, now)
+        state.review(first_try, now)
+        heap = self.heaps.setdefault((subject, level), [])
+        heapq.heappush(heap, (state.due, index))
+        self._compact(heap, group)
+        self.dirty = True
+        return state
+
+    def due(self, subject, level, n, now, pool=None):
+        """Up to `n` pool positions due by `now`, most overdue first.
+
+        With `pool` (the level's current questions), entries whose position is gone or
+        now holds a different question are dropped from the player's states.
+        """
+        heap = self.heaps.get((subject, level))
+        group = self.states.get((subject, level), {})
+        if not heap:
+            return []
+        picked = []
+        seen = set()
+        while heap and len(picked) < n and heap[0][0] <= now:
+            due, index = heapq.heappop(heap)
+            state = group.get(index)
+            if state is None or state.due != due or index in seen:
+                continue  # superseded by a later review
+            if pool is not None and (index >= len(pool) or question_crc(pool[index]) != state.crc):
+                del group[index]  # the bank was edited since this was reviewed
+                self.dirty = True
+                continue
+            seen.add(index)
+            picked.append(index)
+        # Still scheduled until they are actually reviewed again
+        for index in picked:
+            heapq.heappush(heap, (group[index].due, index))
+        self._compact(heap, group)
+        return picked
+
+    @staticmethod
+    def _compact(heap, group):
+        """Rebuild `heap` from the live states once superseded entries outnumber them."""
+        if len(heap) > 2 * len(group) + 16:
+            heap[:] = [(state.due, index) for index, state in group.items()]
+            heapq.heapify(heap)
+
+    # Persistence --------------------------------------------------------
+    def to_bytes(self):
+        groups = [(key, group) for key, group in self.states.items() if group]
+        parts = [_HEADER.pack(MAGIC, VERSION, len(groups))]
+        for (subject, level), group in groups:
+            for name in (subject, level):
+                raw = name.encode("utf-8")
+                parts.append(_U16.pack(len(raw)) + raw)
+            parts.append(_U32.pack(len(group)))
+            parts.append(b"".join(
+                _RECORD.pack(i, s.crc, s.due, s.interval, s.ease, s.reps, s.lapses) for i, s in group.items()))
+        return b"".join(parts)
+
+    @classmethod
+    def from_bytes(cls, data):
+        reviews = cls()
+        magic, version, n_groups = _HEADER.unpack_from(data, 0)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError("not a spaced-repetition progress file")
+        pos = _HEADER.size
+        for _ in range(n_groups):
+            names = []
+            for _ in range(2):
+                (length,) = _U16.unpack_from(data, pos)
+                pos += _U16.size
+                names.append(data[pos:pos + length].decode("utf-8"))
+                pos += length
+            (count,) = _U32.unpack_from(data, pos)
+            pos += _U32.size
+            end = pos + count * _RECORD.size
+            group = {}
+            heap = []
+            for i, crc, due, interval, ease, reps, lapses in _RECORD.iter_unpack(data[pos:end]):
+                group[i] = ReviewState(crc, due, interval, ease, reps, lapses)
+                heap.append((due, i))
+            heapq.heapify(heap)
+            key = tuple(names)
+            reviews.states[key] = group
+            reviews.heaps[key] = heap
+            pos = end
+        return reviews
+
+
+class ReviewScheduler:
+    """Loads/saves PlayerReviews per nickname and answers due-question queries."""
+
+    def __init__(self, progress_dir=DEFAULT_PROGRESS_DIR, clock=time.time):
+        self.progress_dir = Path(progress_dir)
+        self.clock = clock
+        self._players = {}
+
+    def path_for(self, nickname):
+        slug = re.sub(r"[^A-Za-z0-9]+", "_", nickname).strip("_")[:40] or "player"
+        return self.progress_dir / f"{slug}-{zlib.crc32(nickname.encode('utf-8')):08x}.hsr"
+
+    def player(self, nickname):
+        reviews = self._players.get(nickname)
+        if reviews is None:
+            path = self.path_for(nickname)
+            try:
+                reviews = PlayerReviews.from_bytes(path.read_bytes())
+            except FileNotFoundError:
+                reviews = PlayerReviews()
+            except Exception as e:
+                print(f"Could not read progress file {path}: {e}")
+                reviews = PlayerReviews()
+            self._players[nickname] = reviews
+        return reviews
+
+    def due(self, nickname, subject, level, n, pool=None):
+        return self.player(nickname).due(subject, level, n, self.clock(), pool)
+
+    def record(self, nickname, subject, level, index, question, first_try):
+        return self.player(nickname).record(subject, level, index, question, first_try, self.clock())
+
+    def save(self, nickname):
+        """Write the player's progress atomically (no-op when nothing changed)."""
+        reviews = self._players.get(nickname)
+        if reviews is None or not reviews.dirty:
+            return
+        path = self.path_for(nickname)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(".tmp")
+        tmp.write_bytes(reviews.to_bytes())
+        os.replace(tmp, path)
+        reviews.dirty = False
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="spaced_repetition.py", description="Show a player's review schedule")
+    parser.add_argument("nickname", help="Player nickname")
+    parser.add_argument("--progress-dir", default=str(DEFAULT_PROGRESS_DIR), help="Directory of progress files")
+    args = parser.parse_args(argv)
+
+    scheduler = ReviewScheduler(args.progress_dir)
+    reviews = scheduler.player(args.nickname)
+    now = scheduler.clock()
+    if not reviews.states:
+        print(f"No reviews recorded for {args.nickname}")
+        return
+    print(f"{'Subject':<14}{'Level':<14}{'Reviewed':>9}{'Due now':>9}  Next due")
+    for (subject, level), group in sorted(reviews.states.items()):
+        due_now = sum(1 for s in group.values() if s.due <= now)
+        upcoming = min((s.due for s in group.values() if s.due > now), default=None)
+        when = time.strftime("%Y-%m-%d %H:%M", time.localtime(upcoming)) if upcoming else "-"
+        print(f"{subject:<14}{level:<14}{len(group):>9}{due_now:>9}  {when}")
+
+
+if __name__ == "__main__":
+    main()
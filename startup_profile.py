@@ -0,0 +1,235 @@
+# startup_profile.py
+"""
+Per-phase startup timings for `python hangman_game.py --profile-startup`.
+
+HangmanMCQGame.__init__ wraps each startup phase in profile.phase(name): importing
+pygame, pygame.mixer.init(), tk.Tk(), load_questions, load_sounds and the first
+show_start_screen. The entry point adds the game module's own imports and the first
+root.update(), which is when the start screen is actually drawn. Phases are timed with
+time.perf_counter_ns. Without a profile the game uses NO_PROFILE, whose phase() does
+nothing.
+
+ImportTimer splits import time per module. While installed it wraps builtins.__import__
+and times each top-level module the first time it is imported, excluding the other
+top-level modules it imports in turn, which get entries of their own (numpy under
+pygame, for instance). Standard-library modules count towards whoever imported them. The game's own imports become "import <module>" phases. Imports
+made later, inside a phase (pygame in "import pygame", cv2 or PIL on first use), are
+listed under the phase table with the phase they happened in.
+
+The report is printed as a table and saved as JSON together with the machine and Python
+version, so runs from different releases and machines can be compared:
+
+    {"label": ..., "timestamp": ..., "machine": {...}, "total_ms": ...,
+     "phases": [{"name": "tk.Tk", "ms": 41.2}, ...],
+     "imports": [{"name": "numpy", "ms": 35.3, "phase": "import pygame"}, ...]}
+
+Usage examples:
+    python hangman_game.py --profile-startup
+    python hangman_game.py --profile-startup --profile-output profiles/kiosk-3.json --profile-exit
+    python startup_profile.py show profiles/kiosk-3.json
+    python startup_profile.py compare profiles/v1.json profiles/v2.json
+"""
+
+import argparse
+import builtins
+import json
+import os
+import platform
+import sys
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+from pathlib import Path
+
+DEFAULT_PROFILE_OUTPUT = Path("startup_profile.json")
+
+
+class StartupProfile:
+    """Ordered (phase name, seconds) timings."""
+
+    def __init__(self, label="", clock=time.perf_counter_ns):
+        self.label = label
+        self.clock = clock
+        self.phases = []
+        self.imports = []  # (module, seconds, phase it happened in), already counted in that phase
+        self.current = None
+
+    @contextmanager
+    def phase(self, name):
+        outer, self.current = self.current, name
+        started = self.clock()
+        try:
+            yield
+        finally:
+            self.add(name, (self.clock() - started) / 1e9)
+            self.current = outer
+
+    def add(self, name, seconds):
+        self.phases.append((name, seconds))
+
+    def add_import(self, module, seconds, phase=None):
+        self.imports.append((module, seconds, phase if phase is not None else self.current))
+
+    def total(self):
+        return sum(seconds for _, seconds in self.phases)
+
+    def table(self):
+        total = self.total() or 1.0
+        width = max([len("Phase")] + [len(name) for name, _ in self.phases])
+        lines = [f"{'Phase':<{width}}  {'ms':>9}  {'share':>6}"]
+        for name, seconds in self.phases:
+            lines.append(f"{name:<{width}}  {seconds * 1000:>9.1f}  {seconds / total:>6.1%}")
+        lines.append(f"{'total':<{width}}  {self.total() * 1000:>9.1f}")
+        if self.imports:
+            width = max([len("Import")] + [len(module) for module, _, _ in self.imports])
+            lines += ["", f"{'Import':<{width}}  {'ms':>9}  during"]
+            for module, seconds, phase in self.imports:
+                lines.append(f"{module:<{width}}  {seconds * 1000:>9.1f}  {phase or '-'}")
+        return "\n".join(lines)
+
+    def to_dict(self):
+        return {
+            "label": self.label,
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+            "machine": {
+                "host": platform.node(),
+                "platform": platform.platform(),
+                "python": platform.python_version(),
+                "cpus": os.cpu_count(),
+            },
+            "total_ms": round(self.total() * 1000, 3),
+            "phases": [{"name": name, "ms": round(seconds * 1000, 3)} for name, seconds in self.phases],
+            "imports": [{"name": module, "ms": round(seconds * 1000, 3), "phase": phase}
+                        for module, seconds, phase in self.imports],
+        }
+
+    def save(self, path=DEFAULT_PROFILE_OUTPUT):
+        path = Path(path)
+        if path.parent != Path("."):
+            path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(self.to_dict(), indent=2) + "\n", encoding="utf-8")
+        return path
+
+    @classmethod
+    def load(cls, path):
+        data = json.loads(Path(path).read_text(encoding="utf-8"))
+        profile = cls(data.get("label", ""))
+        for entry in data["phases"]:
+            profile.add(entry["name"], entry["ms"] / 1000)
+        for entry in data.get("imports", ()):
+            profile.add_import(entry["name"], entry["ms"] / 1000, entry.get("phase"))
+        return profile, data
+
+
+class _NoProfile:
+    """Stand-in when startup is not being profiled: phase() costs one call."""
+
+    def phase(self, name):
+        return nullcontext()
+
+    def add(self, name, seconds):
+        pass
+
+
+NO_PROFILE = _NoProfile()
+
+# Standard-library imports are not listed on their own; they count towards the importer
+_STDLIB = frozenset(getattr(sys, "stdlib_module_names", ()))
+
+
+class ImportTimer:
+    """Per-module import times, measured by wrapping builtins.__import__ while installed.
+
+    `entries` holds (module, seconds) for each top-level module imported for the first
+    time, in the order they finished, except standard-library modules, whose time counts
+    towards the module importing them. Seconds exclude nested entries, so the entries
+    add up to the time spent importing. Once `profile` is set, new entries go to
+    profile.add_import instead. Imports on other threads are tagged "(background)".
+    """
+
+    def __init__(self, clock=time.perf_counter_ns):
+        self.clock = clock
+        self.entries = []
+        self.profile = None
+        self._local = threading.local()  # per-thread stack of nested-import time, ns
+        self._original = None
+
+    def install(self):
+        if self._original is None:
+            self._original = builtins.__import__
+            builtins.__import__ = self._import
+        return self
+
+    def uninstall(self):
+        if self._original is not None:
+            builtins.__import__ = self._original
+            self._original = None
+
+    def _import(self, name, globals=None, locals=None, fromlist=(), level=0):
+        top = name.partition(".")[0]
+        if level or top in sys.modules or top in _STDLIB:
+            return self._original(name, globals, locals, fromlist, level)
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        stack.append(0)
+        started = self.clock()
+        try:
+            return self._original(name, globals, locals, fromlist, level)
+        finally:
+            elapsed = self.clock() - started
+            nested = stack.pop()
+            if stack:
+                stack[-1] += elapsed
+            if top in sys.modules:  # not for a failed optional import
+                self._record(top, (elapsed - nested) / 1e9)
+
+    def _record(self, module, seconds):
+        if threading.current_thread() is not threading.main_thread():
+            module += " (background)"
+        if self.profile is not None:
+            self.profile.add_import(module, seconds)
+        else:
+            self.entries.append((module, seconds))
+
+
+def compare_table(before, after):
+    """Per-phase table of two profiles, with the change in ms."""
+    old = dict(before.phases)
+    new = dict(after.phases)
+    names = [name for name, _ in before.phases] + [name for name, _ in after.phases if name not in old]
+    width = max([len("Phase")] + [len(name) for name in names])
+    lines = [f"{'Phase':<{width}}  {'before':>9}  {'after':>9}  {'change':>9}"]
+    for name in names + ["total"]:
+        a = before.total() if name == "total" else old.get(name)
+        b = after.total() if name == "total" else new.get(name)
+        cells = [f"{v * 1000:>9.1f}" if v is not None else f"{'-':>9}" for v in (a, b)]
+        change = f"{(b - a) * 1000:>+9.1f}" if a is not None and b is not None else f"{'':>9}"
+        lines.append(f"{name:<{width}}  {cells[0]}  {cells[1]}  {change}")
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="startup_profile.py", description="Startup profile reports")
+    sub = parser.add_subparsers(dest="command", required=True)
+    show = sub.add_parser("show", help="Print a saved profile")
+    show.add_argument("path")
+    compare = sub.add_parser("compare", help="Compare two saved profiles phase by phase")
+    compare.add_argument("before")
+    compare.add_argument("after")
+    args = parser.parse_args(argv)
+
+    if args.command == "show":
+        profile, data = StartupProfile.load(args.path)
+        machine = data.get("machine", {})
+        print(f"{data.get('label') or args.path} ({data.get('timestamp', '?')}, {machine.get('host', '?')}, "
+              f"Python {machine.get('python', '?')})")
+        print(profile.table())
+    else:
+        before, _ = StartupProfile.load(args.before)
+        after, _ = StartupProfile.load(args.after)
+        print(compare_table(before, after))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+test_audio_channels.py
+
+Tests for mixer channel allocation: priorities, voice limits, reserved channels.
+"""
+
+import sys
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from audio_channels import ChannelManager
+
+
+class FakeChannel:
+    """Mixer channel that stays busy until finish() is called."""
+
+    def __init__(self):
+        self.sound = None
+
+    def play(self, sound):
+        self.sound = sound
+
+    def get_busy(self):
+        return self.sound is not None
+
+    def finish(self):
+        self.sound = None
+
+
+class TestChannelManager(unittest.TestCase):
+    """Important cues always get a channel; noisy cues are capped."""
+
+    def setUp(self):
+        self.channels = [FakeChannel() for _ in range(6)]
+        self.manager = ChannelManager(self.channels, reserved=2)
+
+    def test_voice_limit_restarts_oldest(self):
+        """A fourth coin in a burst restarts the first one instead of taking a fourth channel."""
+        used = [self.manager.play("coin", f"coin{i}") for i in range(4)]
+        self.assertEqual(used[:3], [2, 3, 4])
+        self.assertEqual(used[3], 2)
+        self.assertEqual(len(self.manager.voices("coin")), 3)
+        self.assertEqual(self.manager.stolen_by_cue["coin"], 1)
+
+    def test_reserved_channels_kept_for_results_cues(self):
+        """Ordinary cues never use the reserved channels, so crying always plays."""
+        for cue in ("countdown", "wrong", "wrong", "start"):
+            self.manager.play(cue, cue)
+        self.assertIsNone(self.manager.play("coin", "coin"))  # general channels full of higher cues
+        self.assertEqual(self.manager.dropped, 1)
+        self.assertEqual(self.manager.play("crying", "crying"), 0)
+        self.assertEqual(self.manager.stats()["dropped_by_cue"], {"coin": 1})
+
+    def test_steals_lowest_priority(self):
+        """When all allowed channels are busy, the oldest lowest-priority voice is cut."""
+        self.manager.play("coin", "c1")
+        self.manager.play("countdown", "tick")
+        self.manager.play("coin", "c2")
+        self.manager.play("wrong", "w1")
+        self.assertEqual(self.manager.play("start", "start"), 2)  # c1: lowest priority, oldest
+        self.assertEqual(self.manager.stats()["stolen_by_cue"], {"coin": 1})
+        self.assertIsNone(self.manager.play("coin", "c3"))  # nothing of lower priority to cut
+
+    def test_finished_channels_are_reused(self):
+        """A channel whose sound ended is free again."""
+        self.manager.play("countdown", "tick")
+        self.channels[2].finish()
+        self.manager.play("countdown", "tick")
+        self.assertEqual(self.manager.stolen, 0)
+        self.assertEqual(self.manager.plays, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
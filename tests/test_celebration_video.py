@@ -0,0 +1,354 @@
+#!/usr/bin/env python3
+"""
+test_celebration_video.py
+
+Tests for off-thread celebration clip decoding, wall-clock playback sync and the
+pre-scaled clip cache.
+"""
+
+import sys
+import tempfile
+import threading
+import time
+import unittest
+import unittest.mock
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import celebration_video
+from celebration_video import (OPENCV_AVAILABLE, CachedClipSource, ClipCacheWriter, FrameConverter, FrameRing,
+                               PlaybackSync, VideoDecoder, build_clip_cache, fit_size, open_cached_clip)
+from tick_scheduler import VirtualClock
+
+CLIP = Path(__file__).parent.parent / "assets" / "files" / "images" / "stickman-dance.mp4"
+
+
+def drain(decoder, count, timeout=10.0):
+    """Pop `count` frames (copied: decoder buffers are reused) from the decoder."""
+    frames = []
+    deadline = time.monotonic() + timeout
+    while len(frames) < count and time.monotonic() < deadline:
+        frame = decoder.next_frame()
+        if frame is None:
+            time.sleep(0.002)
+        else:
+            frames.append(frame.copy())
+    return frames
+
+
+def play(decoder, count, timeout=10.0):
+    """Poll PlaybackSync as the game's stream_frame does, for `count` timeline frames.
+
+    Time is virtual and moves by the delay poll() asks for, so the test does not wait
+    for the clip in real time; a short real sleep lets the worker catch up when no
+    frame was ready. Returns the shown frames (copied) and the sync.
+    """
+    clock = VirtualClock(100.0)
+    sync = PlaybackSync(decoder, clock=clock)
+    shown = []
+    deadline = time.monotonic() + timeout
+    while sync.next_index < count and time.monotonic() < deadline:
+        frame, delay = sync.poll()
+        if frame is None:
+            time.sleep(0.002)
+        else:
+            shown.append(frame.copy())
+        clock.advance(delay)
+    return shown, sync
+
+
+class FakeSource:
+    """Random-access frames ("frame-<i>") that only exist once `decoded` has reached them."""
+
+    fps = 10.0
+
+    def __init__(self):
+        self.decoded = 0
+        self.targets = []
+
+    def take(self, target):
+        self.targets.append(target)
+        if self.decoded == 0:
+            return None, None
+        index = min(target, self.decoded - 1)
+        return f"frame-{index}", index
+
+
+class TestFrameRing(unittest.TestCase):
+    """The ring is bounded for the producer and never blocks the consumer."""
+
+    def test_bounded_and_fifo(self):
+        """A full ring makes put() wait until a frame is taken; order is kept."""
+        ring = FrameRing(capacity=2)
+        stop = threading.Event()
+        ring.put(1, stop)
+        ring.put(2, stop)
+        worker = threading.Thread(target=ring.put, args=(3, stop))
+        worker.start()
+        worker.join(0.2)
+        self.assertTrue(worker.is_alive())
+        self.assertEqual(ring.get_nowait(), 1)
+        worker.join(1.0)
+        self.assertFalse(worker.is_alive())
+        self.assertEqual([ring.get_nowait(), ring.get_nowait(), ring.get_nowait()], [2, 3, None])
+
+    def test_stop_releases_producer(self):
+        """Setting the stop event lets a blocked producer give up."""
+        ring = FrameRing(capacity=1)
+        stop = threading.Event()
+        ring.put(1, stop)
+        result = []
+        worker = threading.Thread(target=lambda: result.append(ring.put(2, stop)))
+        worker.start()
+        stop.set()
+        ring.wake()
+        worker.join(1.0)
+        self.assertEqual(result, [False])
+
+    def test_fit_size(self):
+        """Frames are scaled down to fit the box, keeping their aspect ratio, never up."""
+        self.assertEqual(fit_size(720, 1280, 290, 390), (219, 390))
+        self.assertEqual(fit_size(100, 50, 290, 390), (100, 50))
+
+
+class TestPlaybackSync(unittest.TestCase):
+    """Frames are shown by the wall clock: overdue ones are dropped, never slowed down."""
+
+    def setUp(self):
+        self.clock = VirtualClock(100.0)
+        self.source = FakeSource()
+        self.sync = PlaybackSync(self.source, clock=self.clock)
+
+    def test_clock_starts_with_first_frame(self):
+        """Waiting for the first decoded frame does not count against the timeline."""
+        frame, delay = self.sync.poll()
+        self.assertIsNone(frame)
+        self.assertAlmostEqual(delay, 0.025)
+        self.clock.advance(0.5)
+        self.source.decoded = 100
+        frame, delay = self.sync.poll()
+        self.assertEqual(frame, "frame-0")
+        self.assertAlmostEqual(delay, 0.1)
+        self.assertEqual((self.sync.shown, self.sync.dropped, self.sync.late), (1, 0, 0))
+
+    def test_on_time_playback(self):
+        """Polling exactly when each frame is due shows every frame in turn."""
+        self.source.decoded = 100
+        frames = []
+        for _ in range(5):
+            frame, delay = self.sync.poll()
+            frames.append(frame)
+            self.clock.advance(delay)
+        self.assertEqual(frames, [f"frame-{i}" for i in range(5)])
+        self.assertEqual(self.sync.dropped, 0)
+
+    def test_slow_callback_drops_frames(self):
+        """After a 0.35 s stall the frame due now is shown and the skipped ones are counted."""
+        self.source.decoded = 100
+        self.sync.poll()
+        self.clock.advance(0.35)
+        frame, delay = self.sync.poll()
+        self.assertEqual(frame, "frame-3")
+        self.assertEqual(self.sync.dropped, 2)
+        self.assertAlmostEqual(delay, 0.05)  # frame 4 is due at 0.4 s
+
+    def test_slow_decoder_shows_late_frame(self):
+        """When the decoder lags, the newest frame is shown late and the target keeps moving."""
+        self.source.decoded = 2
+        self.sync.poll()
+        self.clock.advance(0.5)
+        frame, delay = self.sync.poll()
+        self.assertEqual(frame, "frame-1")
+        self.assertEqual(self.sync.late, 1)
+        self.assertEqual(self.sync.next_index, 6)
+        self.assertAlmostEqual(delay, 0.1)
+        self.source.decoded = 100
+        self.clock.advance(delay)
+        self.assertEqual(self.sync.poll()[0], "frame-6")
+        self.assertEqual(self.sync.dropped, 4)  # frames 2-5 were never shown
+        self.assertIn("late=1", repr(self.sync))
+
+
+@unittest.skipUnless(OPENCV_AVAILABLE, "OpenCV not available")
+class TestFrameConverter(unittest.TestCase):
+    """Scaling and colour conversion write into reused buffers."""
+
+    def test_reuses_buffers(self):
+        """Outputs cycle through the preallocated buffers and match a fresh conversion."""
+        import cv2
+        import numpy as np
+        rng = np.random.default_rng(1)
+        frames = [rng.integers(0, 255, (64, 36, 3), dtype=np.uint8) for _ in range(3)]
+        converter = FrameConverter((36, 64), (18, 32), buffers=2)
+        outputs = [converter.convert(f) for f in frames]
+        self.assertIs(outputs[0], outputs[2])
+        self.assertIsNot(outputs[0], outputs[1])
+        expected = cv2.cvtColor(cv2.resize(frames[2], (18, 32), interpolation=cv2.INTER_AREA), cv2.COLOR_BGR2RGB)
+        self.assertTrue((outputs[2] == expected).all())
+
+
+@unittest.skipUnless(OPENCV_AVAILABLE and CLIP.exists(), "OpenCV or celebration clip not available")
+class TestVideoDecoder(unittest.TestCase):
+    """The worker decodes, scales and loops the clip; stop() shuts it down."""
+
+    def test_decodes_scaled_frames_and_loops(self):
+        """Frames arrive at the fitted size and keep coming past the end of the clip."""
+        decoder = VideoDecoder(CLIP, (290, 390), capacity=4).start()
+        try:
+            frames = drain(decoder, 120)  # the clip has 105 frames
+            self.assertEqual(len(frames), 120)
+            self.assertEqual(frames[0].shape, (decoder.size[1], decoder.size[0], 3))
+            self.assertLessEqual(len(decoder.ring), 4)
+            self.assertIsNone(decoder.error)
+        finally:
+            decoder.stop()
+        self.assertFalse(decoder.running)
+
+    def test_take_skips_ahead(self):
+        """Asking for a frame far ahead makes the worker grab past the ones in between."""
+        decoder = VideoDecoder(CLIP, (290, 390), capacity=2).start()
+        try:
+            deadline = time.monotonic() + 10.0
+            index = None
+            while (index is None or index < 60) and time.monotonic() < deadline:
+                frame, index = decoder.take(60)
+                if index is None or index < 60:
+                    time.sleep(0.002)
+            self.assertIn(index, (60, 61))  # a late poll already asked for the frame after 60
+            self.assertGreater(decoder.frames_skipped, 0)
+            self.assertLess(decoder.frames_decoded, 60)
+        finally:
+            decoder.stop()
+
+    def test_take_before_start_skips_nothing(self):
+        """Polling for frame 0 before anything is decoded does not skip it."""
+        decoder = VideoDecoder(CLIP, (290, 390), capacity=2)
+        self.assertEqual(decoder.take(0), (None, None))
+        self.assertEqual(decoder._skip_to, 0)
+        decoder.start()
+        try:
+            deadline = time.monotonic() + 10.0
+            index = None
+            while index is None and time.monotonic() < deadline:
+                frame, index = decoder.take(0)
+                time.sleep(0.002)
+            self.assertEqual(index, 0)
+            self.assertEqual(decoder.frames_skipped, 0)
+        finally:
+            decoder.stop()
+
+    def test_missing_file(self):
+        """A clip that cannot be opened raises instead of starting a thread."""
+        with self.assertRaises(RuntimeError):
+            VideoDecoder(CLIP.with_name("missing.mp4"), (290, 390)).start()
+
+
+@unittest.skipUnless(celebration_video.load_numpy(), "numpy not available")
+class TestCachedClipSource(unittest.TestCase):
+    """Reading a clip cache file needs only numpy."""
+
+    def test_stop_unmaps_file(self):
+        """stop() closes the file mapping once no frame view is held."""
+        np = celebration_video.np
+        with tempfile.TemporaryDirectory() as tmp:
+            writer = ClipCacheWriter(Path(tmp) / "tiny.clip", (4, 2), 10.0)
+            for i in range(3):
+                writer.add(np.full((2, 4, 3), i, dtype=np.uint8))
+            writer.commit()
+            clip = CachedClipSource(writer.path)
+            self.assertEqual(int(clip.take(4)[0][0, 0, 0]), 1)
+            mapping = clip.frames._mmap
+            clip.stop()
+            self.assertTrue(mapping.closed)
+            self.assertEqual(clip.take(0), (None, None))
+            self.assertIsNone(clip.next_frame())
+
+
+@unittest.skipUnless(OPENCV_AVAILABLE and CLIP.exists(), "OpenCV or celebration clip not available")
+class TestClipCache(unittest.TestCase):
+    """Pre-scaled frames are cached on disk, keyed by source hash and size."""
+
+    def test_build_and_play(self):
+        """A built cache holds every frame at the fitted size and loops from memory."""
+        with tempfile.TemporaryDirectory() as tmp:
+            self.assertIsNone(open_cached_clip(CLIP, (290, 390), tmp))
+            path = build_clip_cache(CLIP, (290, 390), tmp)
+            self.assertIn("-219x390.clip", path.name)
+            clip = open_cached_clip(CLIP, (290, 390), tmp)
+            self.assertEqual(len(clip), 105)
+            self.assertEqual(clip.fps, 30.0)
+            first = clip.next_frame()
+            self.assertEqual(first.shape, (390, 219, 3))
+            for _ in range(104):
+                clip.next_frame()
+            self.assertTrue((clip.next_frame() == first).all())  # looped
+            self.assertIsNone(open_cached_clip(CLIP, (100, 100), tmp))  # other size, other key
+            frame, index = clip.take(212)
+            self.assertEqual(index, 212)
+            self.assertTrue((frame == clip.frame(2)).all())
+            clip.stop()
+            self.assertIsNone(clip.next_frame())
+
+    def test_cache_hit_needs_no_cv2(self):
+        """Once indexed, finding the cache file neither hashes the clip nor opens it with cv2."""
+        with tempfile.TemporaryDirectory() as tmp:
+            build_clip_cache(CLIP, (290, 390), tmp)
+            self.assertTrue((Path(tmp) / "index.json").exists())
+            celebration_video._clip_indexes.clear()  # as in a new process
+            with unittest.mock.patch("celebration_video.source_key", side_effect=AssertionError), \
+                    unittest.mock.patch("celebration_video.clip_frame_size", side_effect=AssertionError):
+                clip = open_cached_clip(CLIP, (290, 390), tmp)
+            self.assertEqual(len(clip), 105)
+
+    def test_index_follows_source_changes(self):
+        """A source with a new size or mtime is hashed again."""
+        with tempfile.TemporaryDirectory() as tmp:
+            source = Path(tmp) / "clip.mp4"
+            source.write_bytes(CLIP.read_bytes())
+            first = celebration_video.cached_clip_path(source, (290, 390), tmp)
+            with source.open("ab") as f:
+                f.write(b"\0")
+            second = celebration_video.cached_clip_path(source, (290, 390), tmp)
+            self.assertNotEqual(first.name, second.name)
+            self.assertTrue(second.name.endswith("-219x390.clip"))
+
+    def test_decoder_writes_cache_on_first_pass(self):
+        """Playing the clip once through leaves a cache file; stopping early leaves nothing."""
+        with tempfile.TemporaryDirectory() as tmp, tempfile.TemporaryDirectory() as built:
+            decoder = VideoDecoder(CLIP, (290, 390), capacity=4, cache_dir=tmp).start()
+            play(decoder, 20)
+            decoder.stop()
+            self.assertEqual(list(Path(tmp).glob("*.clip")), [])
+
+            decoder = VideoDecoder(CLIP, (290, 390), capacity=4, cache_dir=tmp).start()
+            try:
+                shown, sync = play(decoder, 110)
+            finally:
+                decoder.stop()
+            self.assertGreaterEqual(sync.next_index, 110)
+            expected = CachedClipSource(build_clip_cache(CLIP, (290, 390), built))
+            clip = CachedClipSource(decoder.cache_path)
+            self.assertEqual(len(clip), 105)
+            self.assertTrue((clip.frames == expected.frames).all())
+            self.assertTrue((shown[0] == expected.frame(0)).all())  # the first frame is not skipped
+
+    def test_cache_survives_skip_ahead(self):
+        """Frames skipped to catch up during the first pass still go into the cache."""
+        with tempfile.TemporaryDirectory() as tmp:
+            decoder = VideoDecoder(CLIP, (290, 390), capacity=2, cache_dir=tmp).start()
+            try:
+                deadline = time.monotonic() + 10.0
+                index = None
+                while (index is None or index < 60) and time.monotonic() < deadline:
+                    frame, index = decoder.take(60)
+                    if index is None or index < 60:
+                        time.sleep(0.002)
+                self.assertGreater(decoder.frames_skipped, 0)
+                drain(decoder, 60)
+            finally:
+                decoder.stop()
+            self.assertEqual(len(CachedClipSource(decoder.cache_path)), 105)
+
+if __name__ == "__main__":
+    unittest.main()
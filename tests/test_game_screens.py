@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+"""
+test_game_screens.py
+
+Tests for how the game builds and updates its screens, with Tk mocked out.
+"""
+
+import subprocess
+import sys
+import tempfile
+import unittest
+import unittest.mock
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from hangman_game import HangmanMCQGame
+from spaced_repetition import ReviewScheduler
+from tick_scheduler import TickScheduler, VirtualClock
+
+
+def make_game():
+    with unittest.mock.patch('tkinter.Tk'), unittest.mock.patch('pygame.mixer.init'):
+        return HangmanMCQGame()
+
+
+class TestQuestionScreen(unittest.TestCase):
+    """The question screen is built once per session and then only updated."""
+
+    def test_built_once_per_session(self):
+        """Later questions reuse the screen; a new main_frame (new screen) rebuilds it."""
+        game = make_game()
+        questions = game.question_bank["Python"]["Easy"][:3]
+        game.engine.start("Python", "Easy", questions)
+
+        def fake_build():
+            game.question_screen_frame = game.main_frame
+
+        with unittest.mock.patch.object(game, 'build_question_screen', side_effect=fake_build) as build, \
+                unittest.mock.patch.object(game, 'update_question_screen') as update, \
+                unittest.mock.patch.object(game, 'update_timer'):
+            game.show_question()
+            game.engine.advance()
+            game.show_question()
+            self.assertEqual(build.call_count, 1)
+            self.assertEqual(update.call_count, 2)
+            self.assertIs(update.call_args[0][0], questions[1])
+
+            game.main_frame = object()  # another screen was shown in between
+            game.show_question()
+            self.assertEqual(build.call_count, 2)
+
+
+class TestQuestionCallbacks(unittest.TestCase):
+    """Callbacks scheduled for one question never fire on the next."""
+
+    def test_feedback_clear_does_not_cross_questions(self):
+        """A wrong click's feedback clear from question 1 leaves question 2's feedback alone."""
+        game = make_game()
+        clock = VirtualClock(10.0)
+        game.scheduler = TickScheduler(clock=clock)
+        game.engine.clock = clock
+        questions = game.question_bank["Python"]["Easy"][:3]
+        game.engine.start("Python", "Easy", questions)
+        for name in ('progress_label', 'score_label', 'timer_label', 'question_label', 'feedback_label',
+                     'selected_option'):
+            setattr(game, name, unittest.mock.MagicMock())
+        game.option_buttons = []
+        game.question_screen_frame = game.main_frame
+        wrong = lambda: (questions[game.current_question]["correct"] + 1) % 4
+
+        def feedback():
+            return game.feedback_label.config.call_args_list[-1][1]["text"]
+
+        with unittest.mock.patch.object(game, '_option_button',
+                                        return_value=(unittest.mock.MagicMock(), unittest.mock.MagicMock())), \
+                unittest.mock.patch.object(game, 'draw_hangman'), unittest.mock.patch.object(game, 'play_sound'):
+            game.show_question()
+            game.selected_option.get.return_value = wrong()
+            game.answer_question()                      # t=0: clear due at t=1.2
+            game.selected_option.get.return_value = questions[0]["correct"]
+            clock.advance(0.1)
+            game.answer_question()                      # next question shown at t=0.4
+            game.scheduler.advance(0.5)
+            self.assertEqual(game.current_question, 1)
+            game.selected_option.get.return_value = wrong()
+            game.answer_question()                      # t=0.6: clear due at t=1.8
+            game.scheduler.advance(0.9)                 # past question 1's clear
+            self.assertEqual(feedback(), "Incorrect — try again!")
+            game.scheduler.advance(0.4)
+            self.assertEqual(feedback(), "")
+
+
+class TestSearchIndex(unittest.TestCase):
+    """The game keeps a search index from load_questions on."""
+
+    def test_subject_indexed_when_selected(self):
+        """The built-in bank is indexed a subject at a time, as each is picked."""
+        game = make_game()
+        self.assertEqual(len(game.search_index), 0)
+        with unittest.mock.patch.object(game, 'show_level_selection'):
+            game.select_language("SQL")
+            game.select_language("SQL")
+        self.assertEqual(game.search_index.subjects, {"SQL"})
+        self.assertIn(("SQL", "Easy", 5), [key for key, _ in game.search_index.search("join")])
+        self.assertEqual(len(game.search_index), sum(len(qs) for qs in game.question_bank["SQL"].values()))
+
+
+class TestProgressSaved(unittest.TestCase):
+    """Review progress is written whenever the player leaves a session."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.game = make_game()
+        self.game.nickname = "Ada"
+        self.game.review_scheduler = ReviewScheduler(self.tmp.name)
+        self.path = self.game.review_scheduler.path_for("Ada")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def answer(self, index):
+        question = self.game.question_bank["Python"]["Easy"][index]
+        self.game.review_scheduler.record("Ada", "Python", "Easy", index, question, True)
+
+    def test_home_and_close_save(self):
+        """Home mid-session and closing the window both write the progress file."""
+        self.answer(0)
+        with unittest.mock.patch('hangman_game.tk'):
+            self.game.show_start_screen()
+        self.assertTrue(self.path.exists())
+        saved = self.path.read_bytes()
+        self.answer(1)
+        self.game.on_close()
+        self.assertNotEqual(self.path.read_bytes(), saved)
+        self.game.root.destroy.assert_called_once()
+
+    def test_save_failure_warns(self):
+        """A failed save is reported in a warning dialog, not raised."""
+        self.answer(0)
+        with unittest.mock.patch.object(self.game.review_scheduler, 'save', side_effect=OSError("disk full")), \
+                unittest.mock.patch('hangman_game.messagebox') as messagebox:
+            self.game.save_progress()
+        self.assertIn("disk full", messagebox.showwarning.call_args[0][1])
+
+
+class TestCountdown(unittest.TestCase):
+    """update_timer reschedules itself for the next whole-second boundary."""
+
+    def test_scheduled_to_boundary(self):
+        """A tick running 300 ms into a second waits 700 ms (+1) for the next one."""
+        game = make_game()
+        clock = VirtualClock(50.0)
+        game.scheduler = TickScheduler(clock=clock)
+        game.engine.clock = clock
+        game.engine.start("Python", "Easy", game.question_bank["Python"]["Easy"][:1])
+        game.engine.begin_question()
+        game.timer_label = unittest.mock.MagicMock()
+        game.timer_running = True
+        clock.advance(2.3)
+        game.update_timer()
+        self.assertAlmostEqual(game.scheduler.next_due(), 53.001)
+        self.assertEqual(game.time_left, 13)
+
+
+
+class TestStartupImports(unittest.TestCase):
+    """Video and image libraries are not imported until they are needed."""
+
+    def test_game_import_is_light(self):
+        """Importing the game module pulls in neither OpenCV, Pillow, numpy nor pygame."""
+        code = ("import sys, hangman_game; "
+                "print(','.join(m for m in ('cv2', 'PIL', 'numpy', 'pygame') if m in sys.modules))")
+        out = subprocess.run([sys.executable, "-c", code], cwd=Path(__file__).parent.parent,
+                             capture_output=True, text=True, check=True)
+        self.assertEqual(out.stdout.strip(), "")
+
+    def test_availability_checked_on_first_use(self):
+        """OPENCV_AVAILABLE and PIL_AVAILABLE are still importable names."""
+        import celebration_video
+        import hangman_figure
+        self.assertIsInstance(celebration_video.OPENCV_AVAILABLE, bool)
+        self.assertIsInstance(hangman_figure.PIL_AVAILABLE, bool)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+test_hangman_figure.py
+
+Tests for the incremental, tagged hangman drawing.
+"""
+
+import sys
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from hangman_figure import (GALLOWS, PARTS, PIL_AVAILABLE, HangmanFigure, HangmanSprites, part_tag,
+                            render_stage_images)
+
+
+class FakeCanvas:
+    """Records canvas calls instead of drawing."""
+
+    def __init__(self):
+        self.items = []
+        self.configured = []
+
+    def __getattr__(self, name):
+        if not name.startswith("create_"):
+            raise AttributeError(name)
+
+        def create(*coords, tags=(), state="normal", **options):
+            self.items.append({"kind": name[7:], "tags": tags, "state": state})
+            return len(self.items)
+        return create
+
+    def create_image(self, *coords, image=None, tags=(), **options):
+        self.items.append({"kind": "image", "tags": tags, "image": image, "state": "normal"})
+        return len(self.items)
+
+    def itemconfigure(self, tag, **options):
+        self.configured.append((tag, options))
+        for n, item in enumerate(self.items, start=1):
+            if tag == n or tag in item["tags"]:
+                item.update(options)
+
+    def visible_parts(self):
+        return {t for item in self.items if item["state"] == "normal" for t in item["tags"]
+                if t.startswith("hangman_part")}
+
+
+class TestHangmanFigure(unittest.TestCase):
+    """Items are created once; stage changes touch only the parts that differ."""
+
+    def test_created_once_hidden(self):
+        """The gallows is visible and every part starts hidden."""
+        canvas = FakeCanvas()
+        HangmanFigure(canvas)
+        self.assertEqual(len(canvas.items), len(GALLOWS) + sum(len(p) for p in PARTS))
+        self.assertEqual(canvas.visible_parts(), set())
+
+    def test_one_wrong_answer_is_one_update(self):
+        """Each extra wrong answer shows exactly one part, with no new items."""
+        canvas = FakeCanvas()
+        figure = HangmanFigure(canvas)
+        created = len(canvas.items)
+        for stage in range(1, 7):
+            canvas.configured.clear()
+            figure.set_stage(stage)
+            self.assertEqual(canvas.configured, [(part_tag(stage), {"state": "normal"})])
+            self.assertEqual(canvas.visible_parts(), {part_tag(s) for s in range(1, stage + 1)})
+        self.assertEqual(len(canvas.items), created)
+
+        canvas.configured.clear()
+        figure.set_stage(6)
+        self.assertEqual(canvas.configured, [])
+
+    def test_going_back_hides_parts(self):
+        """A lower stage (new session) hides the extra parts; out-of-range stages are clamped."""
+        canvas = FakeCanvas()
+        figure = HangmanFigure(canvas)
+        figure.set_stage(9)
+        self.assertEqual(figure.stage, 6)
+        figure.set_stage(2)
+        self.assertEqual(canvas.visible_parts(), {part_tag(1), part_tag(2)})
+
+
+@unittest.skipUnless(PIL_AVAILABLE, "Pillow not installed")
+class TestHangmanSprites(unittest.TestCase):
+    """Stages are rendered once per size/DPI and swapped as a single image."""
+
+    def test_render_cached(self):
+        """Seven stages, rendered once per (size, DPI) and reused afterwards."""
+        images = render_stage_images(300, 400, 96)
+        self.assertEqual(len(images), 7)
+        self.assertIs(render_stage_images(300, 400, 96.0), images)
+        self.assertIsNot(render_stage_images(300, 400, 192), images)
+        self.assertEqual(render_stage_images(150, 200, 96)[0].size, (150, 200))
+
+    def test_stages_add_parts(self):
+        """The gallows is in every stage; the head appears from stage 1 on."""
+        images = render_stage_images(300, 400, 96)
+        head = (161, 120)
+        self.assertEqual(images[0].getpixel((110, 200))[3], 255)
+        self.assertEqual(images[0].getpixel(head)[3], 0)
+        self.assertEqual(images[1].getpixel(head)[3], 255)
+        self.assertEqual(images[5].getpixel((171, 118))[3], 0)
+        self.assertNotEqual(images[6].getpixel((171, 118))[3], 0)  # X eyes only when lost
+
+    def test_single_image_swap(self):
+        """One image item; changing stage is one itemconfigure, a repeat is none."""
+        canvas = FakeCanvas()
+        photos = [f"photo{i}" for i in range(7)]
+        sprites = HangmanSprites(canvas, photos=photos)
+        self.assertEqual(len(canvas.items), 1)
+        sprites.set_stage(3)
+        sprites.set_stage(3)
+        self.assertEqual(canvas.configured, [(1, {"image": "photo3"})])
+        self.assertEqual(canvas.items[0]["image"], "photo3")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+test_question_dedupe.py
+
+Tests for MinHash/LSH near-duplicate question detection.
+"""
+
+import sys
+import unittest
+import unittest.mock
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from question_bank import BUILTIN_QUESTION_BANK
+from question_dedupe import NUMPY_AVAILABLE, MinHashIndex, find_duplicates, iter_bank_items, question_text
+
+SQL_OPTIONS = ["Simple Query Language", "Structured Query Language", "Standard Query Language",
+               "Sequential Query Language"]
+
+
+class TestDedupe(unittest.TestCase):
+    """Near-duplicates are clustered; distinct questions are not."""
+
+    def test_normalization(self):
+        """Case, punctuation and spacing do not matter."""
+        a = question_text({"question": "What does SQL  stand for?", "options": ["A", "B"]})
+        b = question_text({"question": "what does sql stand for", "options": ["a", "b"]})
+        self.assertEqual(a, b)
+
+    def test_similarity_estimate(self):
+        """Identical texts score 1.0, unrelated texts score low."""
+        index = MinHashIndex()
+        sig = index.signature("what does sql stand for")
+        self.assertEqual(index.similarity(sig, index.signature("what does sql stand for")), 1.0)
+        self.assertLess(index.similarity(sig, index.signature("bootstrapping is a resampling method")), 0.2)
+
+    def test_reworded_duplicate_clustered(self):
+        """A reworded copy filed under another level is reported with the original."""
+        items = list(iter_bank_items(BUILTIN_QUESTION_BANK))
+        items.append((("SQL", "Extreme", "copy"), {"question": "SQL stands for what?", "options": SQL_OPTIONS,
+                                                    "correct": 1}))
+        clusters = find_duplicates(items)
+        self.assertEqual(len(clusters), 1)
+        keys = {key for key, _ in clusters[0]}
+        self.assertIn(("SQL", "Extreme", "copy"), keys)
+        self.assertIn(("SQL", "Easy", 1), keys)
+
+    def test_builtin_bank_clean(self):
+        """The built-in bank has no near-duplicates."""
+        self.assertEqual(find_duplicates(iter_bank_items(BUILTIN_QUESTION_BANK)), [])
+
+    def test_query(self):
+        """query() finds indexed near-duplicates of new text."""
+        index = MinHashIndex()
+        index.add("sql", question_text({"question": "What does SQL stand for?", "options": SQL_OPTIONS}))
+        hits = index.query(question_text({"question": "SQL stands for?", "options": SQL_OPTIONS}))
+        self.assertEqual([key for key, _ in hits], ["sql"])
+
+
+@unittest.skipUnless(NUMPY_AVAILABLE, "numpy not available")
+class TestCompactIndex(unittest.TestCase):
+    """With numpy, signatures and band keys live in flat arrays."""
+
+    def test_chunked_signatures_match(self):
+        """Hashing shingles a few at a time gives the same signatures as all at once."""
+        texts = [question_text(q) for _, q in iter_bank_items(BUILTIN_QUESTION_BANK)][:40]
+        index = MinHashIndex()
+        whole = index.signatures_for(texts)
+        with unittest.mock.patch("question_dedupe._CHUNK_CELLS", 3 * index.num_perm):
+            chunked = index.signatures_for(texts)
+        self.assertEqual(whole.dtype.name, "uint32")
+        self.assertTrue((whole == chunked).all())
+
+    def test_arrays_grow(self):
+        """Adding past the initial capacity keeps every signature and still finds duplicates."""
+        index = MinHashIndex(capacity=2)
+        texts = [question_text(q) for _, q in iter_bank_items(BUILTIN_QUESTION_BANK)][:5]
+        index.add_many(enumerate(texts), batch_size=2)
+        index.add("copy", texts[3])
+        self.assertEqual(index.signatures.shape, (6, index.num_perm))
+        self.assertTrue((index.signatures[:5] == index.signatures_for(texts)).all())
+        self.assertEqual(index.clusters(), [[3, "copy"]])
+
+
+if __name__ == "__main__":
+    unittest.main()
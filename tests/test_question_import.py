@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+test_question_import.py
+
+Tests for the streaming CSV/JSONL question importer.
+"""
+
+import json
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from question_import import import_questions, validate_question
+from question_store import SQLiteQuestionStore
+
+CSV_TEXT = """subject,level,question,option_a,option_b,option_c,option_d,correct,tags
+Python,Easy,What is 1+1?,1,2,3,4,B,math;basics
+Python,Easy,Missing an option?,a,b,c,,0,
+SQL,Easy,Which clause filters?,FILTER,WHERE,HAVING,CONDITION,1,
+SQL,Easy,Out of range?,a,b,c,d,4,
+"""
+
+
+class TestValidation(unittest.TestCase):
+    """Same invariants as test_question_bank_structure."""
+
+    def test_valid_row(self):
+        """Letters are accepted for the correct option and tags are split."""
+        subject, level, q, tags = validate_question({
+            "subject": "Python", "level": "Easy", "question": "Q?",
+            "option_a": "a", "option_b": "b", "option_c": "c", "option_d": "d", "correct": "C", "tags": "x; y"})
+        self.assertEqual((subject, level), ("Python", "Easy"))
+        self.assertEqual(q, {"question": "Q?", "options": ["a", "b", "c", "d"], "correct": 2})
+        self.assertEqual(tags, ["x", "y"])
+
+    def test_invalid_rows(self):
+        """Rows breaking an invariant raise ValueError."""
+        base = {"subject": "S", "level": "L", "question": "Q", "options": ["a", "b", "c", "d"], "correct": 0}
+        for bad in ({"options": ["a", "b", "c"]}, {"correct": 4}, {"correct": -1}, {"correct": "x"},
+                    {"subject": ""}, {"question": None}):
+            with self.assertRaises(ValueError):
+                validate_question(dict(base, **bad))
+
+
+class TestImport(unittest.TestCase):
+    """End-to-end imports into a SQLite bank."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.dir = Path(self.tmp.name)
+        self.store = SQLiteQuestionStore(self.dir / "bank.sqlite")
+
+    def tearDown(self):
+        self.store.close()
+        self.tmp.cleanup()
+
+    def check_csv_import(self, workers):
+        source = self.dir / "questions.csv"
+        source.write_text(CSV_TEXT, encoding="utf-8")
+        rejects = self.dir / "rejects.jsonl"
+        stats = import_questions(source, self.store, rejects, workers=workers, batch_size=2)
+        self.assertEqual((stats.rows, stats.imported, stats.rejected), (4, 2, 2))
+        self.assertEqual(self.store["Python"]["Easy"][0]["correct"], 1)
+        self.assertEqual(self.store.count("SQL", "Easy"), 1)
+        lines = [json.loads(l) for l in rejects.read_text(encoding="utf-8").splitlines()]
+        self.assertEqual([r["line"] for r in lines], [3, 5])
+
+    def test_csv_in_process(self):
+        """CSV rows are imported and bad rows rejected with their line numbers."""
+        self.check_csv_import(workers=1)
+
+    def test_csv_process_pool(self):
+        """Validation across a process pool gives the same result."""
+        self.check_csv_import(workers=2)
+
+    def test_jsonl(self):
+        """JSONL rows, including unparseable lines, are handled row by row."""
+        source = self.dir / "questions.jsonl"
+        good = {"subject": "Stats", "level": "Easy", "question": "Mean?", "options": ["a", "b", "c", "d"],
+                "correct": 0, "tags": ["basics"]}
+        source.write_text(json.dumps(good) + "\n{not json\n", encoding="utf-8")
+        rejects = self.dir / "rejects.jsonl"
+        stats = import_questions(source, self.store, rejects, workers=1)
+        self.assertEqual((stats.imported, stats.rejected), (1, 1))
+        reject = json.loads(rejects.read_text(encoding="utf-8"))
+        self.assertEqual(reject["line"], 2)
+        self.assertTrue(reject["error"].startswith("invalid JSON"))
+        self.assertEqual(self.store.sample("Stats", "Easy", 1, tag="basics")[0]["question"], "Mean?")
+
+
+if __name__ == "__main__":
+    unittest.main()
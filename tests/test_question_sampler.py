@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+test_question_sampler.py
+
+Tests for the alias-method weighted question sampler.
+"""
+
+import random
+import sys
+import tempfile
+import unittest
+from collections import Counter
+from collections.abc import Sequence
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from question_bank import BUILTIN_QUESTION_BANK
+from question_sampler import AliasTable, QuestionSampler, WeightedSampler
+from question_store import SQLiteQuestionStore
+from quiz_engine import QuizEngine
+
+
+class HugeLevel(Sequence):
+    """A level of `size` generated questions that counts how many were built."""
+
+    def __init__(self, size):
+        self.size = size
+        self.built = 0
+
+    def __len__(self):
+        return self.size
+
+    def __getitem__(self, i):
+        self.built += 1
+        return {"question": f"Q{i}?", "options": ["a", "b", "c", "d"], "correct": 0}
+
+
+class TestWeightedSampler(unittest.TestCase):
+    """Alias tables draw proportionally; samples never repeat."""
+
+    def test_alias_distribution(self):
+        """Draw frequencies follow the weights."""
+        rng = random.Random(1)
+        table = AliasTable([1, 0, 3])
+        counts = Counter(table.draw(rng) for _ in range(20000))
+        self.assertEqual(counts[1], 0)
+        self.assertAlmostEqual(counts[2] / counts[0], 3.0, delta=0.3)
+
+    def test_update_changes_distribution(self):
+        """Updating a weight only rebuilds its block and takes effect on the next draw."""
+        rng = random.Random(2)
+        sampler = WeightedSampler([1.0] * 100)
+        for i in range(100):
+            if i != 42:
+                sampler.update(i, 0.0)
+        self.assertEqual({sampler.draw(rng) for _ in range(50)}, {42})
+        self.assertEqual(sampler.positive, 1)
+
+    def test_sample_without_repeats(self):
+        """Samples are distinct and capped at the number of drawable items."""
+        rng = random.Random(3)
+        sampler = WeightedSampler([5.0, 1.0, 0.0, 1.0, 1.0])
+        sample = sampler.sample(10, rng)
+        self.assertEqual(sorted(sample), [0, 1, 3, 4])
+        self.assertEqual(len(set(WeightedSampler([1.0] * 1000).sample(15, rng))), 15)
+
+
+class TestQuestionSampler(unittest.TestCase):
+    """Per-level sampling with result feedback."""
+
+    def test_sample_is_view_of_pool(self):
+        """A session draws distinct questions from the requested level."""
+        sampler = QuestionSampler(rng=random.Random(4))
+        view = sampler.sample(BUILTIN_QUESTION_BANK, "SQL", "Easy", 4)
+        pool = BUILTIN_QUESTION_BANK["SQL"]["Easy"]
+        self.assertEqual(len(set(view.order)), 4)
+        self.assertEqual([view[i] for i in range(4)], [pool[i] for i in view.order])
+
+    def test_misses_raise_weight(self):
+        """Questions missed before are favoured in later sessions."""
+        sampler = QuestionSampler(recency_window=0, rng=random.Random(5))
+        sampler.sample(BUILTIN_QUESTION_BANK, "Python", "Easy", 6)
+        for i in range(6):
+            sampler.record("Python", "Easy", i, correct=(i != 3))
+        counts = Counter(sampler.sample(BUILTIN_QUESTION_BANK, "Python", "Easy", 1).order[0] for _ in range(3000))
+        self.assertGreater(counts[3], 2 * counts[0])
+
+    def test_priority_zero_excludes(self):
+        """An editorial priority of 0 keeps a question out of samples."""
+        sampler = QuestionSampler(rng=random.Random(6))
+        sampler.set_priority("Tableau", "Easy", 2, 0)
+        for _ in range(20):
+            self.assertNotIn(2, sampler.sample(BUILTIN_QUESTION_BANK, "Tableau", "Easy", 5).order)
+
+    def test_only_history_is_weighted(self):
+        """Per-level state grows with the questions that have a history, not the level size."""
+        level = HugeLevel(10_000_000)
+        bank = {"Big": {"Easy": level}}
+        sampler = QuestionSampler(rng=random.Random(8))
+        first = sampler.sample(bank, "Big", "Easy", 15)
+        self.assertEqual(len(set(first.order)), 15)
+        state = sampler._levels[("Big", "Easy")]
+        self.assertEqual(sorted(state.slots), sorted(first.order))  # just shown: lower recency weight
+        sampler.record("Big", "Easy", first.order[0], correct=False)
+        second = sampler.sample(bank, "Big", "Easy", 15)
+        self.assertEqual(len(set(second.order)), 15)
+        self.assertLessEqual(len(state.slots), 30)
+        self.assertEqual(level.built, 0)
+
+    def test_weighted_matches_remainder(self):
+        """A weight-3 question is drawn about three times as often as an untouched one."""
+        sampler = QuestionSampler(rng=random.Random(9))
+        sampler.set_priority("SQL", "Easy", 0, 3.0)
+        pool = BUILTIN_QUESTION_BANK["SQL"]["Easy"]
+        counts = Counter()
+        for _ in range(6000):
+            state = sampler._state("SQL", "Easy", pool)
+            counts.update(sampler._draw_order(state, 1))
+        others = sum(counts[i] for i in range(1, len(pool))) / (len(pool) - 1)
+        self.assertAlmostEqual(counts[0] / others, 3.0, delta=0.6)
+
+    def test_untouched_store_level_uses_indexed_sample(self):
+        """Without history, SQLite levels are sampled by the store's own indexed query."""
+        with tempfile.TemporaryDirectory() as tmp:
+            store = SQLiteQuestionStore(Path(tmp) / "bank.sqlite")
+            try:
+                store.add_bank({"SQL": BUILTIN_QUESTION_BANK["SQL"]})
+                sampler = QuestionSampler(rng=random.Random(10))
+                view = sampler.sample(store, "SQL", "Easy", 5)
+                level = store["SQL"]["Easy"]
+                self.assertEqual(len(set(view.order)), 5)
+                self.assertEqual(list(view), [level[i] for i in view.order])
+                self.assertIsInstance(view._pool, dict)  # prefetched in one query
+            finally:
+                store.close()
+
+    def test_engine_reports_results(self):
+        """QuizEngine feeds first-try results and timeouts to its listeners."""
+        sampler = QuestionSampler(rng=random.Random(7))
+        engine = QuizEngine()
+        results = []
+        engine.result_listeners.append(lambda e, first_try: results.append((e.pool_index, first_try)))
+        view = sampler.sample(BUILTIN_QUESTION_BANK, "SQL", "Easy", 2)
+        engine.start("SQL", "Easy", view)
+        correct = engine.current["correct"]
+        engine.answer((correct + 1) % 4)
+        engine.answer(correct)
+        engine.advance()
+        engine.timeout()
+        self.assertEqual(results, [(view.order[0], False), (view.order[1], False)])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+test_question_search.py
+
+Tests for the inverted full-text question index.
+"""
+
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from question_bank import BUILTIN_QUESTION_BANK
+from question_import import import_questions
+from question_search import QuestionSearchIndex, tokenize
+from question_store import SQLiteQuestionStore
+
+
+class TestQuestionSearch(unittest.TestCase):
+    """Term, prefix and filtered queries over the built-in bank."""
+
+    def setUp(self):
+        self.index = QuestionSearchIndex.from_bank(BUILTIN_QUESTION_BANK)
+
+    def keys(self, *args, **kwargs):
+        return [key for key, _ in self.index.search(*args, **kwargs)]
+
+    def test_tokenize(self):
+        """Tokens are lowercase words."""
+        self.assertEqual(tokenize("What is 'len()'?"), ["what", "is", "len"])
+
+    def test_term_matches_question_and_options(self):
+        """A term matches question text and option text, case-insensitively."""
+        keys = self.keys("JOIN")
+        self.assertIn(("SQL", "Easy", 5), keys)          # in the question
+        self.assertIn(("SQL", "Intermediate", 4), keys)  # only in an option
+        for key, q in self.index.search("join"):
+            self.assertIn("join", " ".join([q["question"], *q["options"]]).lower())
+
+    def test_prefix_and_filters(self):
+        """Prefix terms and subject/level filters narrow results."""
+        self.assertEqual(self.keys("lamb*"), [("Python", "Intermediate", 0)])
+        self.assertEqual(self.keys("join", subject="Python"), [])
+        self.assertTrue(all(k[:2] == ("SQL", "Easy") for k in self.keys("join", subject="SQL", level="Easy")))
+        self.assertTrue(all(k[1] == "Extreme" for k in self.keys("what", level="Extreme")))
+
+    def test_all_terms_required(self):
+        """Multiple terms are combined with AND."""
+        self.assertEqual(self.keys("lambda function"), [("Python", "Intermediate", 0)])
+        self.assertEqual(self.keys("lambda join"), [])
+
+    def test_incremental_add_remove(self):
+        """Added questions are searchable at once; removed ones disappear."""
+        doc_id = self.index.add(("SQL", "Easy", "new"), {"question": "What does a CROSS JOIN return?",
+                                                         "options": ["a", "b", "c", "d"]})
+        self.assertEqual(self.keys("cross"), [("SQL", "Easy", "new")])
+        self.index.remove(doc_id)
+        self.assertEqual(self.keys("cross"), [])
+        self.assertNotIn("cross", self.index.vocabulary)
+
+
+class TestStoreIndex(unittest.TestCase):
+    """A SQLite store keeps its search index current on every write."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.dir = Path(self.tmp.name)
+        self.store = SQLiteQuestionStore(self.dir / "bank.sqlite")
+        self.store.add_bank(BUILTIN_QUESTION_BANK)
+        self.index = self.store.build_search_index()
+
+    def tearDown(self):
+        self.store.close()
+        self.tmp.cleanup()
+
+    def keys(self, query):
+        return [key for key, _ in self.index.search(query)]
+
+    def test_build_matches_from_bank(self):
+        """Building from the store finds what an index over the built-in bank finds."""
+        expected = QuestionSearchIndex.from_bank(BUILTIN_QUESTION_BANK)
+        self.assertEqual(len(self.index), len(expected))
+        self.assertEqual(sorted(self.keys("join")), sorted(k for k, _ in expected.search("join")))
+
+    def test_added_question_found_without_rebuild(self):
+        """add_question and add_questions make new questions searchable at once."""
+        self.store.add_question("SQL", "Easy", {"question": "What does a CROSS JOIN return?",
+                                                "options": ["a", "b", "c", "d"], "correct": 0})
+        seq = len(BUILTIN_QUESTION_BANK["SQL"]["Easy"])
+        self.assertEqual(self.keys("cross"), [("SQL", "Easy", seq)])
+        self.store.add_questions([("Go", "Easy", {"question": "What starts a goroutine?",
+                                                  "options": ["go", "run", "spawn", "async"], "correct": 0})])
+        self.assertEqual(self.keys("goroutine"), [("Go", "Easy", 0)])
+        self.assertEqual(self.store["Go"]["Easy"][0]["question"], "What starts a goroutine?")
+
+    def test_imported_rows_found(self):
+        """The importer writes through the store, so imported rows are searchable."""
+        source = self.dir / "rows.jsonl"
+        source.write_text('{"subject": "SQL", "level": "Easy", "question": "What is a ZIGZAG JOIN?", '
+                          '"options": ["a", "b", "c", "d"], "correct": 1}\n', encoding="utf-8")
+        import_questions(source, self.store, workers=1)
+        self.assertEqual(self.keys("zigzag"), [("SQL", "Easy", len(BUILTIN_QUESTION_BANK["SQL"]["Easy"]))])
+
+    def test_delete_rekeys_moved_question(self):
+        """Deleting a question drops it and follows the question moved into its seq."""
+        level = BUILTIN_QUESTION_BANK["Statistics"]["Easy"]
+        first_id = self.store.conn.execute(
+            "SELECT id FROM questions WHERE subject = 'Statistics' AND level = 'Easy' AND seq = 0").fetchone()[0]
+        self.store.delete_question(first_id)
+        moved = level[-1]
+        keys = [key for key, q in self.index.search(moved["question"]) if q == moved]
+        self.assertEqual(keys, [("Statistics", "Easy", 0)])
+        self.assertEqual(self.store["Statistics"]["Easy"][0], moved)
+        self.assertEqual(len(self.index), sum(len(qs) for s in BUILTIN_QUESTION_BANK.values() for qs in s.values()) - 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+"""
+test_question_store.py
+
+Tests for the compiled, memory-mapped question bank format.
+"""
+
+import random
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from question_bank import BUILTIN_QUESTION_BANK, load_manifest, load_subject
+from question_store import (LazyQuestionBank, MmapQuestionBank, QuestionView, SQLiteQuestionStore,
+                            bank_subjects, compile_bank, sample_questions)
+
+
+class TestCompiledBank(unittest.TestCase):
+    """Round-trip the built-in bank through the compiled format."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = Path(self.tmp.name) / "bank.hqb"
+        self.total = compile_bank(BUILTIN_QUESTION_BANK, self.path)
+        self.bank = MmapQuestionBank(self.path)
+
+    def tearDown(self):
+        self.bank.close()
+        self.tmp.cleanup()
+
+    def test_round_trip(self):
+        """Every question decodes back to the original dict."""
+        expected_total = sum(len(q) for levels in BUILTIN_QUESTION_BANK.values() for q in levels.values())
+        self.assertEqual(self.total, expected_total)
+        self.assertEqual(list(self.bank), list(BUILTIN_QUESTION_BANK))
+        for subject, levels in BUILTIN_QUESTION_BANK.items():
+            for level, questions in levels.items():
+                self.assertEqual(list(self.bank[subject][level]), questions)
+
+    def test_indexing(self):
+        """Negative indices, slices and out-of-range access behave like a list."""
+        original = BUILTIN_QUESTION_BANK["SQL"]["Easy"]
+        compiled = self.bank["SQL"]["Easy"]
+        self.assertEqual(compiled[-1], original[-1])
+        self.assertEqual(compiled[1:3], original[1:3])
+        with self.assertRaises(IndexError):
+            compiled[len(original)]
+
+    def test_question_view(self):
+        """A view reorders questions without touching the pool."""
+        pool = self.bank["Python"]["Easy"]
+        view = QuestionView(pool, [2, 0])
+        self.assertEqual(len(view), 2)
+        self.assertEqual(view[0], BUILTIN_QUESTION_BANK["Python"]["Easy"][2])
+        self.assertEqual(view[1], BUILTIN_QUESTION_BANK["Python"]["Easy"][0])
+
+    def test_rejects_foreign_file(self):
+        """Opening a file that is not a compiled bank raises ValueError."""
+        bogus = Path(self.tmp.name) / "bogus.hqb"
+        bogus.write_bytes(b"not a bank at all")
+        with self.assertRaises(ValueError):
+            MmapQuestionBank(bogus)
+
+
+class TestSQLiteStore(unittest.TestCase):
+    """SQLite backend: mapping access, O(N) sampling and dense deletes."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.store = SQLiteQuestionStore(Path(self.tmp.name) / "bank.sqlite")
+        self.store.add_bank(BUILTIN_QUESTION_BANK)
+
+    def tearDown(self):
+        self.store.close()
+        self.tmp.cleanup()
+
+    def test_mapping_matches_builtin(self):
+        """store[subject][level] returns the same questions in insertion order."""
+        self.assertEqual(list(self.store), list(BUILTIN_QUESTION_BANK))
+        self.assertIn("Tableau", self.store)
+        self.assertNotIn("Cobol", self.store)
+        self.assertEqual(list(self.store["SQL"]["Extreme"]), BUILTIN_QUESTION_BANK["SQL"]["Extreme"])
+
+    def test_sample(self):
+        """Samples are distinct questions from the requested level, capped at its size."""
+        pool = BUILTIN_QUESTION_BANK["Python"]["Easy"]
+        sample = self.store.sample("Python", "Easy", 4)
+        self.assertEqual(len(sample), 4)
+        self.assertEqual(len({q["question"] for q in sample}), 4)
+        for q in sample:
+            self.assertIn(q, pool)
+        self.assertEqual(len(sample_questions(self.store, "Python", "Easy", 50)), len(pool))
+
+    def test_sample_by_tag(self):
+        """Tagged questions can be sampled through the tag index."""
+        qid = self.store.add_question("Python", "Easy", {"question": "Tagged?", "options": ["a", "b", "c", "d"],
+                                                         "correct": 0}, tags=["lambda"])
+        self.assertEqual(self.store.tags(qid), ["lambda"])
+        self.assertEqual([q["question"] for q in self.store.sample("Python", "Easy", 5, tag="lambda")], ["Tagged?"])
+
+    def test_sample_by_tag_uses_rng(self):
+        """Tagged samples are views over the drawn seqs, picked with the given rng."""
+        tagged = {}
+        for i in range(6):
+            q = {"question": f"Tagged {i}?", "options": ["a", "b", "c", "d"], "correct": 0}
+            self.store.add_question("SQL", "Easy", q, tags=["joins"] if i % 2 == 0 else ["other"])
+            tagged[i] = q
+        level = self.store["SQL"]["Easy"]
+        first = self.store.sample("SQL", "Easy", 2, rng=random.Random(7), tag="joins")
+        again = self.store.sample("SQL", "Easy", 2, rng=random.Random(7), tag="joins")
+        self.assertIsInstance(first, QuestionView)
+        self.assertEqual(first.order, again.order)
+        self.assertEqual(len(first), 2)
+        for seq, q in zip(first.order, first):
+            self.assertEqual(level[seq], q)
+            self.assertIn(q["question"], {tagged[i]["question"] for i in (0, 2, 4)})
+        self.assertEqual(len(self.store.sample("SQL", "Easy", 10, tag="joins")), 3)
+        self.assertEqual(list(self.store.sample("SQL", "Easy", 10, tag="missing")), [])
+
+    def test_delete_keeps_levels_dense(self):
+        """Deleting a question keeps every remaining question reachable."""
+        level = self.store["Statistics"]["Easy"]
+        first_id = self.store.conn.execute(
+            "SELECT id FROM questions WHERE subject = 'Statistics' AND level = 'Easy' AND seq = 0").fetchone()[0]
+        self.assertTrue(self.store.delete_question(first_id))
+        remaining = list(level)
+        self.assertEqual(len(remaining), len(BUILTIN_QUESTION_BANK["Statistics"]["Easy"]) - 1)
+        self.assertNotIn(BUILTIN_QUESTION_BANK["Statistics"]["Easy"][0], remaining)
+        self.assertEqual(len(self.store.sample("Statistics", "Easy", 10)), len(remaining))
+
+
+class TestLazyQuestionBank(unittest.TestCase):
+    """Per-subject loading on demand with a size-capped LRU."""
+
+    def make_bank(self, max_bytes):
+        manifest = load_manifest()
+        self.loaded = []
+
+        def loader(subject):
+            self.loaded.append(subject)
+            return load_subject(subject, manifest=manifest)
+        return LazyQuestionBank(manifest, loader, max_bytes=max_bytes)
+
+    def test_manifest_without_loading(self):
+        """Subjects and levels are listed from the manifest alone."""
+        bank = self.make_bank(max_bytes=1 << 30)
+        self.assertIsInstance(bank, dict)
+        self.assertEqual(list(bank), list(BUILTIN_QUESTION_BANK))
+        self.assertIn("SQL", bank)
+        self.assertEqual(bank.levels("SQL"), ["Easy", "Intermediate", "Extreme"])
+        self.assertEqual([e["name"] for e in bank_subjects(bank)], list(BUILTIN_QUESTION_BANK))
+        self.assertEqual(self.loaded, [])
+
+    def test_loads_once(self):
+        """A subject is read on first access and served from the cache afterwards."""
+        bank = self.make_bank(max_bytes=1 << 30)
+        self.assertEqual(bank["SQL"]["Easy"], BUILTIN_QUESTION_BANK["SQL"]["Easy"])
+        bank["SQL"]
+        self.assertEqual(self.loaded, ["SQL"])
+        self.assertTrue(bank.is_loaded("SQL"))
+        self.assertFalse(bank.is_loaded("Python"))
+
+    def test_lru_eviction(self):
+        """Past the memory cap the least recently used subject is dropped."""
+        bank = self.make_bank(max_bytes=1)
+        bank["Python"]
+        bank["SQL"]
+        self.assertFalse(bank.is_loaded("Python"))
+        self.assertTrue(bank.is_loaded("SQL"))
+        self.assertEqual(bank.evictions, 1)
+        bank["Python"]
+        self.assertEqual(self.loaded, ["Python", "SQL", "Python"])
+
+    def test_unknown_subject(self):
+        """Subjects missing from the manifest raise KeyError."""
+        bank = self.make_bank(max_bytes=1 << 30)
+        with self.assertRaises(KeyError):
+            bank["Cobol"]
+        self.assertIsNone(bank.get("Cobol"))
+
+
+if __name__ == "__main__":
+    unittest.main()
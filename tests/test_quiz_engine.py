@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+test_quiz_engine.py
+
+Tests for the headless QuizEngine (no Tk, no pygame).
+"""
+
+import sys
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from quiz_engine import QuizEngine
+
+
+def make_questions(count):
+    return [{"question": f"Q{i}", "options": ["a", "b", "c", "d"], "correct": i % 4} for i in range(count)]
+
+
+class TestQuizEngine(unittest.TestCase):
+    """Test cases for quiz rules driven without a display."""
+
+    def setUp(self):
+        self.engine = QuizEngine(time_per_question=3)
+        self.engine.start("Python", "Easy", make_questions(3))
+
+    def test_initial_state(self):
+        """A fresh session starts at question 0 with a full clock."""
+        self.assertEqual(self.engine.current_question, 0)
+        self.assertEqual(self.engine.score, 0)
+        self.assertEqual(self.engine.wrong_answers, 0)
+        self.assertEqual(self.engine.time_left, 3)
+        self.assertFalse(self.engine.finished)
+
+    def test_correct_answer_scores(self):
+        """Correct answers award points and are recorded."""
+        self.assertTrue(self.engine.answer(0))
+        self.assertEqual(self.engine.score, 2)
+        self.assertEqual(self.engine.user_answers, [0])
+
+    def test_wrong_answer_allows_retry(self):
+        """Wrong selections neither score nor grow the hangman."""
+        self.assertFalse(self.engine.answer(2))
+        self.assertEqual(self.engine.score, 0)
+        self.assertEqual(self.engine.wrong_answers, 0)
+        self.assertEqual(self.engine.user_answers, [])
+        self.assertTrue(self.engine.answer(0))
+
+    def test_timeout_grows_hangman(self):
+        """Running the clock out records -1 and adds a hangman part."""
+        while self.engine.tick() > 0:
+            pass
+        self.engine.timeout()
+        self.assertEqual(self.engine.user_answers, [QuizEngine.TIMEOUT_ANSWER])
+        self.assertEqual(self.engine.wrong_answers, 1)
+
+    def test_full_session_summary(self):
+        """Advancing through every question finishes the session."""
+        for i in range(3):
+            self.engine.answer(i % 4)
+            finished = self.engine.advance()
+        self.assertTrue(finished)
+        self.assertIsNone(self.engine.current)
+        summary = self.engine.summary()
+        self.assertEqual(summary["correct"], 3)
+        self.assertTrue(summary["perfect"])
+        self.assertAlmostEqual(summary["accuracy"], 100.0)
+
+    def test_advance_resets_clock(self):
+        """Each new question gets a fresh countdown."""
+        self.engine.tick()
+        self.engine.answer(0)
+        self.engine.advance()
+        self.assertEqual(self.engine.time_left, 3)
+
+
+
+class FakeClock:
+    def __init__(self, now=100.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+class TestDeadlineCountdown(unittest.TestCase):
+    """The countdown follows a monotonic deadline, not the number of ticks."""
+
+    def setUp(self):
+        self.clock = FakeClock()
+        self.engine = QuizEngine(time_per_question=15, clock=self.clock)
+        self.engine.start("Python", "Easy", make_questions(2))
+        self.engine.begin_question()
+
+    def test_whole_seconds_round_up(self):
+        """time_left shows whole seconds rounded up; remaining() keeps the fraction."""
+        self.clock.now += 0.3
+        self.assertEqual(self.engine.sync_time(), 15)
+        self.assertAlmostEqual(self.engine.remaining(), 14.7)
+        self.clock.now += 0.7
+        self.assertEqual(self.engine.sync_time(), 14)
+
+    def test_late_ticks_do_not_stretch(self):
+        """However late the ticks run, time is up exactly at the deadline."""
+        ticks = 0
+        while self.engine.sync_time() > 0:
+            # Every tick lands 80 ms after the boundary it was scheduled for
+            self.clock.now += self.engine.seconds_to_next_tick() + 0.08
+            ticks += 1
+        self.assertLessEqual(ticks, 16)
+        self.assertLess(self.engine.remaining(), 1e-9)
+        self.assertAlmostEqual(self.clock.now - (self.engine.deadline - 15), 15.08)
+
+    def test_next_tick_at_boundary(self):
+        """The next tick is scheduled for the next whole-second boundary."""
+        self.assertAlmostEqual(self.engine.seconds_to_next_tick(), 1.0)
+        self.clock.now += 1.25
+        self.assertAlmostEqual(self.engine.seconds_to_next_tick(), 0.75)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""
+test_render_stats.py
+
+Tests for per-screen render-latency histograms.
+"""
+
+import json
+import sys
+import tempfile
+import unittest
+import unittest.mock
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from hangman_game import HangmanMCQGame
+from render_stats import BUCKET_EDGES_MS, LatencyHistogram, RenderStats, instrument_screens
+from tick_scheduler import VirtualClock
+
+
+class TestLatencyHistogram(unittest.TestCase):
+    """Fixed buckets with percentiles read from bucket edges."""
+
+    def test_buckets_and_percentiles(self):
+        """90 fast and 10 slow renders: p50 in a fast bucket, p95/p99 in the slow one."""
+        histogram = LatencyHistogram()
+        for _ in range(90):
+            histogram.record(3.0)
+        for _ in range(10):
+            histogram.record(140.0)
+        self.assertEqual(len(histogram.counts), len(BUCKET_EDGES_MS) + 1)
+        self.assertEqual(histogram.percentile(50), 4)
+        self.assertEqual(histogram.percentile(95), 140.0)  # bucket edge 200, capped at the max
+        self.assertEqual(histogram.percentile(99), 140.0)
+        self.assertAlmostEqual(histogram.to_dict()["mean_ms"], 16.7)
+
+    def test_overflow_and_empty(self):
+        """Latencies past the last edge land in the overflow bucket; empty histograms have no percentiles."""
+        histogram = LatencyHistogram()
+        self.assertIsNone(histogram.percentile(50))
+        histogram.record(5000.0)
+        self.assertEqual(histogram.counts[-1], 1)
+        self.assertEqual(histogram.percentile(99), 5000.0)
+
+
+@instrument_screens
+class Screens:
+    """Minimal object with screen methods."""
+
+    def __init__(self, clock, render_stats):
+        self.clock = clock
+        self.render_stats = render_stats
+
+    def show_question(self, last=False):
+        self.clock.advance(0.012)
+        if last:
+            self.show_results()
+        return "built"
+
+    def show_results(self):
+        self.clock.advance(0.020)
+
+
+class TestRenderStats(unittest.TestCase):
+    """attach() times screen builds until idle; detach() switches timing off."""
+
+    def setUp(self):
+        self.clock = VirtualClock()
+        self.idle = []
+        self.stats = RenderStats(self.idle.append, clock=self.clock)
+        self.screens = Screens(self.clock, self.stats)
+
+    def run_idle(self):
+        for callback in self.idle:
+            callback()
+        self.idle.clear()
+
+    def test_times_until_idle(self):
+        """The time until the idle callback runs (redraws included) is recorded."""
+        self.stats.attach(self.screens)
+        self.assertEqual(self.screens.show_question(), "built")
+        self.clock.advance(0.003)  # Tk redraws before going idle
+        self.run_idle()
+        histogram = self.stats.histograms["show_question"]
+        self.assertEqual(histogram.count, 1)
+        self.assertAlmostEqual(histogram.max_ms, 15.0)
+        self.assertIn("show_question", self.stats.report())
+
+    def test_detached_records_nothing(self):
+        """Before attach and after detach no span is recorded or queued."""
+        self.screens.show_question()
+        self.stats.attach(self.screens)
+        self.screens.show_question()
+        self.stats.detach()
+        self.screens.show_question()
+        self.assertEqual(len(self.idle), 1)
+        self.assertFalse(self.stats.enabled)
+
+    def test_callbacks_bound_before_attach(self):
+        """Attaching mid-session also times callbacks bound earlier (Tk command=, scheduler)."""
+        command = self.screens.show_question  # as stored by a button built before F12
+        self.stats.attach(self.screens)
+        command()
+        self.run_idle()
+        self.assertEqual(self.stats.histograms["show_question"].count, 1)
+
+    def test_nested_screen_counted_once(self):
+        """show_question -> show_results in one chain is a single span."""
+        self.stats.attach(self.screens)
+        self.screens.show_question(last=True)
+        self.assertEqual(len(self.idle), 1)
+        self.run_idle()
+        self.assertNotIn("show_results", self.stats.histograms)
+        self.assertAlmostEqual(self.stats.histograms["show_question"].max_ms, 32.0)
+        self.screens.show_results()
+        self.run_idle()
+        self.assertEqual(self.stats.histograms["show_results"].count, 1)
+
+    def test_dump(self):
+        """The dump holds each timed screen's buckets and percentiles."""
+        self.stats.attach(self.screens)
+        self.screens.show_question()
+        self.idle[0]()
+        with tempfile.TemporaryDirectory() as tmp:
+            data = json.loads(self.stats.dump(Path(tmp) / "stats.json").read_text())
+        screen = data["screens"]["show_question"]
+        self.assertEqual(screen["count"], 1)
+        self.assertEqual(screen["p99_ms"], 12.0)
+        self.assertEqual(sum(screen["counts"]), 1)
+
+
+class TestGameRenderStats(unittest.TestCase):
+    """The game times its screens when HANGMAN_RENDER_STATS=1."""
+
+    def test_env_enables_timing(self):
+        """The start screen built in the constructor is already timed."""
+        with unittest.mock.patch.dict('os.environ', {"HANGMAN_RENDER_STATS": "1"}), \
+                unittest.mock.patch('tkinter.Tk'), unittest.mock.patch('pygame.mixer.init'):
+            game = HangmanMCQGame()
+        self.assertTrue(game.render_stats.enabled)
+        self.assertIn("show_start_screen", game.render_stats.histograms)
+
+    def test_off_by_default(self):
+        """Without the variable the screens are not wrapped."""
+        with unittest.mock.patch.dict('os.environ', {"HANGMAN_RENDER_STATS": ""}), \
+                unittest.mock.patch('tkinter.Tk'), unittest.mock.patch('pygame.mixer.init'):
+            game = HangmanMCQGame()
+        self.assertFalse(game.render_stats.enabled)
+        self.assertEqual(game.render_stats.histograms, {})
+
+    def test_f12_mid_session(self):
+        """F12 after the first screens times callbacks the game bound before it."""
+        with unittest.mock.patch('tkinter.Tk'), unittest.mock.patch('pygame.mixer.init'):
+            game = HangmanMCQGame()
+        idle = []
+        game.render_stats = RenderStats(idle.append)
+        command = game.show_language_selection  # bound by the welcome screen's button
+        with unittest.mock.patch('hangman_game.messagebox'):
+            game.show_render_stats()
+        with unittest.mock.patch('hangman_game.tk'):
+            command()
+        for callback in idle:
+            callback()
+        self.assertEqual(game.render_stats.histograms["show_language_selection"].count, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+"""
+test_sound_bank.py
+
+Tests for background, priority-ordered sound loading, the synthesized beep cache and
+the decoded-mp3 cache.
+"""
+
+import sys
+import tempfile
+import threading
+import unittest
+import wave
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sound_bank import FALLBACK_TONES, SOUND_FILES, PcmCache, SoundBank, ToneCache, synthesize_tones
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+
+class TestSoundBank(unittest.TestCase):
+    """Cues load on a thread in priority order, or on demand when asked for first."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.dir = Path(self.tmp.name)
+        for name in SOUND_FILES:
+            if name != "alert":
+                (self.dir / f"{name}.mp3").write_bytes(b"mp3")
+        self.loaded = []
+        self.tones = ToneCache(self.dir / "cache")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def load_file(self, path):
+        self.loaded.append(path.stem)
+        return f"sound:{path.name}"
+
+    def test_priority_order(self):
+        """start loads first and the long results cues last."""
+        bank = SoundBank(self.dir, load_file=self.load_file, tone_cache=self.tones, workers=1).start()
+        self.assertTrue(bank.wait(5.0))
+        self.assertEqual(self.loaded[0], "start")
+        self.assertEqual(self.loaded[-2:], ["celebration", "crying"])
+        self.assertEqual(bank.sounds["coin"], "sound:coin.mp3")
+        if NUMPY_AVAILABLE:  # no file: synthesized beep
+            self.assertEqual(bank.sounds["alert"], f"sound:{self.tones.path_for(FALLBACK_TONES['alert']).name}")
+
+    def test_loads_on_first_use(self):
+        """A cue asked for before the thread reaches it loads at once, and only once."""
+        gate = threading.Event()
+
+        def slow_load(path):
+            if path.stem == "start":
+                gate.wait(5.0)
+            return self.load_file(path)
+
+        bank = SoundBank(self.dir, load_file=slow_load, tone_cache=self.tones).start()
+        self.assertFalse(bank.is_ready("crying"))
+        self.assertEqual(bank.get("crying"), "sound:crying.mp3")  # not blocked by "start"
+        gate.set()
+        bank.wait(5.0)
+        self.assertEqual(self.loaded.count("crying"), 1)
+        self.assertIsNone(bank.get("unknown"))
+
+    def test_parallel_loading(self):
+        """Several cues are loaded at the same time by the worker pool."""
+        in_flight = []
+        all_started = threading.Barrier(3, timeout=5.0)
+
+        def load(path):
+            in_flight.append(path.stem)
+            if len(in_flight) <= 3:
+                all_started.wait()  # only passes once three loads run together
+            return path.stem
+
+        bank = SoundBank(self.dir, load_file=load, tone_cache=self.tones, workers=3).start()
+        self.assertTrue(bank.wait(5.0))
+        self.assertEqual(set(in_flight[:3]), {"start", "countdown", "wrong"})
+        self.assertEqual(bank.sounds["crying"], "crying")
+
+    def test_all_cues_present(self):
+        """Every cue has an entry before anything loads."""
+        bank = SoundBank(self.dir, load_file=self.load_file)
+        self.assertEqual(set(bank.sounds), set(SOUND_FILES))
+        self.assertTrue(all(sound is None for sound in bank.sounds.values()))
+
+
+
+@unittest.skipUnless(NUMPY_AVAILABLE, "numpy not available")
+class TestToneCache(unittest.TestCase):
+    """Beeps are synthesized together, with envelopes, and cached as WAV files."""
+
+    def test_batch_matches_single(self):
+        """Each tone comes out the same whether synthesized alone or in a batch."""
+        batch = synthesize_tones(FALLBACK_TONES, 22050)
+        single = synthesize_tones({"coin": FALLBACK_TONES["coin"]}, 22050)
+        self.assertEqual(len(batch["crying"]), 22050 * 800 // 1000)
+        self.assertTrue(np.array_equal(batch["coin"], single["coin"]))
+
+    def test_envelope_has_no_clicks(self):
+        """Tones start and end at silence and reach full amplitude in between."""
+        samples = synthesize_tones({"tick": (1200, 80)}, 22050)["tick"]
+        self.assertEqual(samples[0], 0)
+        self.assertLess(abs(int(samples[-1])), 500)
+        self.assertGreater(samples.max(), 16000)
+
+    def test_cached_by_parameters(self):
+        """A second launch reuses the files; other parameters get their own file."""
+        with tempfile.TemporaryDirectory() as tmp:
+            tones = {"coin": (1100, 120), "wrong": (350, 220)}
+            paths = ToneCache(tmp).ensure(tones)
+            with wave.open(str(paths["wrong"])) as f:
+                self.assertEqual((f.getnchannels(), f.getframerate(), f.getnframes()), (1, 22050, 4851))
+            again = ToneCache(tmp)
+            self.assertEqual(again.ensure(tones), paths)
+            self.assertEqual(again.synthesized, 0)
+            self.assertNotEqual(ToneCache(tmp, sample_rate=44100).path_for((1100, 120)), paths["coin"])
+
+
+
+class FakeSound:
+    def __init__(self, path, raw=b""):
+        self.path = path
+        self.raw = raw
+
+    def get_raw(self):
+        return self.raw
+
+
+class TestPcmCache(unittest.TestCase):
+    """Decoded mp3s are cached as WAVs keyed by content and mixer settings."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.dir = Path(self.tmp.name)
+        self.mp3 = self.dir / "coin.mp3"
+        self.mp3.write_bytes(b"fake mp3")
+        self.decoded = []
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def decode(self, path):
+        self.decoded.append(Path(path).suffix)
+        return FakeSound(path, raw=b"\x01\x00\x02\x00" * 100)
+
+    def test_transcodes_once(self):
+        """The first load decodes the mp3 and writes a WAV; the next one loads the WAV."""
+        settings = (44100, -16, 2)
+        cache = PcmCache(self.dir / "pcm", settings, decode=self.decode)
+        cache.load(self.mp3)
+        path = cache.path_for(self.mp3)
+        with wave.open(str(path)) as f:
+            self.assertEqual((f.getnchannels(), f.getframerate(), f.getnframes()), (2, 44100, 100))
+        sound = PcmCache(self.dir / "pcm", settings, decode=self.decode).load(self.mp3)
+        self.assertEqual(sound.path, path)
+        self.assertEqual(self.decoded, [".mp3", ".wav"])
+
+    def test_key_changes(self):
+        """Other mixer settings or a changed asset use a different cache file."""
+        cache = PcmCache(self.dir, (44100, -16, 2), decode=self.decode)
+        first = cache.path_for(self.mp3)
+        self.assertNotEqual(PcmCache(self.dir, (22050, -16, 2)).path_for(self.mp3), first)
+        self.mp3.write_bytes(b"edited mp3")
+        self.assertNotEqual(cache.path_for(self.mp3), first)
+
+    def test_uncacheable_formats(self):
+        """WAV sources and non 16-bit mixers are decoded directly."""
+        PcmCache(self.dir / "pcm", (44100, 32784, 2), decode=self.decode).load(self.mp3)
+        self.assertFalse((self.dir / "pcm").exists())
+
+
+if __name__ == "__main__":
+    unittest.main()
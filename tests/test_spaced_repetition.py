@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+test_spaced_repetition.py
+
+Tests for the per-player spaced-repetition scheduler.
+"""
+
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from question_bank import BUILTIN_QUESTION_BANK
+from spaced_repetition import DAY, RELEARN_SECONDS, PlayerReviews, ReviewScheduler
+
+
+class FakeClock:
+    def __init__(self, now=1_000_000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+def _question(n):
+    return {"question": f"Question {n}?", "options": ["a", "b", "c", "d"], "correct": 0}
+
+
+class TestPlayerReviews(unittest.TestCase):
+    """Intervals grow on first-try answers, reset on misses; due order follows the heap."""
+
+    def test_intervals(self):
+        """Correct answers push the due date out; a miss brings it back within minutes."""
+        reviews = PlayerReviews()
+        state = reviews.record("Python", "Easy", 0, _question(0), True, 0.0)
+        self.assertEqual(state.due, DAY)
+        state = reviews.record("Python", "Easy", 0, _question(0), True, DAY)
+        self.assertEqual(state.due, DAY + 3 * DAY)
+        state = reviews.record("Python", "Easy", 0, _question(0), False, 10 * DAY)
+        self.assertEqual(state.due, 10 * DAY + RELEARN_SECONDS)
+        self.assertEqual((state.reps, state.lapses), (0, 1))
+
+    def test_due_most_overdue_first(self):
+        """due() returns only due positions, most overdue first, and keeps them scheduled."""
+        reviews = PlayerReviews()
+        reviews.record("SQL", "Easy", 3, _question(3), False, 100.0)
+        reviews.record("SQL", "Easy", 1, _question(1), False, 0.0)
+        reviews.record("SQL", "Easy", 2, _question(2), True, 0.0)
+        now = 100.0 + RELEARN_SECONDS
+        self.assertEqual(reviews.due("SQL", "Easy", 10, now), [1, 3])
+        self.assertEqual(reviews.due("SQL", "Easy", 1, now), [1])
+        # Reviewing again supersedes the old heap entry
+        reviews.record("SQL", "Easy", 1, _question(1), True, now)
+        self.assertEqual(reviews.due("SQL", "Easy", 10, now), [3])
+
+    def test_edited_question_restarts(self):
+        """A different question at the same position starts from a fresh state."""
+        reviews = PlayerReviews()
+        reviews.record("SQL", "Easy", 0, _question(0), True, 0.0)
+        reviews.record("SQL", "Easy", 0, _question(0), True, DAY)
+        state = reviews.record("SQL", "Easy", 0, _question(99), True, 5 * DAY)
+        self.assertEqual(state.reps, 1)
+
+    def test_heap_compacts(self):
+        """Superseded heap entries are rebuilt away instead of piling up."""
+        reviews = PlayerReviews()
+        for day in range(200):
+            reviews.record("SQL", "Easy", day % 3, _question(day % 3), day % 2 == 0, day * DAY)
+        self.assertLessEqual(len(reviews.heaps[("SQL", "Easy")]), 2 * 3 + 16)
+        self.assertEqual(sorted(reviews.due("SQL", "Easy", 10, 1000 * DAY)), [0, 1, 2])
+
+    def test_round_trip(self):
+        """Binary encoding preserves every state and rebuilds the heaps."""
+        reviews = PlayerReviews()
+        for i in range(2000):
+            reviews.record("Python", "Extreme", i, _question(i), i % 3 != 0, float(i))
+        reviews.record("Power BI", "Easy", 0, _question(0), False, 5.0)
+        data = reviews.to_bytes()
+        self.assertGreater(len(data), 2000 * 28)
+        loaded = PlayerReviews.from_bytes(data)
+        for key, group in reviews.states.items():
+            for i, state in group.items():
+                other = loaded.states[key][i]
+                self.assertEqual((other.crc, other.due, other.reps, other.lapses),
+                                 (state.crc, state.due, state.reps, state.lapses))
+        now = 3000.0 + RELEARN_SECONDS
+        self.assertEqual(loaded.due("Python", "Extreme", 20, now), reviews.due("Python", "Extreme", 20, now))
+
+    def test_rejects_bad_file(self):
+        """Non-progress data raises ValueError."""
+        with self.assertRaises(ValueError):
+            PlayerReviews.from_bytes(b"NOPE" + b"\0" * 10)
+
+
+class TestReviewScheduler(unittest.TestCase):
+    """Progress is keyed by nickname and persisted between runs."""
+
+    def test_save_and_reload(self):
+        """A new scheduler sees the due questions a previous one saved."""
+        clock = FakeClock()
+        q = BUILTIN_QUESTION_BANK["Python"]["Easy"][4]
+        with tempfile.TemporaryDirectory() as tmp:
+            scheduler = ReviewScheduler(tmp, clock=clock)
+            scheduler.record("Alice", "Python", "Easy", 4, q, False)
+            scheduler.record("Bob", "Python", "Easy", 7, q, False)
+            scheduler.save("Alice")
+            scheduler.save("Bob")
+            self.assertEqual(len(list(Path(tmp).iterdir())), 2)
+
+            clock.now += RELEARN_SECONDS
+            reloaded = ReviewScheduler(tmp, clock=clock)
+            self.assertEqual(reloaded.due("Alice", "Python", "Easy", 15), [4])
+            self.assertEqual(reloaded.due("Bob", "Python", "Easy", 15), [7])
+            self.assertEqual(reloaded.due("Carol", "Python", "Easy", 15), [])
+
+    def test_bank_edited_between_sessions(self):
+        """Reviews of questions edited or moved since the last session are dropped, not served."""
+        clock = FakeClock()
+        pool = [_question(i) for i in range(5)]
+        with tempfile.TemporaryDirectory() as tmp:
+            scheduler = ReviewScheduler(tmp, clock=clock)
+            for i in range(5):
+                scheduler.record("Alice", "SQL", "Easy", i, pool[i], False)
+            scheduler.save("Alice")
+
+            # Question 1 reworded, questions 3 and 4 swapped, one question removed at the end
+            edited = [pool[0], {**pool[1], "question": "Reworded?"}, pool[2], pool[4]]
+            clock.now += RELEARN_SECONDS
+            reloaded = ReviewScheduler(tmp, clock=clock)
+            self.assertEqual(reloaded.due("Alice", "SQL", "Easy", 15, edited), [0, 2])
+            self.assertEqual(sorted(reloaded.player("Alice").states[("SQL", "Easy")]), [0, 2])
+            reloaded.save("Alice")
+            again = ReviewScheduler(tmp, clock=clock)
+            self.assertEqual(again.due("Alice", "SQL", "Easy", 15), [0, 2])
+
+
+if __name__ == "__main__":
+    unittest.main()
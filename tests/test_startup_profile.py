@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""
+test_startup_profile.py
+
+Tests for per-phase startup timing (--profile-startup).
+"""
+
+import json
+import sys
+import tempfile
+import unittest
+import unittest.mock
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from hangman_game import HangmanMCQGame, profile_startup
+from startup_profile import NO_PROFILE, ImportTimer, StartupProfile, compare_table
+
+
+class FakeClock:
+    """Nanosecond clock advancing 5 ms per reading."""
+
+    def __init__(self):
+        self.now = 0
+
+    def __call__(self):
+        self.now += 5_000_000
+        return self.now
+
+
+class TestStartupProfile(unittest.TestCase):
+    """Phases are recorded in order, reported as a table and saved as JSON."""
+
+    def test_phases_and_table(self):
+        """Each phase records its own duration; the table lists them with a total."""
+        profile = StartupProfile("v1", clock=FakeClock())
+        with profile.phase("tk.Tk"):
+            pass
+        profile.add("load_sounds", 0.010)
+        self.assertEqual(profile.phases, [("tk.Tk", 0.005), ("load_sounds", 0.010)])
+        table = profile.table()
+        self.assertIn("tk.Tk", table)
+        self.assertIn("33.3%", table)
+        self.assertTrue(table.splitlines()[-1].startswith("total"))
+
+    def test_json_round_trip_and_compare(self):
+        """A saved profile loads back with its machine details; compare shows the change."""
+        before = StartupProfile("v1")
+        before.add("tk.Tk", 0.040)
+        after = StartupProfile("v2")
+        after.add("tk.Tk", 0.030)
+        after.add("load_sounds", 0.002)
+        with tempfile.TemporaryDirectory() as tmp:
+            path = before.save(Path(tmp) / "profiles" / "v1.json")
+            data = json.loads(path.read_text())
+            loaded, _ = StartupProfile.load(path)
+        self.assertEqual(data["label"], "v1")
+        self.assertIn("python", data["machine"])
+        self.assertEqual(loaded.phases, [("tk.Tk", 0.040)])
+        lines = compare_table(loaded, after).splitlines()
+        self.assertIn("-10.0", lines[1])
+        self.assertTrue(lines[2].startswith("load_sounds"))
+
+    def test_imports_listed_with_phase(self):
+        """Imports made inside a phase are listed under the table and kept in the JSON."""
+        profile = StartupProfile("v1")
+        with profile.phase("import pygame"):
+            profile.add_import("numpy", 0.030)
+        lines = profile.table().splitlines()
+        self.assertTrue(lines[-1].startswith("numpy"))
+        self.assertTrue(lines[-1].endswith("import pygame"))
+        with tempfile.TemporaryDirectory() as tmp:
+            loaded, data = StartupProfile.load(profile.save(Path(tmp) / "v1.json"))
+        self.assertEqual(data["imports"], [{"name": "numpy", "ms": 30.0, "phase": "import pygame"}])
+        self.assertEqual(loaded.imports, [("numpy", 0.030, "import pygame")])
+
+    def test_no_profile_is_inert(self):
+        """Without profiling, phase() is an empty context."""
+        with NO_PROFILE.phase("anything"):
+            pass
+        NO_PROFILE.add("anything", 1.0)
+
+
+class TestImportTimer(unittest.TestCase):
+    """Top-level imports are timed one by one, nested ones excluded from their importer."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        root = Path(self.tmp.name)
+        (root / "_profiled_outer.py").write_text("import json\nimport _profiled_inner\n")
+        (root / "_profiled_inner.py").write_text("VALUE = 1\n")
+        sys.path.insert(0, str(root))
+
+    def tearDown(self):
+        sys.path.remove(self.tmp.name)
+        for name in ("_profiled_outer", "_profiled_inner"):
+            sys.modules.pop(name, None)
+        self.tmp.cleanup()
+
+    def test_exclusive_times(self):
+        """The outer module's time excludes the inner one's; stdlib and repeat imports are not listed."""
+        timer = ImportTimer(clock=FakeClock()).install()
+        try:
+            import _profiled_outer  # noqa: F401
+            import _profiled_inner  # noqa: F401
+        finally:
+            timer.uninstall()
+        self.assertEqual(timer.entries, [("_profiled_inner", 0.005), ("_profiled_outer", 0.010)])
+
+    def test_profile_takes_later_imports(self):
+        """Once attached to a profile, imports are recorded with the phase they happened in."""
+        profile = StartupProfile("v1")
+        timer = ImportTimer(clock=FakeClock()).install()
+        timer.profile = profile
+        try:
+            with profile.phase("show_start_screen"):
+                import _profiled_inner  # noqa: F401
+        finally:
+            timer.uninstall()
+        self.assertEqual(profile.imports, [("_profiled_inner", 0.005, "show_start_screen")])
+
+
+class TestGameStartupPhases(unittest.TestCase):
+    """The game reports every startup phase when profiled."""
+
+    def test_profiled_phases(self):
+        """profile_startup times the constructor's phases and the first frame."""
+        with tempfile.TemporaryDirectory() as tmp, unittest.mock.patch('tkinter.Tk'), \
+                unittest.mock.patch('pygame.mixer.init'), unittest.mock.patch('builtins.print'):
+            game = profile_startup("test", Path(tmp) / "profile.json")
+            data = json.loads((Path(tmp) / "profile.json").read_text())
+        self.assertIsInstance(game, HangmanMCQGame)
+        names = [phase["name"] for phase in data["phases"]]
+        self.assertEqual(names, ["import hangman_game", "import pygame", "pygame.mixer.init", "tk.Tk",
+                                 "load_questions", "load_sounds", "show_start_screen", "other __init__ work",
+                                 "first frame (root.update)"])
+
+    def test_game_imports_split_per_module(self):
+        """With the import timer on, the game's own imports are phases of their own."""
+        timer = ImportTimer()
+        timer.entries = [("quiz_engine", 0.001), ("sound_bank", 0.002)]
+        with tempfile.TemporaryDirectory() as tmp, unittest.mock.patch('tkinter.Tk'), \
+                unittest.mock.patch('pygame.mixer.init'), unittest.mock.patch('builtins.print'), \
+                unittest.mock.patch('hangman_game._IMPORT_TIMER', timer):
+            profile_startup("test", Path(tmp) / "profile.json")
+            data = json.loads((Path(tmp) / "profile.json").read_text())
+        names = [phase["name"] for phase in data["phases"]]
+        self.assertEqual(names[:4], ["import quiz_engine", "import sound_bank", "import hangman_game", "import pygame"])
+        self.assertIsInstance(timer.profile, StartupProfile)
+
+
+if __name__ == "__main__":
+    unittest.main()
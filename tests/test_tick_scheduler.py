@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+"""
+test_tick_scheduler.py
+
+Tests for the central tick scheduler and virtual-clock session simulation.
+"""
+
+import sys
+import tempfile
+import time
+import unittest
+import unittest.mock
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from hangman_game import HangmanMCQGame
+from spaced_repetition import ReviewScheduler
+from tick_scheduler import TickScheduler, VirtualClock
+
+
+class FakeRoot:
+    """Stands in for Tk: records after() requests instead of running them."""
+
+    def __init__(self):
+        self.pending = {}
+        self.cancelled = []
+        self._next = 0
+
+    def after(self, delay_ms, callback):
+        self._next += 1
+        self.pending[self._next] = (delay_ms, callback)
+        return self._next
+
+    def after_cancel(self, after_id):
+        self.cancelled.append(after_id)
+        self.pending.pop(after_id, None)
+
+
+class TestTickScheduler(unittest.TestCase):
+    """Ordering, coalescing and grouped cancellation."""
+
+    def setUp(self):
+        self.clock = VirtualClock()
+        self.scheduler = TickScheduler(clock=self.clock)
+        self.calls = []
+
+    def record(self, name):
+        return lambda: self.calls.append((name, self.clock()))
+
+    def test_runs_in_due_order(self):
+        """Callbacks run at their due times, earliest first."""
+        self.scheduler.after(300, self.record("c"))
+        self.scheduler.after(100, self.record("a"))
+        self.scheduler.after(200, self.record("b"))
+        self.scheduler.advance(0.25)
+        self.assertEqual([name for name, _ in self.calls], ["a", "b"])
+        self.scheduler.run_until_idle()
+        self.assertEqual(self.calls, [("a", 0.1), ("b", 0.2), ("c", 0.3)])
+
+    def test_coalesces_same_time(self):
+        """Callbacks due within the coalescing window share a single wakeup."""
+        self.scheduler.after(1000, self.record("tick"))
+        self.scheduler.after(1002, self.record("pulse"))
+        self.scheduler.after(1500, self.record("later"))
+        self.scheduler.run_until_idle()
+        self.assertEqual(len(self.calls), 3)
+        self.assertEqual(self.scheduler.wakeups, 2)
+
+    def test_never_runs_early(self):
+        """Coalescing delays the earlier callback; the later one never runs before it is due."""
+        self.scheduler.after(3998, self.record("feedback-clear"))
+        self.scheduler.after(4001, self.record("tick"))
+        self.scheduler.advance(3.999)
+        self.assertEqual(self.calls, [])
+        self.scheduler.run_until_idle()
+        self.assertEqual(self.calls, [("feedback-clear", 4.001), ("tick", 4.001)])
+        self.assertEqual(self.scheduler.wakeups, 1)
+
+    def test_cancel_group(self):
+        """A whole screen's callbacks are cancelled at once; other groups survive."""
+        for delay in (100, 200, 300):
+            self.scheduler.after(delay, self.record("screen"))
+        self.scheduler.after(150, self.record("video"), group="video")
+        single = self.scheduler.after(250, self.record("video2"), group="video")
+        self.scheduler.cancel(single)
+        self.scheduler.cancel_group("screen")
+        self.assertEqual(self.scheduler.pending("screen"), 0)
+        self.scheduler.run_until_idle()
+        self.assertEqual([name for name, _ in self.calls], ["video"])
+
+    def test_zero_delay_reschedule_waits(self):
+        """A callback rescheduling itself with no delay runs once per wakeup."""
+        def again():
+            self.calls.append(self.clock())
+            if len(self.calls) < 3:
+                self.scheduler.after(0, again)
+        self.scheduler.after(0, again)
+        self.assertEqual(self.scheduler.run_due(), 1)
+        self.assertEqual(self.scheduler.run_due(), 1)
+
+    def test_single_tk_wakeup(self):
+        """With a Tk root only one after() is pending, re-armed for earlier callbacks."""
+        root = FakeRoot()
+        clock = VirtualClock()
+        scheduler = TickScheduler(root, clock=clock)
+        scheduler.after(1000, lambda: None)
+        scheduler.after(1200, lambda: None)
+        self.assertEqual([d for d, _ in root.pending.values()], [1000])
+        scheduler.after(500, lambda: None)
+        self.assertEqual([d for d, _ in root.pending.values()], [500])
+        clock.advance(0.5)
+        (_, wakeup), = root.pending.values()
+        root.pending.clear()
+        wakeup()
+        self.assertEqual(scheduler.callbacks_run, 1)
+        self.assertEqual([d for d, _ in root.pending.values()], [500])
+        scheduler.after(503, lambda: None)  # due 3 ms after the next one: the wakeup waits for it
+        self.assertEqual([d for d, _ in root.pending.values()], [503])
+
+    def test_cancel_rearms_wakeup(self):
+        """Cancelling the callback the wakeup was armed for moves it to the next one, or drops it."""
+        root = FakeRoot()
+        scheduler = TickScheduler(root, clock=VirtualClock())
+        first = scheduler.after(100, lambda: None)
+        scheduler.after(102, lambda: None, group="pulse")
+        scheduler.after(900, lambda: None)
+        self.assertEqual([d for d, _ in root.pending.values()], [102])
+        scheduler.cancel_group("pulse")
+        self.assertEqual([d for d, _ in root.pending.values()], [100])
+        scheduler.cancel(first)
+        self.assertEqual([d for d, _ in root.pending.values()], [900])
+        scheduler.cancel_group("screen")
+        self.assertEqual(root.pending, {})
+        self.assertEqual(scheduler.pending(), 0)
+
+    def test_wake_time_skips_cancelled(self):
+        """wake_time only looks at live callbacks inside the window and leaves them queued."""
+        for delay in (10, 11, 13, 15, 500):
+            self.scheduler.after(delay, lambda: None)
+        late = self.scheduler.after(14, lambda: None)
+        self.scheduler.cancel(late)
+        self.assertAlmostEqual(self.scheduler.wake_time(), 0.013)
+        self.assertEqual(self.scheduler.pending(), 5)
+        self.scheduler.advance(0.013)
+        self.assertEqual(self.scheduler.callbacks_run, 3)
+
+
+class TestSessionSimulation(unittest.TestCase):
+    """A full 15-question timed session runs on virtual time in well under a second."""
+
+    def test_all_timeouts_session(self):
+        """Every question runs its full 15 virtual seconds and times out."""
+        with unittest.mock.patch('tkinter.Tk'), unittest.mock.patch('pygame.mixer.init'):
+            game = HangmanMCQGame()
+        clock = VirtualClock(1000.0)
+        game.scheduler = TickScheduler(clock=clock)
+        game.engine.clock = clock
+        game.play_sound = lambda name: None
+        with tempfile.TemporaryDirectory() as tmp, \
+                unittest.mock.patch('hangman_game.tk'), \
+                unittest.mock.patch('hangman_game.make_figure'):
+            game.review_scheduler = ReviewScheduler(tmp, clock=clock)
+            game.question_bank = {"Sim": {"Easy": [
+                {"question": f"Q{i}?", "options": ["a", "b", "c", "d"], "correct": i % 4} for i in range(15)]}}
+            game.nickname = "Sim"
+            game.selected_language = "Sim"
+            started = time.perf_counter()
+            game.select_level("Easy")
+            elapsed = game.scheduler.run_until_idle()
+            real = time.perf_counter() - started
+
+        summary = game.engine.summary()
+        self.assertEqual(summary["total"], 15)
+        self.assertEqual(summary["timeouts"], 15)
+        self.assertTrue(summary["lost"])
+        self.assertGreaterEqual(elapsed, 15 * 15)
+        self.assertLess(elapsed, 15 * 19 + 5)
+        self.assertLess(real, 5.0)
+        self.assertEqual(game.scheduler.pending(), 0)
+
+    def test_wrong_click_does_not_repeat_countdown(self):
+        """A feedback-clear due just before a second boundary does not pull the tick early."""
+        with unittest.mock.patch('tkinter.Tk'), unittest.mock.patch('pygame.mixer.init'):
+            game = HangmanMCQGame()
+        clock = VirtualClock(1000.0)
+        game.scheduler = TickScheduler(clock=clock)
+        game.engine.clock = clock
+        sounds = []
+        game.play_sound = sounds.append
+        with tempfile.TemporaryDirectory() as tmp, \
+                unittest.mock.patch('hangman_game.tk'), \
+                unittest.mock.patch('hangman_game.make_figure'):
+            game.review_scheduler = ReviewScheduler(tmp, clock=clock)
+            game.question_bank = {"Sim": {"Easy": [{"question": "Q?", "options": ["a", "b", "c", "d"], "correct": 0}]}}
+            game.nickname = "Sim"
+            game.selected_language = "Sim"
+            game.select_level("Easy")
+            game.scheduler.advance(0.8)
+            start = game.engine.deadline - game.engine.time_per_question
+            # The 1200 ms feedback clear lands 2 ms before the 11 s boundary (4 seconds left)
+            game.scheduler.advance(start + 9.798 - clock())
+            game.selected_option = unittest.mock.Mock(get=lambda: 1)
+            game.answer_question()
+            game.scheduler.advance(start + 15.5 - clock())
+        self.assertEqual(sounds.count('countdown'), 5)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,200 @@
+# tick_scheduler.py
+"""
+One owner for every timed callback in the game.
+
+TickScheduler replaces scattered root.after calls. Callbacks are kept in a min-heap
+by due time. Only one Tk wakeup is ever pending. It is armed for the earliest callback,
+or a little later if other callbacks are due within a small coalescing window after it,
+and then runs every callback that is due. So a timer tick, a pulse and a sound due at
+the same moment cost one wakeup instead of three, and coalescing only ever delays a
+callback (by at most the window): nothing runs before its due time. That matters for
+the countdown, whose tick is scheduled just after a second boundary.
+
+Each callback belongs to a group ("screen" by default). cancel_group() drops a whole
+screen's pending callbacks at once; clear_screen uses it so nothing scheduled for an
+old screen fires on the next one. The question screen outlives its questions, so
+callbacks tied to one question (feedback clear, timer pulse) use the "question" group,
+dropped whenever the next question is shown.
+
+The clock is injectable. Without a Tk root and with a VirtualClock, advance() and
+run_until_idle() jump straight from one due time to the next. A whole 15-question
+timed session then runs in milliseconds (see tests/test_tick_scheduler.py).
+"""
+
+import heapq
+import math
+import sys
+import time
+
+SCREEN = "screen"
+QUESTION = "question"
+VIDEO = "video"
+
+
+class VirtualClock:
+    """Manually advanced clock for simulations and tests (seconds)."""
+
+    def __init__(self, start=0.0):
+        self.now = start
+
+    def __call__(self):
+        return self.now
+
+    def advance(self, seconds):
+        self.now += seconds
+
+
+class TickScheduler:
+    """Heap of timed callbacks behind a single Tk wakeup, with grouped cancellation."""
+
+    COALESCE = 0.004  # seconds: callbacks due this soon after the earliest share its wakeup
+
+    def __init__(self, root=None, clock=time.monotonic, coalesce=COALESCE):
+        self.root = root
+        self.clock = clock
+        self.coalesce = coalesce
+        self._heap = []      # (due, id), may hold cancelled ids
+        self._entries = {}   # id -> (callback, group)
+        self._groups = {}    # group -> set of ids
+        self._last_id = 0
+        self._wakeup_id = None
+        self._wakeup_due = None
+        self.wakeups = 0
+        self.callbacks_run = 0
+
+    def after(self, delay_ms, callback, group=SCREEN):
+        """Run `callback` after `delay_ms` milliseconds; returns an id for cancel()."""
+        self._last_id += 1
+        callback_id = self._last_id
+        heapq.heappush(self._heap, (self.clock() + delay_ms / 1000.0, callback_id))
+        self._entries[callback_id] = (callback, group)
+        self._groups.setdefault(group, set()).add(callback_id)
+        self._arm()
+        return callback_id
+
+    def cancel(self, callback_id):
+        entry = self._entries.pop(callback_id, None)
+        if entry is not None:
+            self._groups.get(entry[1], set()).discard(callback_id)
+            self._rearm()
+
+    def cancel_group(self, group):
+        """Drop every pending callback of `group`."""
+        ids = self._groups.pop(group, ())
+        for callback_id in ids:
+            self._entries.pop(callback_id, None)
+        if ids:
+            self._rearm()
+
+    def pending(self, group=None):
+        if group is None:
+            return len(self._entries)
+        return len(self._groups.get(group, ()))
+
+    def next_due(self):
+        """Due time of the earliest live callback (None when idle)."""
+        heap = self._heap
+        while heap and heap[0][1] not in self._entries:
+            heapq.heappop(heap)  # cancelled
+        return heap[0][0] if heap else None
+
+    def wake_time(self):
+        """When to wake up next: the latest due time within the coalescing window after
+        the earliest one, so one wakeup runs them all (None when idle)."""
+        first = self.next_due()
+        if first is None:
+            return None
+        # Pop just the window (in due order, dropping cancelled entries) and push the live ones back
+        heap, entries = self._heap, self._entries
+        limit = first + self.coalesce
+        window = []
+        while heap and heap[0][0] <= limit:
+            item = heapq.heappop(heap)
+            if item[1] in entries:
+                window.append(item)
+        for item in window:
+            heapq.heappush(heap, item)
+        return window[-1][0]
+
+    def run_due(self):
+        """Run every callback that is due now; returns how many ran.
+
+        Callbacks scheduled while this runs wait for the next wakeup, so a callback that
+        reschedules itself with no delay cannot starve Tk.
+        """
+        limit = self.clock()
+        last_id = self._last_id
+        deferred = []
+        ran = 0
+        while self._heap and self._heap[0][0] <= limit:
+            due, callback_id = heapq.heappop(self._heap)
+            if callback_id > last_id:
+                deferred.append((due, callback_id))
+                continue
+            entry = self._entries.pop(callback_id, None)
+            if entry is None:
+                continue
+            callback, group = entry
+            self._groups.get(group, set()).discard(callback_id)
+            ran += 1
+            try:
+                callback()
+            except Exception:
+                if self.root is None:
+                    raise
+                self.root.report_callback_exception(*sys.exc_info())
+        for item in deferred:
+            heapq.heappush(self._heap, item)
+        self.callbacks_run += ran
+        return ran
+
+    # Tk wakeups ----------------------------------------------------------
+    def _arm(self):
+        """Keep exactly one Tk wakeup pending, at wake_time()."""
+        if self.root is None:
+            return
+        due = self.wake_time()
+        if self._wakeup_id is not None:
+            if self._wakeup_due == due:
+                return
+            self.root.after_cancel(self._wakeup_id)
+            self._wakeup_id = None
+        if due is None:
+            return
+        self._wakeup_due = due
+        # Rounded up to whole ms, so the wakeup does not come before the callbacks are due
+        delay = max(0, math.ceil((due - self.clock()) * 1000 - 1e-6))
+        self._wakeup_id = self.root.after(delay, self._wakeup)
+
+    def _rearm(self):
+        """After a cancel: move (or drop) the pending wakeup if it was armed for what went."""
+        if self._wakeup_id is not None:
+            self._arm()
+
+    def _wakeup(self):
+        self._wakeup_id = None
+        self.wakeups += 1
+        self.run_due()
+        self._arm()
+
+    # Virtual time ----------------------------------------------------------
+    def advance(self, seconds):
+        """Virtual clock only: move time forward, running callbacks as their time comes."""
+        target = self.clock() + seconds
+        while True:
+            due = self.wake_time()
+            if due is None or due > target:
+                break
+            self.clock.now = max(self.clock.now, due)
+            self.wakeups += 1
+            self.run_due()
+        self.clock.now = max(self.clock.now, target)
+
+    def run_until_idle(self, limit=24 * 3600.0):
+        """Virtual clock only: run until nothing is pending (or `limit` seconds pass)."""
+        start = self.clock()
+        while True:
+            due = self.wake_time()
+            if due is None or due - start > limit:
+                return self.clock() - start
+            self.advance(max(0.0, due - self.clock()))